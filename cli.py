@@ -7,13 +7,22 @@ import argparse
 import sys
 import logging
 from pathlib import Path
+from typing import Dict, List, Optional
 
 # Modülleri import et
+from config import get_config
 from scraper.scraper import Scraper
+from scraper.coordinator import ScrapeCoordinator
+from scraper.scheduler import SourceScheduler
+from scraper.sources.wikipedia import partition_title_space
 from scraper.cleaner import TextCleaner
+from scraper.pii import PIIScrubber
+from algorithms.turkish import fold_records
 from processor.classify import TextClassifier
 from processor.deduplicate import Deduplicator
-from processor.normalize import TextNormalizer
+from processor.pipeline import build_pipeline
+from processor.lexicon import Lexicon, LexiconCorrector, read_tsv
+from processor.hashed_model import HashedNBModel
 from exporter.export_jsonl import JSONLExporter
 from exporter.export_csv import CSVExporter
 
@@ -23,28 +32,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def create_scrubber(config) -> Optional[PIIScrubber]:
+    """processing.pii bölümünden kişisel veri temizleyici (kapalıysa None)"""
+    if not config.get("processing.pii.enabled", True):
+        return None
+    return PIIScrubber.from_config(config.get("processing.pii", {}))
+
+
+def scrub_records(data: List[Dict], scrubber: PIIScrubber) -> None:
+    """
+    Kayıtlardaki kişisel verileri temizle (kayıt başına sayılar "pii" alanına yazılır)
+
+    Daha önce temizlenmiş kayıtların sayıları korunur; yer tutucular tekrar eşleşmez.
+
+    Args:
+        data: Kayıtlar (yerinde güncellenir; silme kayıtları atlanır)
+        scrubber: Kişisel veri temizleyici
+    """
+    for record in data:
+        if record.get("deleted"):
+            continue
+        previous = record.get("pii") or {}
+        scrubber.scrub_record(record)
+        for entity, count in previous.items():
+            record["pii"][entity] = record["pii"].get(entity, 0) + count
+
+
 def scrape_command(args):
     """Veri toplama komutu"""
     logger.info(f"Kaynak: {args.source}, Limit: {args.limit}")
 
     scraper = Scraper()
     cleaner = TextCleaner()
-
-    # Veri çek
-    articles = scraper.scrape_source(args.source, limit=args.limit)
-
-    if not articles:
-        logger.error("Veri çekilemedi!")
-        return
-
-    # Temizle
-    logger.info("Metinler temizleniyor...")
-    for article in articles:
+    scrubber = create_scrubber(get_config())
+
+    # Veri çek ve kayıtlar geldikçe temizle; kişisel veriler ham metinde aranır
+    # (destructive_clean "@" ve "+" işaretlerini siler)
+    articles = []
+    for article in scraper.stream_source(args.source, limit=args.limit):
+        if scrubber is not None:
+            scrub_records([article], scrubber)
         if "text" in article:
             article["text"] = cleaner.destructive_clean(article["text"])
             article["cleaned"] = True
         else:
             article["cleaned"] = False
+        articles.append(article)
+
+    if not articles:
+        logger.error("Veri çekilemedi!")
+        return
 
     # Kaydet
     output_dir = Path("data/raw")
@@ -62,6 +99,166 @@ def scrape_command(args):
     print(f"  Dosya: {output_file}")
 
 
+def crawl_command(args):
+    """Dağıtık veri toplama komutu (aynı dizini kullanan tüm worker'lar kuyruğu paylaşır)"""
+    coordinator = ScrapeCoordinator(args.dir or f"data/crawl/{args.source}", args.source)
+
+    if args.partitions:
+        coordinator.plan_ranges(partition_title_space(args.partitions))
+    elif args.total:
+        coordinator.plan(args.total, unit_size=args.unit_size)
+
+    if args.processes > 0:
+        coordinator.run_local(processes=args.processes, lease_seconds=args.lease)
+
+    status = coordinator.status()
+    print(f"\n✓ Kuyruk durumu: {status}")
+
+    if status["pending"] == 0 and status["leased"] == 0 and status["done"]:
+        output_file = Path("data/raw") / f"{args.source}_crawl.jsonl"
+        written = coordinator.merge(output_file)
+        print(f"  Birleştirilen kayıt: {written}")
+        print(f"  Dosya: {output_file}")
+
+
+def collect_command(args):
+    """Verime göre zamanlanmış çok kaynaklı veri toplama komutu"""
+    scheduler = SourceScheduler(
+        source_names=args.sources, round_size=args.round_size, concurrency=args.concurrency
+    )
+    cleaner = TextCleaner()
+
+    articles = []
+    for article in scheduler.stream(args.total):
+        if "text" in article:
+            article["text"] = cleaner.destructive_clean(article["text"])
+        articles.append(article)
+
+    if not articles:
+        logger.error("Veri çekilemedi!")
+        return
+
+    import json
+
+    output_dir = Path("data/raw")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"collect_{args.total}.json"
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(articles, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{scheduler.format_report()}")
+    print(f"\n✓ {len(articles)} kayıt kaydedildi: {output_file}")
+
+
+def classify_records(
+    data: List[Dict],
+    folded: List[str],
+    config,
+    model: Optional[str] = None,
+    endpoint: Optional[str] = None,
+) -> None:
+    """
+    Metin içeren kayıtların "category" alanını doldur (process ve refresh ortak adımı)
+
+    Args:
+        data: Kayıtlar (yerinde güncellenir; silme kayıtları atlanır)
+        folded: fold_records(data) sonucu
+        config: Uygulama konfigürasyonu
+        model: Model adı (varsayılan: processing.classification.model)
+        endpoint: AI modelleri için API adresi (varsayılan: processing.classification.ai)
+    """
+    logger.info("Metinler sınıflandırılıyor...")
+    ai_config = dict(config.get("processing.classification.ai", {}) or {})
+    if endpoint:
+        ai_config["endpoint"] = endpoint
+    classifier = TextClassifier(
+        model=model or config.get("processing.classification.model", "rule-based"),
+        model_path=config.get("processing.classification.model_path"),
+        ai_config=ai_config,
+    )
+    indices = [i for i, r in enumerate(data) if "text" in r and not r.get("deleted")]
+    results = classifier.classify_many(
+        [data[i]["text"] for i in indices], [folded[i] for i in indices]
+    )
+    for i, result in zip(indices, results):
+        data[i]["category"] = result["category"]
+    if classifier.ai_client is not None:
+        logger.info(f"AI sınıflandırma: {classifier.ai_client.report()}")
+
+
+def finalize_records(data: List[Dict], config) -> None:
+    """
+    Yayından önceki son adımlar: kişisel veri temizliği, normalizasyon, yazım düzeltme
+
+    Kişisel veriler metin değiştirilmeden önce temizlenir; normalizasyon sonrası
+    ("ali@ornek. com") desenler artık eşleşmez.
+
+    Args:
+        data: Kayıtlar (yerinde güncellenir; silme kayıtları atlanır)
+        config: Uygulama konfigürasyonu
+    """
+    scrubber = create_scrubber(config)
+    if scrubber is not None:
+        logger.info("Kişisel veriler temizleniyor...")
+        scrub_records(data, scrubber)
+        logger.info(f"Temizlenen kişisel veriler: {scrubber.stats}")
+
+    # Normalize (processing.normalization.steps ile derlenen işleme hattı)
+    if config.get("processing.normalization.enabled", True):
+        logger.info("Metinler normalize ediliyor...")
+        pipeline = build_pipeline()
+        records = [r for r in data if "text" in r and not r.get("deleted")]
+        texts = pipeline.run_batch([record["text"] for record in records], profile=True)
+        for record, text in zip(records, texts):
+            record["text"] = text
+        logger.info(f"Normalizasyon adım süreleri:\n{pipeline.format_report()}")
+
+        # Sözlük tabanlı yazım düzeltme (processing.normalization.lexicon)
+        corrector = LexiconCorrector.from_config(config.get("processing.normalization.lexicon", {}))
+        if corrector is not None:
+            texts = corrector.correct_batch([record["text"] for record in records])
+            for record, text in zip(records, texts):
+                record["text"] = text
+            logger.info(
+                f"Yazım düzeltme: {corrector.stats['corrections']}/{corrector.stats['tokens']} "
+                f"kelime düzeltildi ({len(corrector.lexicon)} kayıtlı sözlük)"
+            )
+
+
+def refresh_command(args):
+    """Artımlı güncelleme komutu (son değişiklikleri mevcut veri setine uygular)"""
+    scraper = Scraper()
+    cleaner = TextCleaner()
+
+    instance = scraper.create_scraper(args.source, {"api": {"fetch_mode": "refresh"}})
+    if instance is None:
+        logger.error(f"Kaynak oluşturulamadı: {args.source}")
+        return
+
+    config = get_config()
+    scrubber = create_scrubber(config)
+    records = []
+    for record in instance.iter_scrape(0):
+        if scrubber is not None:
+            scrub_records([record], scrubber)
+        if not record.get("deleted") and "text" in record:
+            record["text"] = cleaner.destructive_clean(record["text"])
+            record["cleaned"] = True
+        records.append(record)
+
+    # Güncel kayıtlar yayından önce process komutuyla aynı adımlardan geçer
+    classify_records(records, fold_records(records), config, args.model)
+    finalize_records(records, config)
+
+    dataset = Path(args.dataset)
+    stats = JSONLExporter(str(dataset.parent)).upsert(records, dataset.name)
+
+    print(f"\n✓ Artımlı güncelleme tamamlandı!")
+    print(f"  Eklenen: {stats['inserted']}, Güncellenen: {stats['updated']}")
+    print(f"  Silinen: {stats['deleted']}, Değişmeyen: {stats['unchanged']}")
+    print(f"  Dosya: {dataset}")
+
+
 def process_command(args):
     """AI ile işleme komutu"""
     logger.info("Metinler işleniyor...")
@@ -82,24 +279,21 @@ def process_command(args):
     with open(latest_file, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    # Sınıflandır
-    logger.info("Metinler sınıflandırılıyor...")
-    classifier = TextClassifier(model=args.model)
-    for record in data:
-        if "text" in record:
-            record["category"] = classifier.classify(record["text"])
+    # Türkçe küçük harf + NFC biçimi kayıt başına bir kez hesaplanır, adımlar paylaşır
+    folded = fold_records(data)
+
+    config = get_config()
+
+    # Sınıflandır (hashed-nb modeli tüm kayıtları toplu olarak sınıflandırır)
+    classify_records(data, folded, config, args.model, args.endpoint)
 
     # Duplicate temizliği
     logger.info("Duplicate kayıtlar temizleniyor...")
     deduplicator = Deduplicator()
-    data = deduplicator.remove_duplicates(data)
+    data = deduplicator.remove_duplicates(data, folded)
 
-    # Normalize
-    logger.info("Metinler normalize ediliyor...")
-    normalizer = TextNormalizer()
-    for record in data:
-        if "text" in record:
-            record["text"] = normalizer.normalize(record["text"])
+    # Normalize, yazım düzeltme ve kişisel veri temizliği
+    finalize_records(data, config)
 
     # Kaydet
     cleaned_dir = Path("data/cleaned")
@@ -147,6 +341,31 @@ def export_command(args):
     print(f"  Dosya: {output_path}")
 
 
+def lexicon_command(args):
+    """Düzeltme sözlüğü derleme komutu"""
+    logger.info(f"Sözlük derleniyor: {args.input} -> {args.output}")
+    lexicon = Lexicon.build(read_tsv(args.input), args.output)
+
+    print(f"\n✓ Sözlük derlendi!")
+    print(f"  Kayıt sayısı: {len(lexicon)}")
+    print(f"  Dosya: {args.output}")
+    lexicon.close()
+
+
+def train_command(args):
+    """hashed-nb sınıflandırıcı eğitme komutu"""
+    logger.info(f"Model eğitiliyor: {args.data}")
+    model = HashedNBModel.train_jsonl(
+        args.data, text_field=args.text_field, label_field=args.label_field
+    )
+    model.save(args.output)
+
+    print(f"\n✓ Model eğitildi!")
+    print(f"  Sınıflar: {', '.join(model.labels)}")
+    print(f"  Dosya: {args.output}")
+    print(f"  Kullanım: python cli.py process --model hashed-nb")
+
+
 def main():
     """Ana CLI fonksiyonu"""
     parser = argparse.ArgumentParser(
@@ -157,9 +376,33 @@ def main():
   # Wikipedia'dan 100 sayfa çek
   python cli.py scrape --source wikipedia --limit 100
   
+  # 4 worker ile 100000 sayfalık dağıtık tarama (diğer makineler --total olmadan katılır;
+  # paylaşılan dizin dosya kilitlerini desteklemeli, ör. kilitleme açık NFSv4)
+  python cli.py crawl --source wikipedia --total 100000 --processes 4 --dir /paylasimli/kuyruk
+
+  # Vikinin tamamını 16 başlık aralığına bölerek tara
+  python cli.py crawl --source wikipedia --partitions 16 --processes 4
+
+  # Etkin kaynaklardan 1000 kayıt, bütçe verimli kaynaklara kaydırılarak
+  python cli.py collect --total 1000
+
+  # Son değişiklikleri mevcut veri setine uygula
+  python cli.py refresh --source wikipedia --dataset data/output/dataset.jsonl
+
   # AI ile işle
   python cli.py process --model gpt-4
+
+  # Yerel stand-in model sunucusuyla (çevrimdışı) AI işleme
+  python -m data4tr.processor.standin_server --port 8090
+  python cli.py process --model local-llm --endpoint http://127.0.0.1:8090/v1
   
+  # Etiketli veriden hashed-nb sınıflandırıcı eğit ve kullan
+  python cli.py train --data data/labeled.jsonl
+  python cli.py process --model hashed-nb
+
+  # Yazım düzeltme sözlüğünü derle (processing.normalization.lexicon.path ile kullanılır)
+  python cli.py lexicon --input duzeltmeler.tsv --output data/lexicon.bin
+
   # JSONL formatında dışa aktar
   python cli.py export --format jsonl
         """,
@@ -176,10 +419,122 @@ def main():
         "--limit", type=int, default=100, help="Maksimum kayıt sayısı (default: 100)"
     )
 
+    # Crawl komutu
+    crawl_parser = subparsers.add_parser("crawl", help="Dağıtık veri topla (iş kuyruğu)")
+    crawl_parser.add_argument(
+        "--source", type=str, default="wikipedia", help="Veri kaynağı (default: wikipedia)"
+    )
+    crawl_parser.add_argument(
+        "--dir",
+        type=str,
+        default=None,
+        help="Ortak kuyruk dizini; makineler arası paylaşımda dosya kilidi desteklemeli "
+        "(default: data/crawl/<kaynak>)",
+    )
+    crawl_parser.add_argument(
+        "--total", type=int, default=0, help="Kuyruğa eklenecek toplam kayıt (0: ekleme)"
+    )
+    crawl_parser.add_argument(
+        "--unit-size", type=int, default=500, help="İş birimi başına kayıt (default: 500)"
+    )
+    crawl_parser.add_argument(
+        "--partitions",
+        type=int,
+        default=0,
+        help="Tüm başlıkları bu kadar aralığa bölüp sırayla tara (enumerate modu)",
+    )
+    crawl_parser.add_argument(
+        "--processes", type=int, default=1, help="Bu makinedeki worker sayısı (default: 1)"
+    )
+    crawl_parser.add_argument(
+        "--lease", type=float, default=60.0, help="Kiralama süresi, saniye (default: 60)"
+    )
+
+    # Collect komutu
+    collect_parser = subparsers.add_parser(
+        "collect", help="Etkin kaynaklardan verime göre zamanlanmış veri topla"
+    )
+    collect_parser.add_argument(
+        "--total", type=int, default=1000, help="Toplanacak yeni kayıt sayısı (default: 1000)"
+    )
+    collect_parser.add_argument(
+        "--sources", nargs="+", default=None, help="Kaynaklar (default: etkin tüm kaynaklar)"
+    )
+    collect_parser.add_argument(
+        "--round-size", type=int, default=50, help="Tur başına kayıt kotası (default: 50)"
+    )
+    collect_parser.add_argument(
+        "--concurrency", type=int, default=8, help="Toplam eşzamanlı istek (default: 8)"
+    )
+
+    # Refresh komutu
+    refresh_parser = subparsers.add_parser(
+        "refresh", help="Son değişikliklerle veri setini güncelle"
+    )
+    refresh_parser.add_argument(
+        "--source", type=str, default="wikipedia", help="Veri kaynağı (default: wikipedia)"
+    )
+    refresh_parser.add_argument(
+        "--dataset",
+        type=str,
+        default="data/output/dataset.jsonl",
+        help="Güncellenecek JSONL veri seti (default: data/output/dataset.jsonl)",
+    )
+    refresh_parser.add_argument(
+        "--model",
+        type=str,
+        default=None,
+        help="Sınıflandırma modeli (default: processing.classification.model)",
+    )
+
     # Process komutu
     process_parser = subparsers.add_parser("process", help="Veriyi işle")
     process_parser.add_argument(
-        "--model", type=str, default="rule-based", help="AI modeli (default: rule-based)"
+        "--model",
+        type=str,
+        default="rule-based",
+        help="Sınıflandırma modeli: rule-based, hashed-nb, gpt-4, ... (default: rule-based)",
+    )
+    process_parser.add_argument(
+        "--endpoint",
+        type=str,
+        default=None,
+        help="AI modelleri için toplu sınıflandırma API adresi "
+        "(default: processing.classification.ai.endpoint)",
+    )
+
+    # Train komutu
+    train_parser = subparsers.add_parser(
+        "train", help="Etiketli JSONL verisinden hashed-nb sınıflandırıcı eğit"
+    )
+    train_parser.add_argument(
+        "--data", type=str, required=True, help="Her satırı {text, category} olan JSONL dosyası"
+    )
+    train_parser.add_argument(
+        "--output",
+        type=str,
+        default="data/models/hashed_nb.npz",
+        help="Model dosyası (default: data/models/hashed_nb.npz)",
+    )
+    train_parser.add_argument(
+        "--text-field", type=str, default="text", help="Metin alanı (default: text)"
+    )
+    train_parser.add_argument(
+        "--label-field", type=str, default="category", help="Etiket alanı (default: category)"
+    )
+
+    # Lexicon komutu
+    lexicon_parser = subparsers.add_parser(
+        "lexicon", help="Yazım düzeltme sözlüğünü (TSV) ikili biçime derle"
+    )
+    lexicon_parser.add_argument(
+        "--input", type=str, required=True, help="Sekmeyle ayrılmış 'yanlış<TAB>doğru' dosyası"
+    )
+    lexicon_parser.add_argument(
+        "--output",
+        type=str,
+        default="data/lexicon.bin",
+        help="Derlenmiş sözlük dosyası (default: data/lexicon.bin)",
     )
 
     # Export komutu
@@ -201,8 +556,18 @@ def main():
     # Komutu çalıştır
     if args.command == "scrape":
         scrape_command(args)
+    elif args.command == "crawl":
+        crawl_command(args)
+    elif args.command == "collect":
+        collect_command(args)
+    elif args.command == "refresh":
+        refresh_command(args)
     elif args.command == "process":
         process_command(args)
+    elif args.command == "train":
+        train_command(args)
+    elif args.command == "lexicon":
+        lexicon_command(args)
     elif args.command == "export":
         export_command(args)
     else:
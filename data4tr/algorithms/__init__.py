@@ -4,5 +4,7 @@ Matematiksel algoritmalar ve metin metrikleri
 """
 
 from .metrics import TextMetrics
+from .turkish import fold_records, turkish_fold, turkish_upper
+from .keywords import KeywordIndex
 
-__all__ = ["TextMetrics"]
+__all__ = ["TextMetrics", "turkish_fold", "turkish_upper", "fold_records", "KeywordIndex"]
@@ -0,0 +1,133 @@
+"""
+data4tr - Keyword Index
+Çok sayıda anahtar kelimeyi metin üzerinde tek geçişte arayan çoklu desen indeksi.
+
+Anahtar kelimeler bir kez bir önek ağacına (trie) yerleştirilir ve ağaç tek bir
+regex'e derlenir ("tarih", "tarihi", "tablo" -> "(?:ta(?:rih(?:i)?|blo))"). Metnin
+her konumunda regex motoru ağacı yalnızca metindeki karakterlerin izlediği dal
+boyunca dener; bu nedenle konum başına maliyet anahtar kelime sayısıyla değil en
+uzun anahtar kelimenin uzunluğuyla sınırlıdır (Aho-Corasick'e benzer şekilde).
+
+Her konumda en uzun eşleşme bulunur; aynı konumdan başlayan daha kısa anahtar
+kelimeler (en uzun eşleşmenin önekleri) önceden hesaplanmış önek tablosundan
+eklenir. Böylece "tarihi" geçen bir metinde "tarih" de bulunmuş sayılır
+(str.__contains__ ile aynı sonuç).
+
+Tam kelime modunda bir anahtar kelime, önünde ve arkasında kelime karakteri yoksa
+eşleşir (negatif lookbehind/lookahead). Kelime sınırı kullanılmaz: "c++" veya ".net"
+gibi kelime karakteriyle başlamayan ya da bitmeyen anahtar kelimelerde kelime sınırı
+tam kelime yerine kelime içi eşleşmeleri seçer.
+"""
+
+import re
+from typing import Dict, Iterable, Set, Tuple
+
+from .turkish import turkish_fold
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Önek ağacını regex'e dönüştür ("" anahtarı: kelime sonu)"""
+    branches = [
+        re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # Burada biten bir kelime varsa devamı isteğe bağlıdır (greedy: önce en uzun denenir)
+    return f"(?:{body})?" if "" in node else body
+
+
+class KeywordIndex:
+    """
+    Etiketli anahtar kelime indeksi
+
+    Örnek:
+        index = KeywordIndex({"tarih": ["tarih", "savaş"], "spor": ["maç"]})
+        index.score("Tarihi savaşlar")  # {"tarih": 2, "spor": 0}
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], word_boundary: bool = False):
+        """
+        Args:
+            keywords: Etiket -> anahtar kelimeler (turkish_fold ile katlanır)
+            word_boundary: True ise yalnızca tam kelime (veya tam kelime grubu) eşleşmeleri
+                sayılır: önünde ve arkasında kelime karakteri olmayan eşleşmeler
+        """
+        self.word_boundary = word_boundary
+        self.labels = list(keywords)
+        self._keyword_labels: Dict[str, Set[str]] = {}
+        for label, words in keywords.items():
+            for word in words:
+                folded = turkish_fold(word).strip()
+                if folded:
+                    self._keyword_labels.setdefault(folded, set()).add(label)
+
+        trie: Dict = {}
+        for word in self._keyword_labels:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # Her anahtar kelime için aynı konumdan başlayıp onunla birlikte eşleşen
+        # kısa anahtar kelimeler (kendisi dahil)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        for word in self._keyword_labels:
+            prefixes = []
+            node = trie
+            for position, char in enumerate(word, 1):
+                node = node[char]
+                if "" not in node:
+                    continue
+                # Tam kelime modunda önek ancak ardından kelime karakteri gelmiyorsa eşleşir
+                # (metinde önekten sonra gelen karakter, en uzun kelimenin sonraki karakteridir)
+                if position < len(word) and word_boundary and _WORD_CHAR.match(word[position]):
+                    continue
+                prefixes.append(word[:position])
+            self._prefixes[word] = tuple(prefixes)
+
+        body = _trie_pattern(trie) if trie else "(?!)"
+        if word_boundary:
+            body = rf"(?<!\w){body}(?!\w)"
+        self.pattern = re.compile(f"(?=({body}))")
+
+    def __len__(self) -> int:
+        return len(self._keyword_labels)
+
+    def find(self, text: str, folded: bool = False) -> Set[str]:
+        """
+        Metinde geçen anahtar kelimeler
+
+        Args:
+            text: Metin
+            folded: Metin zaten turkish_fold ile katlanmış mı
+
+        Returns:
+            Bulunan (katlanmış) anahtar kelimeler
+        """
+        if not folded:
+            text = turkish_fold(text)
+        found: Set[str] = set()
+        prefixes = self._prefixes
+        for longest in set(self.pattern.findall(text)):
+            found.update(prefixes[longest])
+        return found
+
+    def score(self, text: str, folded: bool = False) -> Dict[str, int]:
+        """
+        Etiket başına metinde geçen farklı anahtar kelime sayısı
+
+        Args:
+            text: Metin
+            folded: Metin zaten turkish_fold ile katlanmış mı
+
+        Returns:
+            Etiket -> skor (tüm etiketler, indeks sırasıyla)
+        """
+        scores = {label: 0 for label in self.labels}
+        for keyword in self.find(text, folded):
+            for label in self._keyword_labels[keyword]:
+                scores[label] += 1
+        return scores
@@ -6,9 +6,11 @@ Matematiksel algoritmalar ile metin kalitesi ve benzerlik ölçümleri.
 import re
 import math
 import hashlib
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Optional, Sequence, Tuple, Set
 from collections import Counter
 
+from .turkish import turkish_fold
+
 
 class TextMetrics:
     """
@@ -87,7 +89,7 @@ class TextMetrics:
         return round(quality_score, 3)
 
     @staticmethod
-    def calculate_tf(text: str) -> Dict[str, float]:
+    def calculate_tf(text: str, folded: Optional[str] = None) -> Dict[str, float]:
         """
         Term Frequency (TF) hesaplar
 
@@ -95,11 +97,12 @@ class TextMetrics:
 
         Args:
             text: Doküman metni
+            folded: Önceden hesaplanmış turkish_fold(text) (varsa yeniden hesaplanmaz)
 
         Returns:
             Kelime -> TF skoru dictionary
         """
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = re.findall(r"\b\w+\b", folded if folded is not None else turkish_fold(text))
         total_words = len(words)
 
         if total_words == 0:
@@ -129,7 +132,7 @@ class TextMetrics:
         document_frequency = Counter()
 
         for doc in documents:
-            words = set(re.findall(r"\b\w+\b", doc.lower()))
+            words = set(re.findall(r"\b\w+\b", turkish_fold(doc)))
             document_frequency.update(words)
 
         # IDF hesapla
@@ -141,7 +144,9 @@ class TextMetrics:
         return idf_scores
 
     @staticmethod
-    def calculate_tfidf(text: str, idf_scores: Dict[str, float]) -> Dict[str, float]:
+    def calculate_tfidf(
+        text: str, idf_scores: Dict[str, float], folded: Optional[str] = None
+    ) -> Dict[str, float]:
         """
         TF-IDF skorunu hesaplar
 
@@ -150,11 +155,12 @@ class TextMetrics:
         Args:
             text: Doküman metni
             idf_scores: IDF skorları
+            folded: Önceden hesaplanmış turkish_fold(text)
 
         Returns:
             Kelime -> TF-IDF skoru dictionary
         """
-        tf_scores = TextMetrics.calculate_tf(text)
+        tf_scores = TextMetrics.calculate_tf(text, folded)
 
         tfidf_scores = {word: tf * idf_scores.get(word, 0) for word, tf in tf_scores.items()}
 
@@ -207,8 +213,8 @@ class TextMetrics:
         Returns:
             Jaccard similarity skoru (0-1 arası)
         """
-        words1 = set(re.findall(r"\b\w+\b", text1.lower()))
-        words2 = set(re.findall(r"\b\w+\b", text2.lower()))
+        words1 = set(re.findall(r"\b\w+\b", turkish_fold(text1)))
+        words2 = set(re.findall(r"\b\w+\b", turkish_fold(text2)))
 
         if not words1 or not words2:
             return 0.0
@@ -259,6 +265,24 @@ class TextMetrics:
         return round(min(1.0, complexity), 3)
 
 
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Yüzdelik değeri (nearest-rank)
+
+    Args:
+        values: Ölçümler
+        q: Yüzdelik (0-100)
+
+    Returns:
+        Yüzdelik değer (ölçüm yoksa 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
 def main():
     """Test algoritmalar"""
     print("Text Metrics Algorithms Test\n" + "=" * 50)
@@ -0,0 +1,85 @@
+"""
+data4tr - Turkish Text Folding
+Türkçe kurallarına uygun büyük/küçük harf katlama ve Unicode (NFC) normalizasyonu.
+
+str.lower() "I" harfini "i"ye çevirir (Türkçede "ı" olmalı), "İ" harfini ise
+"i" + birleşik nokta (U+0307) dizisine dönüştürür. Ayrıca aynı harfin NFC ve NFD
+biçimleri (ör. "ş" ile "s" + U+0327) farklı kalır. turkish_fold bu farkları
+giderir; tekrar tespiti, metrikler ve sınıflandırıcı aynı katlanmış biçimi kullanır.
+
+Katlanmış biçim kayıt başına bir kez hesaplanıp (bkz. fold_records) tüm adımlara
+verilebilir; böylece her adım aynı metni yeniden küçük harfe çevirmez.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List
+
+# Türkçeye özgü büyük -> küçük harf eşlemeleri; casefold'dan önce uygulanır.
+# Tabloda iki karakter olduğundan, ASCII dışı metinlerde str.translate'ten çok daha
+# hızlı olan str.replace ile uygulanır.
+TURKISH_CASE_MAP = (("I", "ı"), ("İ", "i"))
+
+
+def turkish_fold(text: str) -> str:
+    """
+    Türkçe büyük/küçük harf katlama + NFC normalizasyonu
+
+    Hızlı yol: ASCII metinlerde NFC adımı atlanır ve yalnızca "I" varsa
+    değiştirme yapılır (ASCII str.lower C'de tek geçişte çalışır). ASCII dışı
+    metinler yalnızca zaten NFC değilse normalize edilir.
+
+    Args:
+        text: Metin
+
+    Returns:
+        Katlanmış metin ("IŞIK İstanbul" -> "ışık istanbul")
+    """
+    if not text:
+        return ""
+
+    if text.isascii():
+        return text.replace("I", "ı").lower() if "I" in text else text.lower()
+
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    for upper, lower in TURKISH_CASE_MAP:
+        if upper in text:
+            text = text.replace(upper, lower)
+    text = text.casefold()
+    # casefold nadiren ayrışık dizi üretebilir (ör. "ǰ" -> "ǰ")
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return text
+
+
+def turkish_upper(text: str) -> str:
+    """
+    Türkçe kurallarıyla büyük harfe çevir (turkish_fold'un tersi)
+
+    Args:
+        text: Metin
+
+    Returns:
+        Büyük harfli metin ("ışık istanbul" -> "IŞIK İSTANBUL")
+    """
+    for upper, lower in TURKISH_CASE_MAP:
+        if lower in text:
+            text = text.replace(lower, upper)
+    return text.upper()
+
+
+def fold_records(records: Iterable[Dict], field: str = "text") -> List[str]:
+    """
+    Kayıtların katlanmış metinlerini bir kez hesapla
+
+    Dönen liste kayıtlarla aynı sıradadır ve Deduplicator.remove_duplicates,
+    TextClassifier.classify gibi adımlara folded parametresiyle verilebilir.
+
+    Args:
+        records: Kayıtlar
+        field: Metin alanı
+
+    Returns:
+        Katlanmış metinler (alan yoksa boş metin)
+    """
+    return [turkish_fold(record.get(field) or "") for record in records]
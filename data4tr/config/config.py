@@ -10,7 +10,6 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import re
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -165,6 +164,7 @@ def get_config() -> ConfigManager:
 
 def main():
     """Test konfigürasyon yöneticisi"""
+    logging.basicConfig(level=logging.INFO)
     config = get_config()
 
     # Test environment variable
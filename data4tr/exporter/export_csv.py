@@ -8,7 +8,6 @@ import logging
 from typing import List, Dict, Optional
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +119,7 @@ def export_to_csv(
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     exporter = CSVExporter()
 
     sample_data = [
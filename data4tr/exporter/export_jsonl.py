@@ -5,10 +5,10 @@ Veri setini JSON Lines formatında dışa aktaran modül.
 
 import json
 import logging
-from typing import List, Dict, Optional
+import os
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +99,58 @@ class JSONLExporter:
 
         return self.export(valid_data, filename)
 
+    def upsert(self, records: Iterable[Dict], filename: str = "dataset.jsonl") -> Dict[str, int]:
+        """
+        Kayıtları mevcut veri setine id ile uygula (artımlı güncelleme)
+
+        Aynı id'li kayıtlar yenisiyle değiştirilir, "deleted": True içeren silme
+        kayıtları satırı veri setinden çıkarır, yeni kayıtlar sona eklenir. Dosya
+        satır satır okunup geçici dosyaya yazılır ve atomik olarak yer değiştirilir.
+
+        Args:
+            records: Güncel kayıtlar ve silme kayıtları
+            filename: Veri seti dosya adı
+
+        Returns:
+            {"inserted", "updated", "deleted", "unchanged"} sayıları
+        """
+        output_path = self.output_dir / filename
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        # Aynı id için son kayıt geçerli
+        pending = {record["id"]: record for record in records}
+        stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            if output_path.exists():
+                with open(output_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        record_id = json.loads(line).get("id")
+                        if record_id not in pending:
+                            stats["unchanged"] += 1
+                            out.write(line)
+                            continue
+
+                        record = pending.pop(record_id)
+                        if record.get("deleted"):
+                            stats["deleted"] += 1
+                        else:
+                            stats["updated"] += 1
+                            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            for record in pending.values():
+                if not record.get("deleted"):
+                    stats["inserted"] += 1
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        os.replace(tmp_path, output_path)
+        logger.info(
+            f"✓ Veri seti güncellendi: {output_path} "
+            f"(+{stats['inserted']} ~{stats['updated']} -{stats['deleted']})"
+        )
+        return stats
+
 
 def export_to_jsonl(
     data: List[Dict], filename: str = "dataset.jsonl", output_dir: str = "data/output"
@@ -120,6 +172,7 @@ def export_to_jsonl(
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     exporter = JSONLExporter()
 
     sample_data = [
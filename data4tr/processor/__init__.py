@@ -6,6 +6,10 @@ AI ile metin işleme ve etiketleme modülü.
 from .classify import TextClassifier, classify_batch
 from .deduplicate import Deduplicator, remove_exact_duplicates
 from .normalize import TextNormalizer, normalize_batch
+from .pipeline import Pipeline, build_pipeline
+from .lexicon import Lexicon, LexiconCorrector
+from .hashed_model import HashedNBModel
+from .ai_client import AsyncBatchClassifier
 
 __all__ = [
     "TextClassifier",
@@ -14,4 +18,10 @@ __all__ = [
     "remove_exact_duplicates",
     "TextNormalizer",
     "normalize_batch",
+    "Pipeline",
+    "build_pipeline",
+    "Lexicon",
+    "LexiconCorrector",
+    "HashedNBModel",
+    "AsyncBatchClassifier",
 ]
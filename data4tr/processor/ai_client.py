@@ -0,0 +1,602 @@
+"""
+data4tr - AI Classification Client
+AI modelleriyle toplu (micro-batch) ve eşzamanlı metin sınıflandırma istemcisi.
+
+- Metinler istek başına gruplar halinde gönderilir; aynı anda uçuşta olan istek
+  sayısı max_concurrency ile sınırlıdır.
+- Grup boyutu gözlenen gecikmeye göre ayarlanır: istek target_latency'den hızlı
+  dönerse büyütülür, yavaş dönerse küçültülür. Sunucu grubu çok büyük bulursa
+  (413) grup ikiye bölünür ve üst sınır düşürülür.
+- 429/5xx ve bağlantı hatalarında üstel geri çekilme (backoff_delay) ile yeniden
+  denenir, Retry-After header'ına uyulur. Denemeler tükenirse grup fallback ile
+  (örn. anahtar kelime sınıflandırması) sınıflandırılır.
+- Art arda hatalarda devre kesici (CircuitBreaker) açılır; açık kaldığı sürece
+  kalan gruplar istek gönderilmeden doğrudan fallback'e verilir.
+- Aynı metin bir çalıştırma boyunca yalnızca bir kez gönderilir.
+
+Backend takılabilir: AIBackend alt sınıfları (HTTPBackend, OpenAIChatBackend)
+veya CallableBackend ile herhangi bir fonksiyon kullanılabilir. Çevrimdışı verim
+ölçümü için yerel sunucu: standin_server.py.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+import requests
+
+from data4tr.algorithms.metrics import percentile
+from data4tr.scraper.base import CircuitBreaker, backoff_delay, parse_retry_after
+from .classify import CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# Model adı öneki -> ai_models bölümündeki sağlayıcı
+PROVIDERS = {"gpt": "openai", "claude": "anthropic", "local": "local"}
+
+
+class AIBackendError(Exception):
+    """Backend isteği başarısız"""
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        retriable: bool = True,
+    ):
+        """
+        Args:
+            message: Hata mesajı
+            status: HTTP durum kodu (varsa)
+            retry_after: Sunucunun istediği bekleme süresi (saniye)
+            retriable: Yeniden denenebilir mi
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.retriable = retriable
+
+
+class AIBackend:
+    """
+    Sınıflandırma backend'i arayüzü
+
+    classify_batch engelleyici (blocking) bir çağrıdır; istemci onu thread
+    havuzunda çalıştırır. Başarısızlıkta AIBackendError fırlatılmalıdır.
+    """
+
+    def classify_batch(self, texts: List[str], categories: Sequence[str]) -> List[Dict]:
+        """
+        Metin grubunu sınıflandır
+
+        Args:
+            texts: Metinler
+            categories: İzin verilen kategoriler
+
+        Returns:
+            Metin başına {"category", "confidence", "all_scores"} (aynı sırada)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Bağlantıları kapat"""
+
+
+class CallableBackend(AIBackend):
+    """Herhangi bir fonksiyonu backend olarak kullan (yerel modeller, testler)"""
+
+    def __init__(self, func: Callable[[List[str], Sequence[str]], List[Dict]]):
+        """
+        Args:
+            func: (metinler, kategoriler) -> sonuçlar
+        """
+        self.func = func
+
+    def classify_batch(self, texts: List[str], categories: Sequence[str]) -> List[Dict]:
+        return self.func(texts, categories)
+
+
+class HTTPBackend(AIBackend):
+    """
+    data4tr toplu sınıflandırma protokolü (POST {url}/classify)
+
+    İstek: {"model", "categories", "texts"}
+    Yanıt: {"results": [{"category", "confidence", "all_scores"?}, ...]}
+    """
+
+    path = "/classify"
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        url: str,
+        model: str = "local",
+        api_key: Optional[str] = None,
+        timeout: float = 60.0,
+    ):
+        """
+        Args:
+            url: API kök URL'i (örn. http://127.0.0.1:8090/v1)
+            model: İstekte gönderilecek model adı
+            api_key: Bearer token (varsa)
+            timeout: İstek zaman aşımı (saniye)
+        """
+        self.url = url.rstrip("/")
+        self.model = model
+        self.timeout = float(timeout)
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        # requests.Session thread'ler arasında paylaşılmaz; thread başına bir session
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def post(self, payload: Dict) -> Dict:
+        """
+        JSON isteği gönder
+
+        Args:
+            payload: İstek gövdesi
+
+        Returns:
+            Yanıt gövdesi
+
+        Raises:
+            AIBackendError: Bağlantı hatası veya başarısız durum kodu
+        """
+        try:
+            response = self._session().post(
+                self.url + self.path, json=payload, headers=self.headers, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            raise AIBackendError(f"Bağlantı hatası: {e}")
+
+        if response.status_code != 200:
+            raise AIBackendError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                status=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                retriable=response.status_code in self.RETRY_STATUSES,
+            )
+        try:
+            return response.json()
+        except ValueError:
+            raise AIBackendError("Geçersiz JSON yanıtı")
+
+    def payload(self, texts: List[str], categories: Sequence[str]) -> Dict:
+        """İstek gövdesi"""
+        return {"model": self.model, "categories": list(categories), "texts": texts}
+
+    def parse(self, data: Dict, texts: List[str], categories: Sequence[str]) -> List[Dict]:
+        """
+        Yanıt gövdesini sonuç listesine dönüştür
+
+        Raises:
+            AIBackendError: Yanıt beklenen şemada değil
+        """
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list) or len(results) != len(texts):
+            raise AIBackendError(f"Yanıttaki sonuç sayısı hatalı (beklenen {len(texts)})")
+        parsed = []
+        for result in results:
+            # Bozuk sonuç nesneleri de yeniden denenebilir backend hatası sayılır
+            try:
+                category = result.get("category")
+                if category not in categories:
+                    category = "genel"
+                confidence = float(result.get("confidence", 1.0))
+                scores = result.get("all_scores") or {category: confidence}
+                if not isinstance(scores, dict):
+                    raise TypeError(f"all_scores: {type(scores).__name__}")
+            except (AttributeError, TypeError, ValueError) as e:
+                raise AIBackendError(f"Geçersiz sonuç nesnesi: {result!r:.100} ({e})")
+            parsed.append({"category": category, "confidence": confidence, "all_scores": scores})
+        return parsed
+
+    def classify_batch(self, texts: List[str], categories: Sequence[str]) -> List[Dict]:
+        return self.parse(self.post(self.payload(texts, categories)), texts, categories)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+
+
+class OpenAIChatBackend(HTTPBackend):
+    """
+    OpenAI uyumlu sohbet API'si (POST {url}/chat/completions)
+
+    Metinler ve kategoriler kullanıcı mesajında JSON olarak gönderilir; modelden
+    metinlerle aynı sırada kategori adlarından oluşan bir JSON dizisi istenir.
+    """
+
+    path = "/chat/completions"
+
+    SYSTEM_PROMPT = (
+        "Türkçe metinleri verilen kategorilerden birine ata. Yanıt olarak yalnızca "
+        "metinlerle aynı sırada kategori adlarından oluşan bir JSON dizisi döndür."
+    )
+
+    def payload(self, texts: List[str], categories: Sequence[str]) -> Dict:
+        content = json.dumps({"categories": list(categories), "texts": texts}, ensure_ascii=False)
+        return {
+            "model": self.model,
+            "temperature": 0,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": content},
+            ],
+        }
+
+    def parse(self, data: Dict, texts: List[str], categories: Sequence[str]) -> List[Dict]:
+        try:
+            content = data["choices"][0]["message"]["content"]
+            # Model diziyi kod bloğu veya açıklama içinde döndürebilir
+            labels = json.loads(content[content.index("[") : content.rindex("]") + 1])
+        except (KeyError, IndexError, TypeError, ValueError):
+            raise AIBackendError("Yanıtta kategori dizisi bulunamadı")
+        return super().parse(
+            {"results": [{"category": label} for label in labels]}, texts, categories
+        )
+
+
+def create_backend(
+    model: str, ai_config: Optional[Dict] = None, providers: Optional[Dict] = None
+) -> Optional[AIBackend]:
+    """
+    Konfigürasyondan backend oluştur
+
+    processing.classification.ai.endpoint verilmişse o adres kullanılır
+    (protocol: "batch" veya "openai"). Aksi halde model adının önekine göre
+    ai_models bölümündeki etkin sağlayıcının base_url'i OpenAI uyumlu sohbet
+    API'si olarak kullanılır.
+
+    Args:
+        model: Model adı (örn. gpt-4, claude, local-llm)
+        ai_config: processing.classification.ai bölümü
+        providers: ai_models bölümü
+
+    Returns:
+        Backend veya (yapılandırılmış backend yoksa) None
+    """
+    ai_config = ai_config or {}
+    timeout = ai_config.get("timeout", 60)
+
+    endpoint = ai_config.get("endpoint")
+    if endpoint:
+        backend_class = OpenAIChatBackend if ai_config.get("protocol") == "openai" else HTTPBackend
+        return backend_class(endpoint, model, ai_config.get("api_key"), timeout)
+
+    for prefix, name in PROVIDERS.items():
+        if model.startswith(prefix):
+            provider = (providers or {}).get(name) or {}
+            if provider.get("enabled") and provider.get("base_url"):
+                return OpenAIChatBackend(
+                    provider["base_url"],
+                    provider.get("model", model),
+                    provider.get("api_key"),
+                    timeout,
+                )
+    return None
+
+
+class AsyncBatchClassifier:
+    """
+    Toplu ve eşzamanlı AI sınıflandırma istemcisi
+
+    Örnek:
+        client = AsyncBatchClassifier(HTTPBackend("http://127.0.0.1:8090/v1"))
+        results = client.classify(texts)  # [{"category", "confidence", "all_scores"}, ...]
+    """
+
+    def __init__(
+        self,
+        backend: AIBackend,
+        categories: Optional[Sequence[str]] = None,
+        batch_size: int = 16,
+        min_batch_size: int = 1,
+        max_batch_size: int = 256,
+        max_concurrency: int = 4,
+        target_latency: float = 2.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        fallback: Optional[Callable[[str], Dict]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Args:
+            backend: Sınıflandırma backend'i
+            categories: İzin verilen kategoriler (varsayılan: CATEGORIES)
+            batch_size: Başlangıç grup boyutu
+            min_batch_size: Grup boyutu alt sınırı
+            max_batch_size: Grup boyutu üst sınırı
+            max_concurrency: Aynı anda uçuşta olabilecek en fazla istek
+            target_latency: İstek başına hedef gecikme (saniye)
+            max_retries: Grup başına en fazla yeniden deneme
+            backoff_base: Geri çekilmenin ilk denemedeki üst sınırı (saniye)
+            backoff_max: Maksimum geri çekilme (saniye)
+            fallback: Denemeler tükenince metin başına kullanılacak sınıflandırıcı
+                (yoksa hata yükseltilir)
+            breaker: Devre kesici (varsayılan: 5 art arda hatada 30 saniye açık)
+        """
+        self.backend = backend
+        self.categories = list(categories or CATEGORIES)
+        self.min_batch_size = max(1, int(min_batch_size))
+        self.max_batch_size = max(self.min_batch_size, int(max_batch_size))
+        self.batch_size = min(max(int(batch_size), self.min_batch_size), self.max_batch_size)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.target_latency = float(target_latency)
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.fallback = fallback
+        self.breaker = breaker or CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+
+        # Çalıştırma boyunca metin -> sonuç (aynı metin bir kez gönderilir)
+        self._results: Dict[str, Dict] = {}
+        self.latencies = deque(maxlen=10000)
+        self.batch_sizes = deque(maxlen=10000)
+        self.stats = {
+            "texts": 0,
+            "unique": 0,
+            "cached": 0,
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "fallback": 0,
+            "short_circuited": 0,
+            "seconds": 0.0,
+        }
+
+    @classmethod
+    def from_config(
+        cls, backend: AIBackend, config: Optional[Dict] = None, **kwargs
+    ) -> "AsyncBatchClassifier":
+        """
+        processing.classification.ai bölümünden istemci oluştur
+
+        Args:
+            backend: Sınıflandırma backend'i
+            config: {"batch_size", "max_batch_size", "max_concurrency", "target_latency",
+                ..., "circuit_breaker": {"failure_threshold", "reset_timeout"}}
+            **kwargs: Ek parametreler (categories, fallback)
+
+        Returns:
+            AsyncBatchClassifier
+        """
+        config = config or {}
+        options = (
+            "batch_size",
+            "min_batch_size",
+            "max_batch_size",
+            "max_concurrency",
+            "target_latency",
+            "max_retries",
+            "backoff_base",
+            "backoff_max",
+        )
+        breaker_config = config.get("circuit_breaker") or {}
+        kwargs.setdefault(
+            "breaker",
+            CircuitBreaker(
+                failure_threshold=breaker_config.get("failure_threshold", 5),
+                reset_timeout=breaker_config.get("reset_timeout", 30.0),
+            ),
+        )
+        return cls(backend, **{key: config[key] for key in options if key in config}, **kwargs)
+
+    def classify(self, texts: Sequence[str]) -> List[Dict]:
+        """
+        Metinleri sınıflandır (senkron sarmalayıcı; kendi event loop'unu açar)
+
+        Args:
+            texts: Metinler
+
+        Returns:
+            Metin başına {"category", "confidence", "all_scores"} (aynı sırada)
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.classify_async(texts))
+        finally:
+            loop.close()
+
+    async def classify_async(self, texts: Sequence[str]) -> List[Dict]:
+        """
+        Metinleri eşzamanlı gruplar halinde sınıflandır
+
+        Args:
+            texts: Metinler
+
+        Returns:
+            Metin başına {"category", "confidence", "all_scores"} (aynı sırada)
+        """
+        start = time.perf_counter()
+        unique = [text for text in dict.fromkeys(texts) if text not in self._results]
+        self.stats["texts"] += len(texts)
+        self.stats["unique"] += len(unique)
+        self.stats["cached"] += len(texts) - len(unique)
+
+        failed: Dict[str, Dict] = {}
+        if unique:
+            logger.info(
+                f"{len(unique)} farklı metin AI ile sınıflandırılıyor "
+                f"({self.max_concurrency} eşzamanlı istek)..."
+            )
+            pending = deque(unique)
+            loop = asyncio.get_running_loop()
+
+            async def worker(executor: ThreadPoolExecutor) -> None:
+                # Tüm worker'lar aynı kuyruktan iş alır (asyncio tek thread'de çalışır)
+                while pending:
+                    size = min(self.batch_size, len(pending))
+                    batch = [pending.popleft() for _ in range(size)]
+                    try:
+                        results = await self._send(loop, executor, batch)
+                    except AIBackendError as e:
+                        if self.fallback is None:
+                            raise
+                        if self.breaker.state == "open":
+                            logger.debug(f"AI isteği atlandı ({len(batch)} metin): {e}")
+                        else:
+                            logger.error(f"AI isteği başarısız ({len(batch)} metin): {e}")
+                        self.stats["failures"] += 1
+                        self.stats["fallback"] += len(batch)
+                        failed.update((text, self.fallback(text)) for text in batch)
+                        continue
+                    self._results.update(zip(batch, results))
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                tasks = [
+                    asyncio.ensure_future(worker(executor)) for _ in range(self.max_concurrency)
+                ]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.stats["seconds"] += time.perf_counter() - start
+        return [dict(self._results.get(text) or failed[text]) for text in texts]
+
+    async def _send(
+        self, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor, batch: List[str]
+    ) -> List[Dict]:
+        """
+        Grubu yeniden deneme ve bölme ile gönder
+
+        Raises:
+            AIBackendError: Denemeler tükendi, hata yeniden denenemez veya devre açık
+        """
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                self.stats["short_circuited"] += len(batch)
+                raise AIBackendError("Devre kesici açık, istek gönderilmedi", retriable=False)
+            self.stats["requests"] += 1
+            started = time.monotonic()
+            try:
+                results = await loop.run_in_executor(
+                    executor, self.backend.classify_batch, batch, self.categories
+                )
+            except AIBackendError as e:
+                if e.status == 413 and len(batch) > 1:
+                    # Sunucu grubu çok büyük buldu: üst sınırı düşür, grubu ikiye böl
+                    half = len(batch) // 2
+                    self.max_batch_size = max(self.min_batch_size, half)
+                    self.batch_size = min(self.batch_size, self.max_batch_size)
+                    logger.info(f"Grup çok büyük (413): üst sınır {self.max_batch_size}")
+                    first = await self._send(loop, executor, batch[:half])
+                    return first + await self._send(loop, executor, batch[half:])
+                if e.retriable:
+                    self.breaker.record_failure()
+                if not e.retriable or attempt == self.max_retries:
+                    raise
+                self.stats["retries"] += 1
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                await asyncio.sleep(max(delay, e.retry_after or 0.0))
+                continue
+
+            self.breaker.record_success()
+            self._adapt(len(batch), time.monotonic() - started)
+            return results
+
+    def _adapt(self, size: int, latency: float) -> None:
+        """
+        Gözlenen gecikmeye göre grup boyutunu ayarla
+
+        Yeni boyut, gecikmenin hedefe oranıyla orantılıdır (adım başına en fazla
+        2 kat büyüme veya yarıya inme). Kuyruk sonundaki küçük gruplar boyutu
+        büyütmez.
+        """
+        self.latencies.append(latency)
+        self.batch_sizes.append(size)
+        scale = min(2.0, max(0.5, self.target_latency / max(latency, 1e-6)))
+        if scale > 1.0 and size < self.batch_size:
+            return
+        proposed = int(size * scale) if scale < 1.0 else int(self.batch_size * scale)
+        self.batch_size = min(self.max_batch_size, max(self.min_batch_size, proposed))
+
+    def report(self) -> Dict:
+        """Verim ve gecikme özeti"""
+        seconds = self.stats["seconds"]
+        return {
+            **self.stats,
+            "seconds": round(seconds, 3),
+            "texts_per_second": round(self.stats["texts"] / seconds, 1) if seconds > 0 else 0.0,
+            "batch_size": self.batch_size,
+            "mean_batch": (
+                round(sum(self.batch_sizes) / len(self.batch_sizes), 1) if self.batch_sizes else 0
+            ),
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 1),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 1),
+        }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Stand-in sunucuya karşı verim ölçümü"""
+    import random
+
+    from .standin_server import StandInModelServer
+
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(
+        description="data4tr - AI sınıflandırma istemcisi benchmark (stand-in sunucu)"
+    )
+    parser.add_argument("--texts", type=int, default=2000, help="Metin sayısı (default: 2000)")
+    parser.add_argument("--unique", type=float, default=0.8, help="Farklı metin oranı (0-1)")
+    parser.add_argument("--latency", type=float, default=0.2, help="İstek gecikmesi (saniye)")
+    parser.add_argument(
+        "--per-text-latency", type=float, default=0.002, help="Metin başına gecikme (saniye)"
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Eşzamanlı istek sayısı")
+    parser.add_argument("--batch-sizes", type=str, default="1,16", help="Başlangıç grup boyutları")
+    parser.add_argument("--target-latency", type=float, default=1.0, help="Hedef gecikme (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 oranı (0-1)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    words = "tarih savaş futbol maç roman şiir okul doktor piyasa bilgisayar deniz müze".split()
+    pool = [
+        " ".join(rng.choices(words, k=12)) for _ in range(max(1, int(args.texts * args.unique)))
+    ]
+    texts = pool + rng.choices(pool, k=args.texts - len(pool))
+
+    with StandInModelServer(
+        latency=args.latency,
+        per_text_latency=args.per_text_latency,
+        error_rate=args.error_rate,
+    ) as server:
+        for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+            client = AsyncBatchClassifier(
+                HTTPBackend(server.url),
+                batch_size=batch_size,
+                max_concurrency=args.concurrency,
+                target_latency=args.target_latency,
+                backoff_base=0.05,
+            )
+            client.classify(texts)
+            print(f"başlangıç grup boyutu {batch_size}: {json.dumps(client.report())}")
+            client.backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,26 @@
 """
 data4tr - Text Classification Module
 AI yardımıyla metinleri kategorilere ayıran modül.
+
+Model türleri:
+- rule-based: anahtar kelime indeksi (varsayılan)
+- hashed-nb: etiketli veriyle eğitilmiş hash'lenmiş Naive Bayes (bkz. hashed_model.py)
+- gpt-4, claude, local-llm: AI modelleri
 """
 
 import json
 import logging
+from pathlib import Path
 from typing import Dict, List, Optional
 
-logging.basicConfig(level=logging.INFO)
+from data4tr.algorithms.keywords import KeywordIndex
+from data4tr.algorithms.turkish import turkish_fold
+
 logger = logging.getLogger(__name__)
 
+# hashed-nb modelinin varsayılan ağırlık dosyası (cli.py train ile oluşturulur)
+DEFAULT_MODEL_PATH = "data/models/hashed_nb.npz"
+
 
 # Önceden tanımlanmış kategoriler
 CATEGORIES = [
@@ -27,52 +38,92 @@ CATEGORIES = [
     "genel",
 ]
 
+# Kategori anahtar kelimeleri (metinde geçen farklı kelime sayısı kategori skorudur)
+KEYWORDS = {
+    "bilim": ["bilim", "araştırma", "deney", "hipotez", "teori", "fizik", "kimya"],
+    "teknoloji": ["teknoloji", "yazılım", "donanım", "bilgisayar", "internet", "dijital"],
+    "edebiyat": ["edebiyat", "roman", "şiir", "yazar", "kitap", "eser"],
+    "kültür": ["kültür", "gelenek", "görenek", "folklor", "milli"],
+    "tarih": ["tarih", "geçmiş", "tarihi", "savaş", "imparatorluk", "devlet"],
+    "coğrafya": ["coğrafya", "ülke", "şehir", "iklim", "dağ", "deniz"],
+    "sanat": ["sanat", "resim", "heykel", "müze", "galeri", "sanatçı"],
+    "spor": ["spor", "futbol", "basketbol", "oyuncu", "maç", "takım"],
+    "ekonomi": ["ekonomi", "finans", "para", "bank", "ticaret", "piyasa"],
+    "eğitim": ["eğitim", "okul", "öğrenci", "ders", "sınav", "üniversite"],
+    "sağlık": ["sağlık", "tedavi", "hastalık", "doktor", "ilaç", "hastane"],
+}
+
 
 class TextClassifier:
     """Metin sınıflandırma sınıfı"""
 
-    def __init__(self, model: Optional[str] = None):
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        keywords: Optional[Dict[str, List[str]]] = None,
+        word_boundary: bool = False,
+        model_path: Optional[str] = None,
+        ai_client=None,
+        ai_config: Optional[Dict] = None,
+    ):
         """
         Args:
-            model: AI model adı (örn: gpt-4, claude, local-llm)
+            model: Model adı (örn: rule-based, hashed-nb, gpt-4, claude, local-llm)
+            keywords: Kategori -> anahtar kelimeler (varsayılan: KEYWORDS)
+            word_boundary: Anahtar kelimeler yalnızca tam kelime olarak eşleşsin
+                (varsayılan: kelime içinde de eşleşir, ör. "tarih" -> "tarihte")
+            model_path: hashed-nb ağırlık dosyası (varsayılan: DEFAULT_MODEL_PATH)
+            ai_client: AI modelleri için AsyncBatchClassifier (varsayılan: ilk kullanımda
+                processing.classification.ai konfigürasyonundan oluşturulur)
+            ai_config: processing.classification.ai yerine kullanılacak ayarlar
         """
         self.model = model or "rule-based"
         self.categories = CATEGORIES
-
-    def classify_with_keywords(self, text: str) -> Dict[str, any]:
+        self.keywords = keywords if keywords is not None else KEYWORDS
+        # Anahtar kelimeler bir kez tek bir indekse derlenir (bkz. KeywordIndex)
+        self.keyword_index = KeywordIndex(self.keywords, word_boundary=word_boundary)
+
+        self.hashed_model = None
+        if self.model == "hashed-nb":
+            self.hashed_model = self._load_hashed_model(model_path or DEFAULT_MODEL_PATH)
+
+        self.ai_client = ai_client
+        self.ai_config = ai_config
+        self._ai_configured = ai_client is not None
+
+    def _load_hashed_model(self, path: str):
+        """hashed-nb modelini yükle; dosya yoksa anahtar kelime sınıflandırmaya düşülür"""
+        if not Path(path).exists():
+            logger.warning(
+                f"Model dosyası bulunamadı: {path} (önce 'cli.py train' çalıştırın), "
+                "keyword-based fallback kullanılıyor"
+            )
+            return None
+
+        from .hashed_model import HashedNBModel
+
+        model = HashedNBModel.load(path)
+        logger.info(f"✓ Model yüklendi: {path} ({len(model.labels)} sınıf)")
+        return model
+
+    def classify_with_keywords(self, text: str, folded: Optional[str] = None) -> Dict[str, any]:
         """
         Anahtar kelimelere dayalı basit sınıflandırma
 
         Args:
             text: Sınıflandırılacak metin
+            folded: Önceden hesaplanmış turkish_fold(text) (varsa yeniden hesaplanmaz)
 
         Returns:
             Kategori bilgileri içeren sözlük
         """
-        text_lower = text.lower()
-
-        # Kategori anahtar kelimeleri
-        keywords = {
-            "bilim": ["bilim", "araştırma", "deney", "hipotez", "teori", "fizik", "kimya"],
-            "teknoloji": ["teknoloji", "yazılım", "donanım", "bilgisayar", "internet", "dijital"],
-            "edebiyat": ["edebiyat", "roman", "şiir", "yazar", "kitap", "eser"],
-            "kültür": ["kültür", "gelenek", "görenek", "folklor", "milli"],
-            "tarih": ["tarih", "geçmiş", "tarihi", "savaş", "imparatorluk", "devlet"],
-            "coğrafya": ["coğrafya", "ülke", "şehir", "iklim", "dağ", "deniz"],
-            "sanat": ["sanat", "resim", "heykel", "müze", "galeri", "sanatçı"],
-            "spor": ["spor", "futbol", "basketbol", "oyuncu", "maç", "takım"],
-            "ekonomi": ["ekonomi", "finans", "para", "bank", "ticaret", "piyasa"],
-            "eğitim": ["eğitim", "okul", "öğrenci", "ders", "sınav", "üniversite"],
-            "sağlık": ["sağlık", "tedavi", "hastalık", "doktor", "ilaç", "hastane"],
-        }
-
-        scores = {}
-        for category, words in keywords.items():
-            score = sum(1 for word in words if word in text_lower)
-            scores[category] = score
+        text_lower = folded if folded is not None else turkish_fold(text)
+
+        # Tüm kategoriler metin üzerinde tek geçişte puanlanır
+        scores = self.keyword_index.score(text_lower, folded=True)
 
         # En yüksek skora sahip kategoriyi bul
-        if max(scores.values()) > 0:
+        if scores and max(scores.values()) > 0:
             top_category = max(scores, key=scores.get)
             confidence = scores[top_category] / len(text.split())
         else:
@@ -81,62 +132,148 @@ class TextClassifier:
 
         return {"category": top_category, "confidence": min(confidence, 1.0), "all_scores": scores}
 
+    def _get_ai_client(self):
+        """AI istemcisini konfigürasyondan bir kez oluştur (backend yoksa None)"""
+        if not self._ai_configured:
+            self._ai_configured = True
+            from data4tr.config import get_config
+
+            from .ai_client import AsyncBatchClassifier, create_backend
+
+            config = get_config()
+            ai_config = self.ai_config
+            if ai_config is None:
+                ai_config = config.get("processing.classification.ai", {}) or {}
+            backend = create_backend(self.model, ai_config, config.get("ai_models", {}))
+            if backend is None:
+                logger.warning(
+                    f"{self.model} için AI backend yapılandırılmamış "
+                    "(processing.classification.ai.endpoint), keyword-based fallback kullanılıyor"
+                )
+            else:
+                self.ai_client = AsyncBatchClassifier.from_config(
+                    backend,
+                    ai_config,
+                    categories=self.categories,
+                    fallback=self.classify_with_keywords,
+                )
+        return self.ai_client
+
     def classify_with_ai(self, text: str) -> Dict[str, any]:
         """
-        AI model kullanarak sınıflandırma (placeholder)
+        AI model kullanarak sınıflandırma
 
         Args:
             text: Sınıflandırılacak metin
 
         Returns:
-            AI'nın tahmin ettiği kategori
+            AI'nın tahmin ettiği kategori bilgileri
         """
-        # Bu fonksiyon ileride OpenAI, Anthropic veya local LLM ile implement edilecek
-        logger.warning(
-            "AI sınıflandırma henüz implement edilmedi, keyword-based fallback kullanılıyor"
-        )
-        return self.classify_with_keywords(text)
+        return self.classify_with_ai_batch([text])[0]
 
-    def classify(self, text: str) -> str:
+    def classify_with_ai_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Metin grubunu AI model ile sınıflandır
+
+        Metinler AsyncBatchClassifier ile gruplar halinde ve eşzamanlı olarak
+        gönderilir (bkz. ai_client.py); tekrar eden metinler bir kez gönderilir.
+        Backend yapılandırılmamışsa veya istekler başarısız olursa anahtar kelime
+        sınıflandırması kullanılır.
+
+        Args:
+            texts: Sınıflandırılacak metinler
+
+        Returns:
+            Her metin için kategori bilgileri içeren sözlük
+        """
+        client = self._get_ai_client()
+        if client is None:
+            return [self.classify_with_keywords(text) for text in texts]
+        return client.classify(texts)
+
+    def classify_with_model(self, text: str, folded: Optional[str] = None) -> Dict[str, any]:
+        """
+        Eğitilmiş hashed-nb modeli ile sınıflandırma
+
+        Args:
+            text: Sınıflandırılacak metin
+            folded: Önceden hesaplanmış turkish_fold(text)
+
+        Returns:
+            Kategori bilgileri içeren sözlük (model yüklenmediyse anahtar kelime sonucu)
+        """
+        return self.classify_many([text], None if folded is None else [folded])[0]
+
+    def classify_many(
+        self, texts: List[str], folded: Optional[List[str]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Metin grubunu sınıflandır
+
+        hashed-nb modelinde tüm grup tek seferde (toplu matris çarpımıyla), AI
+        modellerinde toplu ve eşzamanlı isteklerle sınıflandırılır; rule-based
+        modelde metinler tek tek sınıflandırılır.
+
+        Args:
+            texts: Sınıflandırılacak metinler
+            folded: Önceden hesaplanmış turkish_fold değerleri (texts ile aynı sırada)
+
+        Returns:
+            Her metin için kategori bilgileri içeren sözlük
+        """
+        if self.hashed_model is not None:
+            if folded is not None:
+                return self.hashed_model.predict(folded, folded=True)
+            return self.hashed_model.predict(texts)
+
+        if folded is None:
+            folded = [None] * len(texts)
+        if self.model not in ("rule-based", "hashed-nb"):
+            return self.classify_with_ai_batch(texts)
+        return [self.classify_with_keywords(text, fold) for text, fold in zip(texts, folded)]
+
+    def classify(self, text: str, folded: Optional[str] = None) -> str:
         """
         Metni sınıflandır (basit API)
 
         Args:
             text: Sınıflandırılacak metin
+            folded: Önceden hesaplanmış turkish_fold(text)
 
         Returns:
             Kategori adı
         """
-        if self.model and self.model != "rule-based":
+        if self.model == "hashed-nb":
+            result = self.classify_with_model(text, folded)
+        elif self.model and self.model != "rule-based":
             result = self.classify_with_ai(text)
         else:
-            result = self.classify_with_keywords(text)
+            result = self.classify_with_keywords(text, folded)
 
         return result["category"]
 
 
-def classify_batch(texts: List[str]) -> List[Dict]:
+def classify_batch(
+    texts: List[str], model: Optional[str] = None, model_path: Optional[str] = None
+) -> List[Dict]:
     """
     Birden fazla metni toplu olarak sınıflandır
 
     Args:
         texts: Sınıflandırılacak metinler listesi
+        model: Model adı (varsayılan: rule-based; hashed-nb toplu çıkarım yapar)
+        model_path: hashed-nb ağırlık dosyası
 
     Returns:
         Her metin için kategori bilgisi
     """
-    classifier = TextClassifier()
-    results = []
-
-    for text in texts:
-        category_info = classifier.classify_with_keywords(text)
-        results.append(category_info)
-
-    return results
+    classifier = TextClassifier(model=model, model_path=model_path)
+    return classifier.classify_many(texts)
 
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     classifier = TextClassifier()
 
     test_texts = [
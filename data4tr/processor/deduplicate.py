@@ -5,9 +5,10 @@ Yinelenen metinleri tespit eden ve temizleyen modül.
 
 import hashlib
 import logging
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
+
+from data4tr.algorithms.turkish import turkish_fold
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -17,18 +18,27 @@ class Deduplicator:
     def __init__(self):
         self.seen_hashes: Set[str] = set()
 
-    def generate_hash(self, text: str) -> str:
-        """Metinden hash oluştur"""
-        # Metni normalize et (küçük harf, boşluk temizliği)
-        normalized = text.lower().strip()
+    def generate_hash(self, text: str, folded: Optional[str] = None) -> str:
+        """
+        Metinden hash oluştur
+
+        Args:
+            text: Metin
+            folded: Önceden hesaplanmış turkish_fold(text) (varsa yeniden hesaplanmaz)
+
+        Returns:
+            MD5 hash
+        """
+        # Metni normalize et (Türkçe küçük harf + NFC, boşluk temizliği)
+        normalized = folded if folded is not None else turkish_fold(text)
         normalized = " ".join(normalized.split())
 
         # MD5 hash
         return hashlib.md5(normalized.encode("utf-8")).hexdigest()
 
-    def is_duplicate(self, text: str) -> bool:
-        """Metin daha önce görüldü mü kontrol et"""
-        text_hash = self.generate_hash(text)
+    def is_duplicate(self, text: str, folded: Optional[str] = None) -> bool:
+        """Metin daha önce görüldü mü kontrol et (folded: bkz. generate_hash)"""
+        text_hash = self.generate_hash(text, folded)
 
         if text_hash in self.seen_hashes:
             return True
@@ -55,12 +65,13 @@ class Deduplicator:
 
         return duplicate_indices
 
-    def remove_duplicates(self, data: List[Dict]) -> List[Dict]:
+    def remove_duplicates(self, data: List[Dict], folded: Optional[List[str]] = None) -> List[Dict]:
         """
         Veri setinden duplicate kayıtları kaldır
 
         Args:
             data: Kayıtların listesi (her kayıt 'text' alanına sahip olmalı)
+            folded: Kayıtlarla aynı sıradaki katlanmış metinler (bkz. fold_records)
 
         Returns:
             Duplicate'leri temizlenmiş kayıt listesi
@@ -69,12 +80,12 @@ class Deduplicator:
         unique_data = []
         removed_count = 0
 
-        for record in data:
+        for index, record in enumerate(data):
             if "text" not in record:
                 continue
 
             text = record["text"]
-            if not self.is_duplicate(text):
+            if not self.is_duplicate(text, folded[index] if folded is not None else None):
                 unique_data.append(record)
             else:
                 removed_count += 1
@@ -121,6 +132,7 @@ def remove_exact_duplicates(data: List[Dict]) -> List[Dict]:
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     deduplicator = Deduplicator()
 
     test_data = [
@@ -0,0 +1,400 @@
+"""
+data4tr - Hashed Naive Bayes Classifier
+Kelime ve karakter n-gram özelliklerini hash'leyerek çalışan, NumPy ile toplu
+çıkarım yapan çok terimli (multinomial) Naive Bayes sınıflandırıcı.
+
+Özellikler sözlük tutulmadan sabit boyutlu bir uzaya hash'lenir:
+- kelimeler ve ardışık kelime çiftleri,
+- UTF-8 byte n-gramları (Türkçe harfler 2 byte olduğundan 4 byte ~ 2-4 harf; ekler
+  ve kök parçaları kelime ayrımı yapılmadan yakalanır).
+
+Metin grubu turkish_fold ile katlanıp tek bir byte dizisine birleştirilir; tüm
+n-gram ve kelime hash'leri bu dizi üzerinde önek toplamlarıyla (polinom hash,
+mod 2^64) Python döngüsü olmadan hesaplanır. Çıkarım, seyrek (belge x özellik)
+sayım matrisi ile yoğun (özellik x sınıf) log-olasılık matrisinin çarpımıdır;
+çarpım sınıf başına np.bincount ile yapılır, ara matris oluşturulmaz.
+
+Ağırlıklar float16 olarak sıkıştırılmış .npz dosyasına kaydedilir.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data4tr.algorithms.turkish import turkish_fold
+
+logger = logging.getLogger(__name__)
+
+_PRIME = 0x100000001B3  # FNV-64 asalı (tek sayı, 2^64 modunda tersi vardır)
+_PRIME_INVERSE = pow(_PRIME, -1, 2**64)
+_MIX = np.uint64(0x9E3779B97F4A7C15)  # Fibonacci hashing çarpanı
+_PAIR = np.uint64(0xC2B2AE3D27D4EB4F)
+
+# Özellik türlerinin aynı hash'te çakışmaması için tuzlar
+_SALTS = {"word": 0x51ED270B, "pair": 0x2545F491, "ngram": 0x6C8E9CF5}
+
+_SEPARATOR = 0  # Belge ayırıcı byte
+
+# Kelime karakteri sayılan byte'lar: ASCII harf/rakam ve tüm çok byte'lı UTF-8 karakterler
+_WORD_BYTES = np.zeros(256, dtype=bool)
+for _byte in b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789":
+    _WORD_BYTES[_byte] = True
+_WORD_BYTES[0x80:] = True
+
+
+_POWER_CACHE: Dict[int, np.ndarray] = {}
+
+
+def _powers(base: int, count: int) -> np.ndarray:
+    """base^0 .. base^(count-1) (mod 2^64); tablo gruplar arasında önbelleklenir"""
+    table = _POWER_CACHE.get(base)
+    if table is None or len(table) < count:
+        size = 1 << max(16, (count - 1).bit_length())
+        table = np.full(size, base, dtype=np.uint64)
+        table[0] = 1
+        table = np.cumprod(table, dtype=np.uint64)
+        _POWER_CACHE[base] = table
+    return table[:count]
+
+
+class HashedNBModel:
+    """
+    Hash'lenmiş özellikli çok terimli Naive Bayes modeli
+
+    Örnek:
+        model = HashedNBModel.train_jsonl("data/labeled.jsonl")
+        model.save("data/models/hashed_nb.npz")
+        model = HashedNBModel.load("data/models/hashed_nb.npz")
+        results = model.predict(texts)  # [{"category", "confidence", "all_scores"}, ...]
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        n_features: int = 2**18,
+        ngrams: Sequence[int] = (4,),
+        word_pairs: bool = True,
+        alpha: float = 1.0,
+    ):
+        """
+        Args:
+            labels: Sınıf adları
+            n_features: Hash uzayı boyutu (2'nin kuvvetine yuvarlanır)
+            ngrams: Byte n-gram uzunlukları
+            word_pairs: Ardışık kelime çiftlerini de özellik olarak kullan
+            alpha: Laplace yumuşatma katsayısı
+        """
+        self.labels = list(labels)
+        self.bits = max(4, int(n_features - 1).bit_length())
+        self.n_features = 1 << self.bits
+        self.ngrams = tuple(int(n) for n in ngrams)
+        self.word_pairs = bool(word_pairs)
+        self.alpha = float(alpha)
+
+        # Son satır sınıf ön olasılıkları (her belgeye bir kez eklenen "bias" özelliği)
+        self.counts = np.zeros((len(self.labels), self.n_features + 1), dtype=np.float64)
+        self.weights: Optional[np.ndarray] = None
+        self.stats = {"documents": 0, "seconds": 0.0}
+
+    # --- Özellik çıkarımı ---
+
+    def features(self, texts: Sequence[str], folded: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metin grubunun hash'lenmiş özellikleri (seyrek matrisin koordinat biçimi)
+
+        Args:
+            texts: Metinler
+            folded: Metinler zaten turkish_fold ile katlanmış mı
+
+        Returns:
+            (belge indeksleri, özellik indeksleri); her belge için bir bias
+            özelliği (indeks n_features) dahildir
+        """
+        prepared = []
+        for text in texts:
+            text = (text or "") if folded else turkish_fold(text or "")
+            prepared.append(text.replace("\x00", " ") if "\x00" in text else text)
+
+        data = np.frombuffer(("\x00".join(prepared) + "\x00").encode("utf-8"), dtype=np.uint8)
+        size = len(data)
+        separator = data == _SEPARATOR
+        # Her byte'ın belge indeksi (ayırıcı, bitirdiği belgeye aittir)
+        doc_of = np.cumsum(separator) - separator
+
+        # Önek toplamı: G[i] = sum_{j<i} b[j] * P^-j; hash(l, r) = (G[r] - G[l]) * P^(r-1)
+        values = data.astype(np.uint64) + np.uint64(1)
+        prefix = np.zeros(size + 1, dtype=np.uint64)
+        np.cumsum(values * _powers(_PRIME_INVERSE, size), dtype=np.uint64, out=prefix[1:])
+        powers = _powers(_PRIME, size + 1)
+
+        def span_hash(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+            return (prefix[ends] - prefix[starts]) * powers[ends - 1]
+
+        doc_parts = [np.arange(len(texts))]
+        feature_parts = [np.full(len(texts), self.n_features, dtype=np.int32)]
+
+        # Byte n-gramları (ayırıcı içermeyenler)
+        for n in self.ngrams:
+            if size < n:
+                continue
+            starts = np.arange(size - n + 1)
+            valid = doc_of[starts] == doc_of[starts + n - 1]
+            valid &= ~separator[starts + n - 1]
+            starts = starts[valid]
+            hashes = span_hash(starts, starts + n) ^ np.uint64(_SALTS["ngram"] + n)
+            doc_parts.append(doc_of[starts])
+            feature_parts.append(self._bucket(hashes))
+
+        # Kelimeler ve kelime çiftleri
+        is_word = _WORD_BYTES[data]
+        edges = np.diff(np.concatenate(([False], is_word, [False])).astype(np.int8))
+        word_starts = np.flatnonzero(edges == 1)
+        word_ends = np.flatnonzero(edges == -1)
+        if len(word_starts):
+            word_hashes = span_hash(word_starts, word_ends)
+            word_docs = doc_of[word_starts]
+            doc_parts.append(word_docs)
+            feature_parts.append(self._bucket(word_hashes ^ np.uint64(_SALTS["word"])))
+
+            if self.word_pairs and len(word_starts) > 1:
+                same_doc = word_docs[1:] == word_docs[:-1]
+                pairs = word_hashes[:-1][same_doc] * _PAIR + word_hashes[1:][same_doc]
+                doc_parts.append(word_docs[1:][same_doc])
+                feature_parts.append(self._bucket(pairs ^ np.uint64(_SALTS["pair"])))
+
+        return np.concatenate(doc_parts), np.concatenate(feature_parts)
+
+    def _bucket(self, hashes: np.ndarray) -> np.ndarray:
+        """64 bit hash'i özellik indeksine indir (Fibonacci hashing)"""
+        return ((hashes * _MIX) >> np.uint64(64 - self.bits)).astype(np.int32)
+
+    # --- Eğitim ---
+
+    def partial_fit(self, texts: Sequence[str], labels: Sequence[str]) -> "HashedNBModel":
+        """
+        Sayımlara yeni etiketli metinler ekle
+
+        Args:
+            texts: Metinler
+            labels: Etiketler (self.labels içinde olmalı)
+
+        Returns:
+            self
+        """
+        index = {label: i for i, label in enumerate(self.labels)}
+        classes = np.array([index[label] for label in labels], dtype=np.int64)
+        docs, features = self.features(texts)
+
+        width = self.n_features + 1
+        flat = np.bincount(classes[docs] * width + features, minlength=len(self.labels) * width)
+        self.counts += flat.reshape(len(self.labels), width)
+        self.weights = None
+        return self
+
+    def finalize(self) -> "HashedNBModel":
+        """Sayımlardan log-olasılık ağırlıklarını hesapla"""
+        counts = self.counts[:, : self.n_features]
+        smoothed = counts + self.alpha
+        log_likelihood = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+
+        documents = self.counts[:, self.n_features]
+        log_prior = np.log(documents + 1.0) - np.log(documents.sum() + len(self.labels))
+
+        self.weights = np.empty((len(self.labels), self.n_features + 1), dtype=np.float32)
+        self.weights[:, : self.n_features] = log_likelihood
+        self.weights[:, self.n_features] = log_prior
+        return self
+
+    @classmethod
+    def train(
+        cls, texts: Sequence[str], labels: Sequence[str], batch_size: int = 4096, **options
+    ) -> "HashedNBModel":
+        """
+        Etiketli metinlerden model eğit
+
+        Args:
+            texts: Metinler
+            labels: Etiketler
+            batch_size: Özellik çıkarımı grup boyutu
+            **options: HashedNBModel parametreleri
+
+        Returns:
+            Eğitilmiş model
+        """
+        model = cls(sorted(set(labels)), **options)
+        for start in range(0, len(texts), batch_size):
+            model.partial_fit(texts[start : start + batch_size], labels[start : start + batch_size])
+        return model.finalize()
+
+    @classmethod
+    def train_jsonl(
+        cls,
+        path: Union[str, Path],
+        text_field: str = "text",
+        label_field: str = "category",
+        batch_size: int = 4096,
+        **options,
+    ) -> "HashedNBModel":
+        """
+        Etiketli JSONL dosyasından model eğit
+
+        Dosya iki kez satır satır okunur (önce etiket kümesi, sonra sayımlar);
+        bellek kullanımı dosya boyutundan bağımsızdır.
+
+        Args:
+            path: Her satırı {text_field: ..., label_field: ...} olan JSONL dosyası
+            text_field: Metin alanı
+            label_field: Etiket alanı
+            batch_size: Özellik çıkarımı grup boyutu
+            **options: HashedNBModel parametreleri
+
+        Returns:
+            Eğitilmiş model
+        """
+        labels = sorted({label for _, label in _read_labeled(path, text_field, label_field)})
+        if not labels:
+            raise ValueError(f"Etiketli kayıt bulunamadı: {path}")
+
+        model = cls(labels, **options)
+        batch: List[Tuple[str, str]] = []
+        for pair in _read_labeled(path, text_field, label_field):
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                model.partial_fit(*zip(*batch))
+                batch = []
+        if batch:
+            model.partial_fit(*zip(*batch))
+
+        documents = int(model.counts[:, model.n_features].sum())
+        logger.info(f"✓ Model eğitildi: {documents} kayıt, {len(labels)} sınıf")
+        return model.finalize()
+
+    # --- Çıkarım ---
+
+    def decision_function(self, texts: Sequence[str], folded: bool = False) -> np.ndarray:
+        """
+        Sınıf başına log-olasılık skorları
+
+        Args:
+            texts: Metinler
+            folded: Metinler zaten turkish_fold ile katlanmış mı
+
+        Returns:
+            (metin sayısı x sınıf sayısı) matris
+        """
+        if self.weights is None:
+            self.finalize()
+        docs, features = self.features(texts, folded)
+        scores = np.empty((len(texts), len(self.labels)), dtype=np.float64)
+        for column, weights in enumerate(self.weights):
+            scores[:, column] = np.bincount(
+                docs, weights=weights.take(features), minlength=len(texts)
+            )
+        return scores
+
+    def predict_proba(self, texts: Sequence[str], folded: bool = False) -> np.ndarray:
+        """Sınıf olasılıkları (softmax)"""
+        scores = self.decision_function(texts, folded)
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(
+        self, texts: Sequence[str], batch_size: int = 2048, folded: bool = False
+    ) -> List[Dict]:
+        """
+        Metin grubunu sınıflandır
+
+        Args:
+            texts: Metinler
+            batch_size: Tek matris çarpımında işlenecek metin sayısı (ara diziler
+                işlemci önbelleğine sığacak kadar küçük tutulur)
+            folded: Metinler zaten turkish_fold ile katlanmış mı
+
+        Returns:
+            Metin başına {"category", "confidence", "all_scores"} (TextClassifier ile aynı biçim)
+        """
+        start = time.perf_counter()
+        results = []
+        for offset in range(0, len(texts), batch_size):
+            probabilities = self.predict_proba(texts[offset : offset + batch_size], folded)
+            best = probabilities.argmax(axis=1)
+            for row, top in zip(probabilities.tolist(), best.tolist()):
+                results.append(
+                    {
+                        "category": self.labels[top],
+                        "confidence": row[top],
+                        "all_scores": dict(zip(self.labels, row)),
+                    }
+                )
+        self.stats["documents"] += len(results)
+        self.stats["seconds"] += time.perf_counter() - start
+        return results
+
+    # --- Kaydetme / yükleme ---
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Ağırlıkları float16 olarak sıkıştırılmış .npz dosyasına kaydet
+
+        Args:
+            path: Dosya yolu
+
+        Returns:
+            Kaydedilen dosya yolu
+        """
+        if self.weights is None:
+            self.finalize()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        config = {
+            "labels": self.labels,
+            "n_features": self.n_features,
+            "ngrams": list(self.ngrams),
+            "word_pairs": self.word_pairs,
+            "alpha": self.alpha,
+        }
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f, weights=self.weights.astype(np.float16), config=np.array(json.dumps(config))
+            )
+        logger.info(f"✓ Model kaydedildi: {path} ({path.stat().st_size} byte)")
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "HashedNBModel":
+        """
+        Kaydedilmiş modeli yükle
+
+        Args:
+            path: save ile oluşturulmuş .npz dosyası
+
+        Returns:
+            Çıkarıma hazır model (sayımlar yüklenmez)
+        """
+        with np.load(path) as archive:
+            config = json.loads(str(archive["config"]))
+            weights = archive["weights"].astype(np.float32)
+        model = cls(**config)
+        model.counts = np.zeros((0, 0))
+        model.weights = weights
+        return model
+
+
+def _read_labeled(
+    path: Union[str, Path], text_field: str, label_field: str
+) -> Iterator[Tuple[str, str]]:
+    """JSONL dosyasından (metin, etiket) çiftleri; eksik alanlı satırlar atlanır"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            text, label = record.get(text_field), record.get(label_field)
+            if text and label:
+                yield text, str(label)
@@ -0,0 +1,335 @@
+"""
+data4tr - Correction Lexicon
+Büyük yazım düzeltme sözlüklerini (asciileştirilmiş biçimler, yaygın yazım hataları)
+bellek eşlemeli (mmap) bir dosyadan okuyan düzeltme modülü.
+
+Sözlük bir kez ikili biçime derlenir:
+
+    başlık   : magic, sürüm, kayıt sayısı, kova sayısı
+    kovalar  : kova başına (crc32, kayıt ofseti + 1); açık adresleme, doluluk <= %50
+    kayıtlar : kayıt başına (anahtar uzunluğu, değer uzunluğu, anahtar, değer), UTF-8
+
+Dosya mmap ile salt okunur açılır; sözlük Python nesnelerine yüklenmez. Aynı
+dosyayı açan bütün işlemler (worker process'ler dahil) işletim sisteminin sayfa
+önbelleğindeki tek kopyayı paylaşır. Lexicon nesnesi pickle edilirken yalnızca
+dosya yolu taşınır, worker tarafında dosya yeniden eşlenir.
+
+Metin bir kez kelimelere ayrılır ve her kelime için tek bir hash araması yapılır.
+"""
+
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from data4tr.algorithms.turkish import turkish_fold, turkish_upper
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"D4TRLEX\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")  # magic, sürüm, ayrılmış, kayıt sayısı, kova sayısı
+_BUCKET = struct.Struct("<II")  # crc32, kayıt ofseti + 1 (0: boş kova)
+_ENTRY = struct.Struct("<HH")  # anahtar ve değer uzunluğu (byte)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def read_tsv(path: Union[str, Path]) -> Iterator[Tuple[str, str]]:
+    """
+    Sekmeyle ayrılmış sözlük dosyasını oku
+
+    Her satır "yanlış<TAB>doğru" biçimindedir; boş satırlar ve # ile başlayan
+    satırlar atlanır.
+
+    Args:
+        path: TSV dosya yolu
+
+    Yields:
+        (yanlış, doğru) çiftleri
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            parts = line.split("\t")
+            if len(parts) < 2:
+                logger.warning(f"Geçersiz sözlük satırı atlandı ({path}:{line_number})")
+                continue
+            yield parts[0].strip(), parts[1].strip()
+
+
+class Lexicon:
+    """
+    Bellek eşlemeli düzeltme sözlüğü (salt okunur)
+
+    Örnek:
+        Lexicon.build(read_tsv("duzeltmeler.tsv"), "data/lexicon.bin")
+        with Lexicon("data/lexicon.bin") as lexicon:
+            lexicon.get("Istanbul")  # "İstanbul"
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Lexicon.build ile oluşturulmuş sözlük dosyası
+
+        Raises:
+            ValueError: Dosya biçimi geçersiz
+        """
+        self.path = Path(path)
+        self._open()
+
+    def _open(self) -> None:
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self._count, buckets = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Geçersiz sözlük dosyası: {self.path}")
+        self._mask = buckets - 1
+        self._buckets = _HEADER.size
+        self._entries = _HEADER.size + buckets * _BUCKET.size
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str]], path: Union[str, Path]) -> "Lexicon":
+        """
+        Sözlüğü ikili biçime derle
+
+        Aynı anahtar birden fazla kez geçerse son değer kullanılır; anahtarı ile
+        değeri aynı olan kayıtlar atlanır. Dosya geçici dosyaya yazılıp atomik
+        olarak yer değiştirilir.
+
+        Args:
+            entries: (yanlış, doğru) çiftleri
+            path: Çıktı dosyası
+
+        Returns:
+            Açılmış Lexicon
+        """
+        table: Dict[bytes, bytes] = {}
+        for source, target in entries:
+            if source and source != target:
+                table[source.encode("utf-8")] = target.encode("utf-8")
+
+        bucket_count = 1
+        while bucket_count < 2 * max(1, len(table)):
+            bucket_count *= 2
+        mask = bucket_count - 1
+
+        buckets = bytearray(bucket_count * _BUCKET.size)
+        data = bytearray()
+        count = 0
+        for key, value in table.items():
+            if len(key) > 0xFFFF or len(value) > 0xFFFF:
+                logger.warning(f"Çok uzun sözlük kaydı atlandı: {key[:40]!r}")
+                continue
+            checksum = zlib.crc32(key)
+            index = checksum & mask
+            while _BUCKET.unpack_from(buckets, index * _BUCKET.size)[1]:
+                index = (index + 1) & mask
+            _BUCKET.pack_into(buckets, index * _BUCKET.size, checksum, len(data) + 1)
+            data += _ENTRY.pack(len(key), len(value)) + key + value
+            count += 1
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, count, bucket_count))
+            f.write(buckets)
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        logger.info(f"✓ Sözlük derlendi: {path} ({count} kayıt, {path.stat().st_size} byte)")
+        return cls(path)
+
+    def get(self, word: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Kelimenin düzeltmesini bul
+
+        Args:
+            word: Kelime (birebir eşleşme)
+            default: Sözlükte yoksa dönecek değer
+
+        Returns:
+            Düzeltilmiş kelime veya default
+        """
+        key = word.encode("utf-8")
+        checksum = zlib.crc32(key)
+        index = checksum & self._mask
+        mm = self._mm
+        while True:
+            stored, offset = _BUCKET.unpack_from(mm, self._buckets + index * _BUCKET.size)
+            if not offset:
+                return default
+            if stored == checksum:
+                position = self._entries + offset - 1
+                key_length, value_length = _ENTRY.unpack_from(mm, position)
+                position += _ENTRY.size
+                if mm[position : position + key_length] == key:
+                    position += key_length
+                    return mm[position : position + value_length].decode("utf-8")
+            index = (index + 1) & self._mask
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Dosya eşlemesini kapat"""
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __getstate__(self) -> Dict:
+        # Worker process'lere sözlük içeriği değil yalnızca yol gönderilir
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.path = state["path"]
+        self._open()
+
+
+class LexiconCorrector:
+    """
+    Sözlük tabanlı yazım düzeltici
+
+    Metin bir kez kelimelere ayrılır; her kelime önce olduğu gibi, bulunamazsa
+    küçük harfli biçimiyle aranır ve düzeltme kelimenin büyük/küçük harf
+    biçimine uyarlanır ("ISTANBUL" -> "İSTANBUL", "Istanbul" -> "İstanbul").
+    Sık geçen kelimeler için sınırlı bir işlem içi önbellek tutulur.
+
+    Örnek:
+        corrector = LexiconCorrector(Lexicon("data/lexicon.bin"))
+        corrector.correct("Istanbul cok guzel")
+    """
+
+    def __init__(self, lexicon: Lexicon, cache_size: int = 100_000):
+        """
+        Args:
+            lexicon: Düzeltme sözlüğü
+            cache_size: Önbellekte tutulacak en fazla kelime (0: önbellek yok)
+        """
+        self.lexicon = lexicon
+        self.cache_size = max(0, int(cache_size))
+        self._cache: Dict[str, str] = {}
+        self.stats = {"texts": 0, "tokens": 0, "corrections": 0, "seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> Optional["LexiconCorrector"]:
+        """
+        processing.normalization.lexicon bölümünden düzeltici oluştur
+
+        Args:
+            config: {"path", "cache_size"}
+
+        Returns:
+            LexiconCorrector veya (yol yoksa ya da dosya bulunamazsa) None
+        """
+        config = config or {}
+        path = config.get("path")
+        if not path:
+            return None
+        if not Path(path).exists():
+            logger.warning(f"Düzeltme sözlüğü bulunamadı: {path}")
+            return None
+        return cls(Lexicon(path), cache_size=config.get("cache_size", 100_000))
+
+    def lookup(self, token: str) -> str:
+        """
+        Tek kelimenin düzeltilmiş hali
+
+        Args:
+            token: Kelime
+
+        Returns:
+            Düzeltme (sözlükte yoksa kelimenin kendisi)
+        """
+        cached = self._cache.get(token)
+        if cached is not None:
+            return cached
+
+        corrected = self.lexicon.get(token)
+        if corrected is None and not token.islower():
+            # Büyük harfli kelime için sözlük anahtarının olası biçimleri: Türkçe küçük
+            # harf ("ISTANBUL" -> "ıstanbul"), ASCII küçük harf ("istanbul") ve ilk harfi
+            # korunmuş başlık biçimi ("Istanbul")
+            for key in dict.fromkeys(
+                (turkish_fold(token), token.lower(), token[0] + turkish_fold(token[1:]))
+            ):
+                if key != token:
+                    corrected = self.lexicon.get(key)
+                    if corrected is not None:
+                        break
+            if corrected is not None:
+                if len(token) > 1 and token.isupper():
+                    corrected = turkish_upper(corrected)
+                elif token[0].isupper():
+                    corrected = turkish_upper(corrected[0]) + corrected[1:]
+        if corrected is None:
+            corrected = token
+
+        if self.cache_size:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[token] = corrected
+        return corrected
+
+    def correct(self, text: str) -> str:
+        """
+        Metindeki kelimeleri sözlükle düzelt
+
+        Args:
+            text: Metin
+
+        Returns:
+            Düzeltilmiş metin
+        """
+        if not text:
+            return ""
+
+        counts = [0, 0]
+
+        def replace(match: re.Match) -> str:
+            token = match.group()
+            corrected = self.lookup(token)
+            counts[0] += 1
+            if corrected != token:
+                counts[1] += 1
+            return corrected
+
+        text = _TOKEN_PATTERN.sub(replace, text)
+        self.stats["tokens"] += counts[0]
+        self.stats["corrections"] += counts[1]
+        return text
+
+    def correct_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Metin grubunu düzelt
+
+        Args:
+            texts: Metinler
+
+        Returns:
+            Düzeltilmiş metinler (aynı sırada)
+        """
+        start = time.perf_counter()
+        results = [self.correct(text) for text in texts]
+        self.stats["texts"] += len(results)
+        self.stats["seconds"] += time.perf_counter() - start
+        return results
@@ -5,11 +5,149 @@ Türkçe metinleri normalize eden ve dil kurallarına uygun hale getiren modül.
 
 import re
 import logging
-from typing import List
+import time
+from typing import Dict, Iterable, List
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Türkçe karakter düzeltmeleri
+CHAR_MAP = {
+    "Î": "İ",
+    "î": "ı",
+    "I": "I",  # İngilizce büyük I
+}
+
+# İngilizce -> Türkçe tırnaklar. Açılış ve kapanış tırnakları aynı karakter olduğundan
+# sözlükte kapanış eşlemeleri geçerli olur.
+QUOTE_MAP = {
+    '"': "\u201c",  # Açılış tırnağı
+    '"': "\u201d",  # Kapanış tırnağı
+    "'": "\u2018",  # Tek tırnak açılış
+    "'": "\u2019",  # Tek tırnak kapanış
+}
+
+# Yaygın yazım hataları (IGNORECASE ile uygulanır)
+COMMON_MISTAKES = {
+    # Kelime başında hatalı İ/ı kullanımı
+    r"\bıntemet\b": "internet",
+    r"\bımza\b": "imza",
+    r"\bItırbul\b": "İstanbul",
+}
+
+_PUNCTUATION = ".,;:!?"
+
+
+class CompiledNormalizer:
+    """
+    TextNormalizer.normalize için önceden derlenmiş normalizasyon motoru
+
+    Tüm tablolar ve desenler nesne oluşturulurken bir kez hazırlanır:
+    - CHAR_MAP ve QUOTE_MAP tek bir karakter eşlemesinde (str.translate tablosu)
+      birleştirilir; tırnaklar kelime karakteri olmadığından yazım düzeltmelerinden
+      önce uygulanabilir. Hiçbir çıktı başka bir anahtar içermiyorsa eşleme, ASCII
+      dışı metinlerde translate'ten çok daha hızlı olan str.replace ile uygulanır,
+    - COMMON_MISTAKES tek bir alternation deseninde birleştirilir; eşleşen grubun adı
+      ile düzeltme sözlükten bulunur (hiçbir düzeltme başka bir desene uymadığından
+      sıralı uygulamayla aynı sonucu verir). Desenin başındaki ilk harf sınıfı, motorun
+      kelime sınırı ve alternation denemesini yalnızca aday konumlarda yapmasını sağlar,
+    - noktalama öncesi boşluk silme ve sonrası boşluk ekleme tek geçişte yapılır:
+      noktalamadan sonraki boşluklar korunacaksa (arkalarından başka bir noktalama
+      gelmiyorsa) bu boşluklardan ilki eşleşmeye dahil edilip geri yazılır, böylece
+      her eşleşme aynı "\\1 " şablonuyla değiştirilir,
+    - boşluk adımları metinde ilgili işaret ("  ", satır sonu) yoksa atlanır.
+    Çıktı TextNormalizer.stepwise_normalize ile birebir aynıdır.
+    """
+
+    def __init__(self):
+        char_map = {key: value for key, value in {**CHAR_MAP, **QUOTE_MAP}.items() if key != value}
+        self.table = str.maketrans(char_map)
+        self._char_items = (
+            list(char_map.items())
+            if not any(key in value for key in char_map for value in char_map.values())
+            else None
+        )
+
+        self.corrections = {f"w{i}": repl for i, repl in enumerate(COMMON_MISTAKES.values())}
+        words = [pattern[2:-2] for pattern in COMMON_MISTAKES]
+        initials = re.escape("".join(sorted({word[0] for word in words})))
+        alternation = "|".join(f"(?P<w{i}>{word})" for i, word in enumerate(words))
+        self.mistake_pattern = re.compile(rf"(?=[{initials}])\b(?:{alternation})\b", re.IGNORECASE)
+
+        punct = re.escape(_PUNCTUATION)
+        self.punctuation_pattern = re.compile(rf" *([{punct}])(?: (?= *(?:[^ {punct}]|\Z)))?")
+        self.spaces_pattern = re.compile(r" +")
+        self.line_edges_pattern = re.compile(r"^ +| +$", re.MULTILINE)
+        self.newlines_pattern = re.compile(r"\n{3,}")
+        self.stats = {"texts": 0, "chars": 0, "seconds": 0.0}
+
+    def _correct(self, match: re.Match) -> str:
+        return self.corrections[match.lastgroup]
+
+    def normalize(self, text: str) -> str:
+        """
+        Tüm normalizasyon işlemlerini uygula (TextNormalizer.normalize ile aynı çıktı)
+
+        Args:
+            text: Metin
+
+        Returns:
+            Normalize edilmiş metin
+        """
+        if not text:
+            return ""
+
+        if self._char_items is None:
+            text = text.translate(self.table)
+        else:
+            for key, value in self._char_items:
+                if key in text:
+                    text = text.replace(key, value)
+        text = self.mistake_pattern.sub(self._correct, text)
+        text = self.punctuation_pattern.sub(r"\1 ", text)
+
+        if "  " in text:
+            text = self.spaces_pattern.sub(" ", text)
+        if "\n" in text:
+            text = self.line_edges_pattern.sub("", text)
+            if "\n\n\n" in text:
+                text = self.newlines_pattern.sub("\n\n", text)
+        return text.strip()
+
+    def normalize_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Metin grubunu normalize et ve verim istatistiklerini güncelle
+
+        Args:
+            texts: Metinler
+
+        Returns:
+            Normalize edilmiş metinler (aynı sırada)
+        """
+        start = time.perf_counter()
+        chars = 0
+        normalized = []
+        for text in texts:
+            chars += len(text) if text else 0
+            normalized.append(self.normalize(text))
+
+        self.stats["texts"] += len(normalized)
+        self.stats["chars"] += chars
+        self.stats["seconds"] += time.perf_counter() - start
+        return normalized
+
+    @property
+    def chars_per_second(self) -> float:
+        """Şimdiye kadar normalize_batch ile işlenen karakter/saniye"""
+        seconds = self.stats["seconds"]
+        return self.stats["chars"] / seconds if seconds > 0 else 0.0
+
+    def report(self) -> Dict:
+        """Toplam metin, karakter, süre ve karakter/saniye"""
+        return {**self.stats, "chars_per_second": round(self.chars_per_second, 1)}
+
+
+_NORMALIZER = CompiledNormalizer()
+
 
 class TextNormalizer:
     """Türkçe metin normalizasyon sınıfı"""
@@ -38,14 +176,7 @@ class TextNormalizer:
             return ""
 
         # Basit tırnak düzeltmesi
-        replacements = {
-            '"': "\u201c",  # Açılış tırnağı
-            '"': "\u201d",  # Kapanış tırnağı
-            "'": "\u2018",  # Tek tırnak açılış
-            "'": "\u2019",  # Tek tırnak kapanış
-        }
-
-        for old, new in replacements.items():
+        for old, new in QUOTE_MAP.items():
             text = text.replace(old, new)
 
         return text
@@ -75,13 +206,7 @@ class TextNormalizer:
             return ""
 
         # Karakter düzeltmeleri
-        char_map = {
-            "Î": "İ",
-            "î": "ı",
-            "I": "I",  # İngilizce büyük I
-        }
-
-        for old, new in char_map.items():
+        for old, new in CHAR_MAP.items():
             text = text.replace(old, new)
 
         return text
@@ -92,21 +217,19 @@ class TextNormalizer:
         if not text:
             return ""
 
-        mistakes = {
-            # Kelime başında hatalı İ/ı kullanımı
-            r"\bıntemet\b": "internet",
-            r"\bımza\b": "imza",
-            r"\bItırbul\b": "İstanbul",
-        }
-
-        for pattern, replacement in mistakes.items():
+        for pattern, replacement in COMMON_MISTAKES.items():
             text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
 
         return text
 
     @staticmethod
     def normalize(text: str) -> str:
-        """Tüm normalizasyon işlemlerini uygula"""
+        """Tüm normalizasyon işlemlerini uygula (derlenmiş motor ile, bkz. CompiledNormalizer)"""
+        return _NORMALIZER.normalize(text)
+
+    @staticmethod
+    def stepwise_normalize(text: str) -> str:
+        """Tüm normalizasyon işlemlerini adım adım uygula (normalize'ın referans tanımı)"""
         if not text:
             return ""
 
@@ -129,12 +252,12 @@ def normalize_batch(texts: List[str]) -> List[str]:
     Returns:
         Normalize edilmiş metinler listesi
     """
-    normalizer = TextNormalizer()
-    return [normalizer.normalize(text) for text in texts]
+    return _NORMALIZER.normalize_batch(texts)
 
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     normalizer = TextNormalizer()
 
     test_texts = [
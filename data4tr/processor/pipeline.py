@@ -0,0 +1,380 @@
+"""
+data4tr - Processing Pipeline
+processing.normalization.steps listesini bir kez derlenmiş, yeniden kullanılabilir
+bir işleme hattına dönüştüren modül.
+
+Her adım (remove_urls, clean_html, fix_whitespace, ...) TextCleaner / TextNormalizer
+metodlarıyla aynı sonucu veren temel işlemlerden (regex değiştirme, kırpma,
+karakter eşleme, ...) oluşur. Derleyici ardışık işlemleri birleştirir:
+- ardışık karakter eşlemeleri tek bir str.translate tablosuna,
+- ardışık tek karakter silme desenleri tek bir karakter sınıfına,
+- ardışık tam kelime düzeltmeleri tek bir alternation desenine,
+- "\\s+" -> " " ve ardından gelen kırpma tek bir split/join geçişine,
+- ardışık kırpmalar tek kırpmaya indirilir; boşluk daraltmadan sonra
+  satır sonu arayan işlemler atlanır.
+Sabit bir işaret içermeyen metinlerde ilgili işlem (ör. "<" yoksa etiket silme)
+hiç çalıştırılmaz. İstenirse işlem başına süreler ölçülür.
+"""
+
+import html
+import logging
+import re
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from data4tr.config import get_config
+from data4tr.scraper.cleaner import CleaningEngine
+from .normalize import CHAR_MAP, COMMON_MISTAKES, QUOTE_MAP, CompiledNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+class Op(NamedTuple):
+    """
+    Tek bir temel işlem
+
+    kind:
+        "sub" (pattern, repl; guard: metinde yoksa işlem değişiklik yapmaz),
+        "strip", "unescape", "chars" (tek karakter -> metin eşlemesi),
+        "delete" (pattern: tek karakterlik sınıf, eşleşenler silinir),
+        "words" (pattern -> repl tam kelime düzeltmeleri, flags),
+        "trim_lines" (satır başı/sonu boşlukları, ^ +| +$ çok satırlı deseni),
+        "collapse" (boşlukları daraltıp kırp), "call" (derlenmeyen fonksiyon)
+    """
+
+    kind: str
+    pattern: object = None
+    repl: object = None
+    guard: Optional[str] = None
+    flags: int = 0
+    label: str = ""
+
+
+_WHITESPACE = r"\s+"
+
+# Adım adı -> temel işlemler (TextCleaner / TextNormalizer metodlarıyla aynı sırada)
+STEPS: Dict[str, List[Op]] = {
+    # TextCleaner.remove_urls
+    "remove_urls": [
+        Op(
+            "sub",
+            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+            "",
+            guard="http",
+        ),
+        Op("strip"),
+    ],
+    # TextCleaner.clean_html
+    "clean_html": [Op("unescape"), Op("sub", r"<[^>]+>", "", guard="<"), Op("strip")],
+    # TextCleaner.remove_special_chars
+    "remove_special_chars": [Op("delete", r"[^a-zA-Z0-9çğıöşüÇĞIİÖŞÜ\s.,;:!?()\[\]{}'\"-]")],
+    # TextCleaner.clean_whitespace
+    "clean_whitespace": [
+        Op("sub", _WHITESPACE, " "),
+        Op("sub", r"\n+", "\n", guard="\n"),
+        Op("strip"),
+    ],
+    # TextCleaner.destructive_clean (zaten derlenmiş motor)
+    "destructive_clean": [Op("call", CleaningEngine().clean)],
+    # TextNormalizer.normalize_turkish_chars
+    "normalize_turkish_chars": [Op("chars", dict(CHAR_MAP))],
+    # TextNormalizer.fix_common_mistakes
+    "fix_common_mistakes": [Op("words", dict(COMMON_MISTAKES), flags=re.IGNORECASE)],
+    # TextNormalizer.fix_turkish_quotes (sözlükteki yinelenen anahtarlarla aynı sonuç)
+    "fix_quotes": [Op("chars", dict(QUOTE_MAP))],
+    # TextNormalizer.fix_punctuation_spacing; parantez kuralları eşleşmeyi aynen geri
+    # yazdığı için (metni değiştirmez) derlenmiş adımda yer almaz
+    "fix_punctuation": [
+        Op("sub", r" +([.,;:!?])", r"\1", guard=" "),
+        Op("sub", r"([.,;:!?])(?! )", r"\1 "),
+    ],
+    # TextNormalizer.normalize_whitespace
+    "fix_whitespace": [
+        Op("sub", r" +", " ", guard="  "),
+        Op("trim_lines"),
+        Op("sub", r"\n{3,}", "\n\n", guard="\n\n\n"),
+        Op("strip"),
+    ],
+    # TextNormalizer.normalize (zaten derlenmiş motor)
+    "normalize": [Op("call", CompiledNormalizer().normalize)],
+}
+
+
+def register_step(name: str, step) -> None:
+    """
+    Yeni adım kaydet
+
+    Args:
+        name: Konfigürasyonda kullanılacak adım adı
+        step: Op listesi veya metin -> metin fonksiyonu
+    """
+    STEPS[name] = list(step) if isinstance(step, (list, tuple)) else [Op("call", step)]
+
+
+def _compose_chars(first: Dict[str, str], second: Dict[str, str]) -> Dict[str, str]:
+    """Ardışık iki karakter eşlemesini tek eşlemeye indir"""
+    table = {key: "".join(second.get(c, c) for c in value) for key, value in first.items()}
+    for key, value in second.items():
+        table.setdefault(key, value)
+    return {key: value for key, value in table.items() if key != value}
+
+
+def _words_fusable(words: Dict[str, str], flags: int) -> bool:
+    """
+    Sıralı tam kelime düzeltmeleri tek alternation deseniyle yapılabilir mi
+
+    Desenler \\b ile sınırlı düz kelimeler olmalı (eşleşmeler örtüşemez) ve bir
+    düzeltmenin çıktısı sonraki desenlerden birine uymamalı.
+    """
+    patterns = list(words)
+    if not all(re.fullmatch(r"\\b\w+\\b", p) for p in patterns):
+        return False
+    for index, pattern in enumerate(patterns):
+        compiled = re.compile(pattern, flags)
+        if any(compiled.search(words[p]) for p in patterns[:index]):
+            return False
+    return True
+
+
+def optimize(ops: List[Op]) -> List[Op]:
+    """
+    Ardışık işlemleri birleştir (sonuç değişmez)
+
+    Args:
+        ops: Etiketlenmiş temel işlemler
+
+    Returns:
+        Birleştirilmiş işlemler
+    """
+    result: List[Op] = []
+    for op in ops:
+        if op.kind == "chars":
+            op = op._replace(pattern={k: v for k, v in op.pattern.items() if k != v})
+            if not op.pattern:
+                continue
+
+        if not result:
+            result.append(op)
+            continue
+
+        last = result[-1]
+        label = last.label if op.label in last.label.split("+") else f"{last.label}+{op.label}"
+
+        if last.kind == "strip" and op.kind in ("strip", "collapse"):
+            result[-1] = op._replace(label=label)
+        elif last.kind == "collapse" and op.kind == "strip":
+            result[-1] = last._replace(label=label)
+        elif last.kind == "sub" and last.pattern == _WHITESPACE and last.repl == " ":
+            if op.kind in ("strip", "collapse"):
+                result[-1] = Op("collapse", label=label)
+            elif op.kind == "sub" and op.guard == "\n":
+                # "\s+" daraltmasından sonra metinde satır sonu kalmaz
+                result[-1] = last._replace(label=label)
+            else:
+                result.append(op)
+        elif last.kind == "collapse" and op.kind == "sub" and op.guard == "\n":
+            result[-1] = last._replace(label=label)
+        elif last.kind == op.kind == "chars":
+            result[-1] = last._replace(
+                pattern=_compose_chars(last.pattern, op.pattern), label=label
+            )
+            if not result[-1].pattern:
+                result.pop()
+        elif last.kind == op.kind == "delete":
+            result[-1] = last._replace(pattern=f"{last.pattern}|{op.pattern}", label=label)
+        elif (
+            last.kind == op.kind == "words"
+            and last.flags == op.flags
+            and _words_fusable({**last.pattern, **op.pattern}, op.flags)
+        ):
+            result[-1] = last._replace(pattern={**last.pattern, **op.pattern}, label=label)
+        else:
+            result.append(op)
+    return result
+
+
+def _compile_op(op: Op) -> Callable[[str], str]:
+    """Tek işlemi metin -> metin fonksiyonuna dönüştür"""
+    if op.kind == "strip":
+        return str.strip
+    if op.kind == "unescape":
+        return html.unescape
+    if op.kind == "trim_lines":
+        pattern = re.compile(r"^ +| +$", re.MULTILINE)
+        # İç satırlarda " \n" / "\n " yoksa desen yalnızca metnin iki ucunu kırpar
+        return lambda text: (
+            pattern.sub("", text) if " \n" in text or "\n " in text else text.strip(" ")
+        )
+    if op.kind == "collapse":
+        return lambda text: " ".join(text.split())
+    if op.kind == "call":
+        return op.pattern
+    if op.kind == "chars":
+        items = list(op.pattern.items())
+        if any(key in value for key, _ in items for _, value in items):
+            # Çıktısı başka bir anahtarı içeren eşlemeler eşzamanlı uygulanmalı
+            table = str.maketrans(op.pattern)
+            return lambda text: text.translate(table)
+
+        # Küçük tablolarda str.replace, ASCII dışı translate tablosundan çok daha hızlı
+        def replace(text: str) -> str:
+            for key, value in items:
+                if key in text:
+                    text = text.replace(key, value)
+            return text
+
+        return replace
+    if op.kind == "delete":
+        pattern = re.compile(f"(?:{op.pattern})+")
+        return lambda text: pattern.sub("", text)
+    if op.kind == "words":
+        if not _words_fusable(op.pattern, op.flags):
+            subs = [(re.compile(p, op.flags), r) for p, r in op.pattern.items()]
+
+            def sequential(text: str) -> str:
+                for pattern, repl in subs:
+                    text = pattern.sub(repl, text)
+                return text
+
+            return sequential
+
+        # \b sınırları alternation dışına alınır; motor her konumda önce sınırı dener
+        replacements = {f"w{i}": repl for i, repl in enumerate(op.pattern.values())}
+        words = "|".join(f"(?P<w{i}>{p[2:-2]})" for i, p in enumerate(op.pattern))
+        pattern = re.compile(rf"\b(?:{words})\b", op.flags)
+        return lambda text: pattern.sub(lambda m: replacements[m.lastgroup], text)
+    if op.kind == "sub":
+        pattern, repl, guard = re.compile(op.pattern, op.flags), op.repl, op.guard
+        if guard:
+            return lambda text: pattern.sub(repl, text) if guard in text else text
+        return lambda text: pattern.sub(repl, text)
+    raise ValueError(f"Bilinmeyen işlem türü: {op.kind}")
+
+
+class Pipeline:
+    """
+    Derlenmiş işleme hattı
+
+    Örnek:
+        pipeline = build_pipeline()              # config.yaml'daki adımlar
+        text = pipeline(text)
+        texts = pipeline.run_batch(texts, profile=True)
+        print(pipeline.format_report())
+    """
+
+    def __init__(self, steps: Iterable[str]):
+        """
+        Args:
+            steps: Adım adları (bkz. STEPS)
+
+        Raises:
+            ValueError: Bilinmeyen adım adı
+        """
+        self.steps = list(steps)
+        unknown = [name for name in self.steps if name not in STEPS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen işleme adımı: {', '.join(unknown)}")
+
+        ops = [op._replace(label=name) for name in self.steps for op in STEPS[name]]
+        self.ops = optimize(ops)
+        self._kernels: List[Tuple[str, Callable[[str], str]]] = [
+            (op.label, _compile_op(op)) for op in self.ops
+        ]
+        self.timings: Dict[str, float] = {op.label: 0.0 for op in self.ops}
+        self.stats = {"texts": 0, "chars": 0, "seconds": 0.0}
+        logger.debug(f"İşleme hattı: {len(ops)} işlem -> {len(self.ops)} derlenmiş işlem")
+
+    def __call__(self, text: str) -> str:
+        """Tek metni işle"""
+        if not text:
+            return ""
+        for _, kernel in self._kernels:
+            text = kernel(text)
+        return text
+
+    def run_batch(self, texts: Iterable[str], profile: bool = False) -> List[str]:
+        """
+        Metin grubunu işle
+
+        Args:
+            texts: Metinler
+            profile: İşlem başına süreleri ölç (timings)
+
+        Returns:
+            İşlenmiş metinler (aynı sırada)
+        """
+        start = time.perf_counter()
+        results = []
+        chars = 0
+        for text in texts:
+            chars += len(text) if text else 0
+            if not profile or not text:
+                results.append(self(text))
+                continue
+
+            for label, kernel in self._kernels:
+                op_start = time.perf_counter()
+                text = kernel(text)
+                self.timings[label] += time.perf_counter() - op_start
+            results.append(text)
+
+        self.stats["texts"] += len(results)
+        self.stats["chars"] += chars
+        self.stats["seconds"] += time.perf_counter() - start
+        return results
+
+    def report(self) -> Dict:
+        """
+        İşlem başına süreler ve toplam verim
+
+        Returns:
+            {"steps", "ops": adım (veya birleştirilmiş adımlar) başına
+             [{"label", "kind", "seconds", "share"}], "texts", "chars", "seconds",
+             "chars_per_second"}
+        """
+        measured = sum(self.timings.values())
+        kinds: Dict[str, List[str]] = {}
+        for op in self.ops:
+            kinds.setdefault(op.label, []).append(op.kind)
+        ops = [
+            {
+                "label": label,
+                "kind": ",".join(kind_list),
+                "seconds": round(self.timings[label], 6),
+                "share": round(self.timings[label] / measured, 3) if measured else 0.0,
+            }
+            for label, kind_list in kinds.items()
+        ]
+        seconds = self.stats["seconds"]
+        return {
+            "steps": list(self.steps),
+            "ops": ops,
+            **self.stats,
+            "chars_per_second": round(self.stats["chars"] / seconds, 1) if seconds else 0.0,
+        }
+
+    def format_report(self) -> str:
+        """Süreleri en pahalı işlemden başlayarak listele"""
+        report = self.report()
+        lines = [f"{'adım':<40} {'işlem':<16} {'saniye':>10} {'pay':>6}"]
+        for op in sorted(report["ops"], key=lambda o: o["seconds"], reverse=True):
+            lines.append(
+                f"{op['label']:<40} {op['kind']:<16} {op['seconds']:>10.4f} {op['share']:>6.1%}"
+            )
+        lines.append(f"{report['texts']} metin, {report['chars_per_second']:.0f} karakter/sn")
+        return "\n".join(lines)
+
+
+def build_pipeline(steps: Optional[Iterable[str]] = None) -> Pipeline:
+    """
+    Konfigürasyondaki adımlardan işleme hattı oluştur
+
+    Args:
+        steps: Adım adları (varsayılan: processing.normalization.steps)
+
+    Returns:
+        Pipeline instance
+    """
+    if steps is None:
+        steps = get_config().get("processing.normalization.steps", ["normalize"])
+    return Pipeline(steps)
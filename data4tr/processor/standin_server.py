@@ -0,0 +1,279 @@
+"""
+data4tr - Stand-in Model Server
+AI sınıflandırma istemcisinin testleri ve çevrimdışı verim ölçümleri için yerel
+model sunucusu.
+
+İki endpoint'i taklit eder:
+- POST /v1/classify: data4tr toplu sınıflandırma protokolü
+  ({"model", "categories", "texts"} -> {"results": [{"category", "confidence", ...}]})
+- POST /v1/chat/completions: OpenAI uyumlu sohbet API'si (yanıt, istekteki
+  metinlerin kategorilerini içeren JSON dizisidir)
+
+"Model" anahtar kelime sınıflandırıcısıdır; gecikme (istek başına sabit + metin
+başına), hata oranı, 429 patlamaları ve en büyük grup boyutu (aşılırsa 413)
+ayarlanabilir. Uçuştaki en yüksek istek sayısı stats["max_in_flight"] ile izlenir.
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from .classify import CATEGORIES, TextClassifier
+
+logger = logging.getLogger(__name__)
+
+
+class StandInModelServer:
+    """
+    Yerel AI model sunucusu
+
+    Kullanım:
+        with StandInModelServer(latency=0.05, per_text_latency=0.001) as server:
+            backend = HTTPBackend(server.url)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        per_text_latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_every: int = 0,
+        throttle_burst: int = 0,
+        retry_after: Optional[float] = None,
+        max_batch_size: int = 0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            latency: İstek başına sabit gecikme (saniye)
+            per_text_latency: İstekteki metin başına ek gecikme (saniye)
+            jitter: Gecikmeye eklenen rastgele süre üst sınırı (saniye)
+            error_rate: 503 döndürülen isteklerin oranı (0-1)
+            throttle_every: Kaç istekte bir 429 patlaması başlayacağı (0: kapalı)
+            throttle_burst: Patlama başına art arda 429 döndürülen istek sayısı
+            retry_after: 429 yanıtlarındaki Retry-After değeri (saniye)
+            max_batch_size: İstek başına en fazla metin (0: sınırsız; aşılırsa 413)
+            seed: Hata dizisi için seed
+            host: Dinlenecek adres
+            port: Dinlenecek port (0: boş bir port seçilir)
+        """
+        self.latency = float(latency)
+        self.per_text_latency = float(per_text_latency)
+        self.jitter = float(jitter)
+        self.error_rate = float(error_rate)
+        self.throttle_every = int(throttle_every)
+        self.throttle_burst = int(throttle_burst)
+        self.retry_after = retry_after
+        self.max_batch_size = max(0, int(max_batch_size))
+        self.host = host
+        self.port = port
+
+        self.classifier = TextClassifier()
+        self.stats = {
+            "requests": 0,
+            "ok": 0,
+            "errors": 0,
+            "throttled": 0,
+            "rejected": 0,
+            "texts": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Sunucunun kök URL'i (endpoint'ler /v1 altındadır)"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> "StandInModelServer":
+        """Sunucuyu arka plan thread'inde başlat"""
+        handler = type("Handler", (_Handler,), {"server_state": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Stand-in model sunucusu başladı: {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Sunucuyu durdur"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StandInModelServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def classify(self, texts: List[str], categories: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Metin grubunu "model" ile sınıflandır
+
+        Args:
+            texts: Metinler
+            categories: İzin verilen kategoriler (dışındaki tahminler "genel" olur)
+
+        Returns:
+            Metin başına {"category", "confidence", "all_scores"}
+        """
+        allowed = set(categories or CATEGORIES)
+        results = []
+        for text in texts:
+            result = self.classifier.classify_with_keywords(text or "")
+            if result["category"] not in allowed:
+                result["category"] = "genel"
+            results.append(result)
+        return results
+
+    def _enter(self, texts: int) -> Optional[int]:
+        """İsteği kaydet; enjekte edilecek hata durum kodunu döndür (yoksa None)"""
+        with self._lock:
+            self.stats["requests"] += 1
+            n = self.stats["requests"]
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+            if self.max_batch_size and texts > self.max_batch_size:
+                self.stats["rejected"] += 1
+                return 413
+            if self.throttle_every > 0 and (n - 1) % self.throttle_every < self.throttle_burst:
+                self.stats["throttled"] += 1
+                return 429
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 503
+            self.stats["ok"] += 1
+            self.stats["texts"] += texts
+            return None
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.stats["in_flight"] -= 1
+
+    def _delay(self, texts: int) -> None:
+        """Yapılandırılmış gecikmeyi uygula"""
+        delay = self.latency + self.per_text_latency * texts
+        if self.jitter > 0:
+            with self._lock:
+                delay += self._random.random() * self.jitter
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """StandInModelServer istek handler'ı"""
+
+    server_state: StandInModelServer = None
+
+    def do_POST(self):
+        state = self.server_state
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send_json(400, {"error": "geçersiz JSON"})
+
+        if self.path.endswith("/classify"):
+            texts = payload.get("texts") or []
+            categories = payload.get("categories")
+        elif self.path.endswith("/chat/completions"):
+            try:
+                request = json.loads(payload["messages"][-1]["content"])
+                texts, categories = request["texts"], request.get("categories")
+            except (KeyError, IndexError, TypeError, ValueError):
+                return self._send_json(400, {"error": "mesajda metin listesi yok"})
+        else:
+            return self._send_json(404, {"error": "bulunamadı"})
+
+        fault = state._enter(len(texts))
+        try:
+            if fault is not None:
+                headers = {}
+                if fault == 429 and state.retry_after is not None:
+                    headers["Retry-After"] = str(state.retry_after)
+                return self._send_json(fault, {"error": "stand-in"}, headers)
+
+            state._delay(len(texts))
+            results = state.classify(texts, categories)
+        finally:
+            state._leave()
+
+        if self.path.endswith("/classify"):
+            return self._send_json(200, {"model": payload.get("model"), "results": results})
+
+        content = json.dumps([result["category"] for result in results], ensure_ascii=False)
+        return self._send_json(
+            200,
+            {
+                "object": "chat.completion",
+                "model": payload.get("model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    def _send_json(self, status: int, data: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv: Optional[List[str]] = None):
+    """Sunucuyu komut satırından çalıştır"""
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="data4tr - Stand-in AI model sunucusu")
+    parser.add_argument("--port", type=int, default=8090, help="Port (default: 8090)")
+    parser.add_argument("--latency", type=float, default=0.2, help="İstek gecikmesi (saniye)")
+    parser.add_argument(
+        "--per-text-latency", type=float, default=0.002, help="Metin başına gecikme (saniye)"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="Rastgele ek gecikme (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 oranı (0-1)")
+    parser.add_argument("--max-batch-size", type=int, default=0, help="İstek başına en fazla metin")
+    args = parser.parse_args(argv)
+
+    server = StandInModelServer(
+        latency=args.latency,
+        per_text_latency=args.per_text_latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        max_batch_size=args.max_batch_size,
+        port=args.port,
+    ).start()
+    print(f"Stand-in model: {server.url}/classify, {server.url}/chat/completions")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
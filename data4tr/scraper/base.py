@@ -4,18 +4,398 @@ Tüm scraper'lar için abstract base class'lar
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+from importlib.metadata import entry_points
+import asyncio
+import email.utils
+import importlib
 import logging
+import random
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from .state import CrawlState
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Token bucket rate limiter
+    Saniyede `rate` token üretir ve en fazla `capacity` token biriktirir.
+    Hem thread'lerden (acquire) hem de asyncio'dan (acquire_async) kullanılabilir.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Saniyede üretilen token sayısı (<= 0 ise sınırsız)
+            capacity: Biriktirilebilecek maksimum token (burst) sayısı
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Bir token ayır
+
+        Returns:
+            Token kullanılabilir olana kadar beklenmesi gereken süre (saniye)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Token üretim hızını güncelle (biriken tokenlar korunur)
+
+        Args:
+            rate: Yeni hız (saniyede token)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = float(rate)
+
+    def acquire(self) -> None:
+        """Token alınana kadar bekle (blocking)"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Token alınana kadar bekle (asyncio)"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CircuitOpenError(Exception):
+    """Devre kesici açıkken yapılan istek"""
+
+
+class CircuitBreaker:
+    """
+    Devre kesici
+    Art arda failure_threshold hata sonrası açılır ve reset_timeout boyunca istekleri
+    reddeder. Süre dolunca tek bir deneme isteğine izin verir (half-open); başarılı
+    olursa kapanır, başarısız olursa tekrar açılır.
+    """
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 60.0):
+        """
+        Args:
+            failure_threshold: Devreyi açan art arda hata sayısı
+            reset_timeout: Açık kalma süresi (saniye)
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """İstek yapılabilir mi"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Başarılı isteği kaydet"""
+        with self._lock:
+            self._failures = 0
+            self.state = "closed"
+
+    def record_failure(self) -> None:
+        """Başarısız isteği kaydet"""
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"Devre kesici açıldı ({self._failures} art arda hata)")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+def backoff_delay(attempt: int, base: float = 0.5, maximum: float = 30.0) -> float:
+    """
+    Üstel geri çekilme süresi (full jitter)
+
+    Args:
+        attempt: Deneme numarası (0'dan başlar)
+        base: İlk denemedeki üst sınır (saniye)
+        maximum: Maksimum bekleme (saniye)
+
+    Returns:
+        [0, min(maximum, base * 2^attempt)] aralığında rastgele süre
+    """
+    return random.uniform(0, min(maximum, base * (2**attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After header'ını saniyeye çevir
+
+    Args:
+        value: Saniye veya HTTP tarihi
+
+    Returns:
+        Beklenecek süre (saniye) veya None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RequestController:
+    """
+    Yeniden deneme, hız adaptasyonu ve devre kesici içeren istek kontrol katmanı
+
+    - 429/5xx ve bağlantı hatalarında üstel geri çekilme (jitter) ile yeniden dener,
+      Retry-After header'ına uyar.
+    - Yeniden denemeler bir bütçeyle sınırlıdır: her başarılı istek budget_ratio kadar
+      yeniden deneme hakkı kazandırır, böylece sunucu çöktüğünde trafik katlanmaz.
+    - AIMD: her başarılı istekte hız increase_step kadar artar (max_rate'e kadar),
+      429/503 yanıtlarında decrease_factor ile çarpılır (min_rate'e kadar).
+    - Devre kesici art arda hatalarda istekleri durdurur.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    THROTTLE_STATUSES = {429, 503}
+
+    def __init__(
+        self,
+        rate_limiter: TokenBucket,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        budget_ratio: float = 0.2,
+        min_retry_tokens: float = 10.0,
+        min_rate: float = 0.2,
+        max_rate: Optional[float] = None,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        breaker: Optional[CircuitBreaker] = None,
+        slots: Optional[threading.Semaphore] = None,
+    ):
+        """
+        Args:
+            rate_limiter: Hızı ayarlanacak token bucket
+            max_retries: İstek başına maksimum yeniden deneme
+            backoff_base: Geri çekilmenin ilk denemedeki üst sınırı (saniye)
+            backoff_max: Maksimum geri çekilme (saniye)
+            budget_ratio: Başarılı istek başına kazanılan yeniden deneme hakkı
+            min_retry_tokens: Başlangıçtaki yeniden deneme hakkı
+            min_rate: AIMD alt sınırı (saniyede istek)
+            max_rate: AIMD üst sınırı (varsayılan: başlangıç hızı)
+            increase_step: Başarılı istek başına hız artışı
+            decrease_factor: Kısıtlama yanıtında hız çarpanı
+            breaker: Devre kesici
+            slots: Birden fazla kaynak arasında paylaşılan eşzamanlı istek sınırı
+        """
+        self.rate_limiter = rate_limiter
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.budget_ratio = float(budget_ratio)
+        self.min_retry_tokens = float(min_retry_tokens)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate) if max_rate else rate_limiter.rate
+        self.increase_step = float(increase_step)
+        self.decrease_factor = float(decrease_factor)
+        self.breaker = breaker or CircuitBreaker()
+        self.slots = slots
+
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "throttled": 0}
+        self.latencies = deque(maxlen=10000)
+        self._retry_tokens = self.min_retry_tokens
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs):
+        """
+        Kontrollü HTTP isteği
+
+        Args:
+            session: Kullanılacak session
+            method: HTTP metodu
+            url: İstek URL'i
+            **kwargs: requests'e aktarılacak parametreler
+
+        Returns:
+            Son yanıt (başarısız durum kodları için caller raise_for_status çağırmalı)
+
+        Raises:
+            CircuitOpenError: Devre kesici açıksa
+            requests.RequestException: Bağlantı hatası yeniden denemelerle de aşılamazsa
+        """
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"Devre kesici açık: {url}")
+
+            self.rate_limiter.acquire()
+            if self.slots is not None:
+                self.slots.acquire()
+            start = time.monotonic()
+            error = None
+            try:
+                response = session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                error = e
+            finally:
+                # Slot ve gecikme ölçümü geri çekilme beklemesinden önce bırakılır
+                if self.slots is not None:
+                    self.slots.release()
+                with self._lock:
+                    self.stats["requests"] += 1
+                    self.latencies.append(time.monotonic() - start)
+
+            if error is not None:
+                self._on_failure(throttled=False)
+                if not self._can_retry(attempt):
+                    raise error
+                self._sleep(attempt, None)
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES:
+                self._on_success()
+                return response
+
+            self._on_failure(throttled=response.status_code in self.THROTTLE_STATUSES)
+            if not self._can_retry(attempt):
+                return response
+
+            self._sleep(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            attempt += 1
+
+    @property
+    def rate(self) -> float:
+        """Güncel istek hızı (saniyede istek)"""
+        return self.rate_limiter.rate
+
+    def _can_retry(self, attempt: int) -> bool:
+        """Yeniden deneme hakkı var mı (varsa bütçeden düşülür)"""
+        if attempt >= self.max_retries:
+            return False
+        with self._lock:
+            if self._retry_tokens < 1:
+                return False
+            self._retry_tokens -= 1
+            self.stats["retries"] += 1
+        return True
+
+    def _sleep(self, attempt: int, retry_after: Optional[float]) -> None:
+        """Yeniden denemeden önce bekle"""
+        delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        time.sleep(delay)
+
+    def _on_success(self) -> None:
+        """Başarılı yanıt: hızı toplamsal olarak artır, yeniden deneme bütçesini doldur"""
+        self.breaker.record_success()
+        with self._lock:
+            self._retry_tokens = min(
+                self._retry_tokens + self.budget_ratio, max(self.min_retry_tokens, 100.0)
+            )
+            rate = self.rate_limiter.rate
+            if 0 < rate < self.max_rate:
+                self.rate_limiter.set_rate(min(self.max_rate, rate + self.increase_step))
+
+    def _on_failure(self, throttled: bool) -> None:
+        """Başarısız yanıt: kısıtlama varsa hızı çarpımsal olarak düşür"""
+        self.breaker.record_failure()
+        with self._lock:
+            self.stats["failures"] += 1
+            if throttled:
+                self.stats["throttled"] += 1
+        if not throttled:
+            return
+
+        with self._lock:
+            rate = self.rate_limiter.rate
+            now = time.monotonic()
+            # Aynı anda gelen kısıtlama yanıtları hızı bir kez düşürür
+            if rate <= 0 or now - self._last_decrease < 1.0 / rate:
+                return
+            self._last_decrease = now
+            new_rate = max(self.min_rate, rate * self.decrease_factor)
+            self.rate_limiter.set_rate(new_rate)
+        logger.info(f"Sunucu kısıtlaması: hız {rate:.2f} -> {new_rate:.2f} istek/sn")
+
+
+def iter_async(agen: AsyncIterator) -> Iterator:
+    """
+    Async generator'ı senkron generator olarak tüket
+    Her eleman için event loop yalnızca bir sonraki eleman hazır olana kadar çalıştırılır.
+
+    Args:
+        agen: Tüketilecek async generator
+
+    Yields:
+        Async generator'ın ürettiği elemanlar
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
+
+
 class BaseScraper(ABC):
     """
     Tüm scraper'lar için abstract base class
     Her veri kaynağı için show isimli scraper bu sınıftan türetilmelidir.
+
+    Alt sınıflar iter_scrape (generator) veya scrape (liste) metodlarından
+    en az birini implement etmelidir; diğeri otomatik olarak türetilir.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.iter_scrape is BaseScraper.iter_scrape and cls.scrape is BaseScraper.scrape:
+            raise TypeError(f"{cls.__name__} iter_scrape veya scrape metodunu implement etmeli")
+
     def __init__(self, config: Dict):
         """
         Args:
@@ -26,11 +406,27 @@ class BaseScraper(ABC):
         self.enabled = config.get("enabled", False)
         self.api_config = config.get("api", {})
         self.rate_limit_config = config.get("rate_limit", {})
+        self.cache_config = config.get("cache", {})
+        self.state_config = config.get("state", {})
+        self.request_slots: Optional[threading.Semaphore] = None
+        self._controllers: List[RequestController] = []
+        self._html_extractor = None
+
+    def iter_scrape(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        Veri çekme metodu (streaming) - kayıtlar geldikçe üretilir
+
+        Args:
+            limit: Çekilecek kayıt sayısı
+
+        Yields:
+            Çekilen kayıtlar
+        """
+        yield from self.scrape(limit)
 
-    @abstractmethod
     def scrape(self, limit: int = 100) -> List[Dict]:
         """
-        Veri çekme metodu - her scraper'da implement edilmeli
+        Veri çekme metodu - iter_scrape üzerinde ince bir sarmalayıcı
 
         Args:
             limit: Çekilecek kayıt sayısı
@@ -38,7 +434,85 @@ class BaseScraper(ABC):
         Returns:
             Çekilen veri listesi
         """
-        pass
+        return list(self.iter_scrape(limit))
+
+    def iter_tracked(
+        self, fetch: Callable[[int], Iterator[Dict]], limit: int, key: str = "title"
+    ) -> Iterator[Dict]:
+        """
+        fetch'in ürettiği kayıtları kalıcı tarama durumu üzerinden geçir
+
+        state.enabled kapalıysa kayıtlar olduğu gibi aktarılır. Açıksa daha önce
+        görülmüş başlıklar elenir (on_collision: skip) veya yerlerine yenileri çekilir
+        (on_collision: refetch), ilerleme düzenli aralıklarla diske yazılır ve yarıda
+        kesilen bir çalıştırma kaldığı yerden devam eder.
+
+        Args:
+            fetch: İstenen sayıda kayıt üreten generator fonksiyonu
+            limit: Hedeflenen kayıt sayısı
+            key: Görülen indeksinde kullanılacak kayıt alanı
+
+        Yields:
+            Daha önce görülmemiş kayıtlar
+        """
+        state = self.open_crawl_state()
+        if state is None:
+            yield from fetch(limit)
+            return
+
+        completed = False
+        try:
+            resumed = state.begin(limit)
+            yield from resumed
+            remaining = limit - len(resumed)
+
+            passes = 1
+            if state.on_collision == "refetch":
+                passes += int(self.state_config.get("max_refetch_passes", 5))
+
+            for _ in range(passes):
+                if remaining <= 0:
+                    break
+
+                stream = fetch(remaining)
+                try:
+                    for record in stream:
+                        record_key = str(record.get(key, ""))
+                        if state.is_seen(record_key):
+                            state.collide()
+                            continue
+
+                        state.record(record, record_key)
+                        remaining -= 1
+                        yield record
+                        if remaining <= 0:
+                            break
+                finally:
+                    stream.close()
+
+            completed = True
+        finally:
+            state.close(completed=completed)
+
+    def open_crawl_state(self) -> Optional["CrawlState"]:
+        """
+        Kaynağın state konfigürasyonundan kalıcı tarama durumunu aç
+
+        Returns:
+            CrawlState veya (state.enabled kapalıysa) None
+        """
+        if not self.state_config.get("enabled", False):
+            return None
+
+        from .state import CrawlState
+
+        return CrawlState(
+            self.state_config.get("directory", f"data/state/{self.name}"),
+            expected_items=self.state_config.get("expected_items", 1_000_000),
+            false_positive_rate=self.state_config.get("false_positive_rate", 0.001),
+            on_collision=self.state_config.get("on_collision", "refetch"),
+            checkpoint_every=self.state_config.get("checkpoint_every", 50),
+        )
 
     @abstractmethod
     def validate_config(self) -> bool:
@@ -93,31 +567,200 @@ class BaseScraper(ABC):
         """
         return self.rate_limit_config.get("delay_between_requests", 1.0)
 
+    def get_requests_per_second(self) -> float:
+        """
+        Saniyedeki maksimum istek sayısı
+
+        Returns:
+            rate_limit.requests_per_second değeri; tanımlı değilse
+            delay_between_requests değerinden türetilir
+        """
+        rps = self.rate_limit_config.get("requests_per_second")
+        if rps is None:
+            delay = self.get_rate_limit_delay()
+            return 1.0 / delay if delay > 0 else 0.0
+        return float(rps)
+
+    def get_concurrency(self) -> int:
+        """
+        Aynı anda uçuşta olabilecek istek sayısı
+
+        Returns:
+            rate_limit.max_concurrency değeri (en az 1)
+        """
+        return max(1, int(self.rate_limit_config.get("max_concurrency", 1)))
+
+    def create_rate_limiter(self) -> TokenBucket:
+        """
+        Konfigürasyondaki requests_per_second değerine göre token bucket oluştur
+        rate_limit.shared_state ayarlıysa bucket, aynı dosyayı kullanan tüm
+        process'ler arasında paylaşılır (bkz. coordinator.SharedRateLimiter).
+
+        Returns:
+            TokenBucket instance
+        """
+        shared_state = self.rate_limit_config.get("shared_state")
+        if shared_state:
+            from .coordinator import SharedRateLimiter
+
+            return SharedRateLimiter(
+                shared_state,
+                self.rate_limit_config.get("shared_key", self.name),
+                self.get_requests_per_second(),
+                self.rate_limit_config.get("burst"),
+            )
+
+        return TokenBucket(self.get_requests_per_second(), self.rate_limit_config.get("burst"))
+
+    def create_request_controller(self, rate_limiter: Optional[TokenBucket] = None):
+        """
+        Yeniden deneme, AIMD ve devre kesici içeren istek kontrol katmanı oluştur
+
+        Ayarlar rate_limit (min/max_requests_per_second) ve retry,
+        circuit_breaker bölümlerinden okunur.
+
+        Args:
+            rate_limiter: Hızı ayarlanacak token bucket (varsayılan: yeni oluşturulur)
+
+        Returns:
+            RequestController instance
+        """
+        retry_config = self.config.get("retry", {})
+        breaker_config = self.config.get("circuit_breaker", {})
+
+        controller = RequestController(
+            rate_limiter or self.create_rate_limiter(),
+            max_retries=retry_config.get("max_retries", 3),
+            backoff_base=retry_config.get("backoff_base", 0.5),
+            backoff_max=retry_config.get("backoff_max", 30.0),
+            budget_ratio=retry_config.get("budget_ratio", 0.2),
+            min_rate=self.rate_limit_config.get("min_requests_per_second", 0.2),
+            max_rate=self.rate_limit_config.get("max_requests_per_second"),
+            breaker=CircuitBreaker(
+                failure_threshold=breaker_config.get("failure_threshold", 10),
+                reset_timeout=breaker_config.get("reset_timeout", 60.0),
+            ),
+            slots=self.request_slots,
+        )
+        self._controllers.append(controller)
+        return controller
+
+    def set_request_slots(self, slots: Optional[threading.Semaphore]) -> None:
+        """
+        Birden fazla scraper arasında paylaşılan eşzamanlı istek sınırını ayarla
+        Bu scraper'ın oluşturduğu tüm istek kontrol katmanlarına uygulanır.
+
+        Args:
+            slots: Paylaşılan semaphore (None: sınır yok)
+        """
+        self.request_slots = slots
+        for controller in self._controllers:
+            controller.slots = slots
+
+    def extract_html(self, html) -> str:
+        """
+        HTML üreten kaynaklar için ana metin çıkarma
+        Ayarlar kaynağın html bölümünden okunur (bkz. extract.HTMLExtractor).
+
+        Args:
+            html: HTML metni, dosya nesnesi veya parça iterable'ı
+
+        Returns:
+            Boş satırla ayrılmış içerik paragrafları
+        """
+        if self._html_extractor is None:
+            from .extract import HTMLExtractor
+
+            self._html_extractor = HTMLExtractor.from_config(self.config.get("html"))
+        return self._html_extractor.extract(html)
+
+    def create_session(self) -> requests.Session:
+        """
+        Bağlantı havuzlu HTTP session oluştur
+        Havuz boyutu eşzamanlı istek sayısına göre ayarlanır. Kaynağın
+        cache.enabled ayarı açıksa yanıtlar diskteki önbellek üzerinden sunulur.
+
+        Returns:
+            Headers'ı ayarlanmış requests.Session
+        """
+        if self.cache_config.get("enabled", False):
+            from .cache import DEFAULT_BYPASS, CachedSession, ResponseCache
+
+            cache = ResponseCache(
+                self.cache_config.get("directory", f"data/cache/{self.name}"),
+                ttl=self.cache_config.get("ttl", 86400),
+                max_size_mb=self.cache_config.get("max_size_mb", 256),
+            )
+            session = CachedSession(cache, self.cache_config.get("bypass", DEFAULT_BYPASS))
+        else:
+            session = requests.Session()
+        session.headers.update(self.get_headers())
+
+        pool_size = self.get_concurrency()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
 
 class ScraperRegistry:
     """
     Scraper'ları kaydeden ve yöneten registry pattern implementation
     Factory pattern ile birlikte kullanılır
+
+    Kaynak modülleri tembel yüklenir: yerleşik kaynaklar BUILTIN_SOURCES'ta
+    "modül:Sınıf" olarak tanımlıdır, üçüncü parti kaynaklar ise
+    "data4tr.scrapers" entry point grubuyla kaydedilir. Bir kaynağın modülü
+    yalnızca ilk kez istendiğinde import edilir.
     """
 
+    ENTRY_POINT_GROUP = "data4tr.scrapers"
+
+    BUILTIN_SOURCES = {
+        "wikipedia": "data4tr.scraper.sources.wikipedia:WikipediaScraper",
+        "wikipedia_dump": "data4tr.scraper.sources.wikidump:WikiDumpScraper",
+    }
+
     _registry = {}
+    _lazy = dict(BUILTIN_SOURCES)
+    _entry_points = None
 
     @classmethod
-    def register(cls, name: str, scraper_class: type):
+    def register(cls, name: str, scraper_class: Union[type, str]):
         """
         Bir scraper class'ını kaydet
 
         Args:
             name: Kaynak adı (örn: 'wikipedia')
-            scraper_class: Scraper class'ı (BaseScraper'dan türetilmiş)
+            scraper_class: Scraper class'ı (BaseScraper'dan türetilmiş) veya
+                tembel yükleme için "paket.modül:Sınıf" biçiminde yol
         """
+        if isinstance(scraper_class, str):
+            cls._registry.pop(name, None)
+            cls._lazy[name] = scraper_class
+            logger.debug(f"Scraper kaydedildi (tembel): {name} -> {scraper_class}")
+            return
+
         cls._registry[name] = scraper_class
         logger.info(f"Scraper kaydedildi: {name} -> {scraper_class.__name__}")
 
+    @classmethod
+    def unregister(cls, name: str):
+        """
+        Bir scraper kaydını kaldır
+
+        Args:
+            name: Kaynak adı
+        """
+        cls._registry.pop(name, None)
+        cls._lazy.pop(name, None)
+        logger.debug(f"Scraper kaydı kaldırıldı: {name}")
+
     @classmethod
     def get(cls, name: str) -> Optional[type]:
         """
         Kayıtlı scraper class'ını al
+        Tembel kayıtlı kaynakların modülü ilk çağrıda import edilir.
 
         Args:
             name: Scraper adı
@@ -125,17 +768,50 @@ class ScraperRegistry:
         Returns:
             Scraper class'ı veya None
         """
-        return cls._registry.get(name)
+        if name in cls._registry:
+            return cls._registry[name]
+
+        try:
+            if name in cls._lazy:
+                module_name, _, class_name = cls._lazy[name].partition(":")
+                scraper_class = getattr(importlib.import_module(module_name), class_name)
+            elif name in cls._discover_entry_points():
+                scraper_class = cls._entry_points[name].load()
+            else:
+                return None
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Scraper yüklenemedi ({name}): {e}")
+            return None
+
+        cls._registry[name] = scraper_class
+        logger.debug(f"Scraper yüklendi: {name} -> {scraper_class.__name__}")
+        return scraper_class
 
     @classmethod
     def list_registered(cls) -> List[str]:
         """
-        Kayıtlı tüm scraper'ları listele
+        Kayıtlı tüm scraper'ları listele (modüller import edilmez)
 
         Returns:
             Scraper isimleri listesi
         """
-        return list(cls._registry.keys())
+        names = list(cls._registry)
+        for name in list(cls._lazy) + list(cls._discover_entry_points()):
+            if name not in names:
+                names.append(name)
+        return names
+
+    @classmethod
+    def _discover_entry_points(cls) -> Dict:
+        """data4tr.scrapers grubundaki entry point'leri bul (bir kez, yüklemeden)"""
+        if cls._entry_points is None:
+            try:
+                found = entry_points(group=cls.ENTRY_POINT_GROUP)
+            except TypeError:
+                # Python 3.9: entry_points() grup -> liste sözlüğü döndürür
+                found = entry_points().get(cls.ENTRY_POINT_GROUP, [])
+            cls._entry_points = {ep.name: ep for ep in found}
+        return cls._entry_points
 
     @classmethod
     def create(cls, name: str, config: Dict) -> Optional[BaseScraper]:
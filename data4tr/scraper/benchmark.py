@@ -0,0 +1,227 @@
+"""
+data4tr - Scraper Benchmark
+WikipediaScraper'ı ve Scraper.scrape_source akışını yerel mock sunucuya karşı
+çalıştırıp verim (sayfa/sn), gecikme yüzdelikleri ve yeniden deneme sayılarını raporlar.
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+from data4tr.algorithms.metrics import percentile
+from data4tr.config import get_config
+from .base import ScraperRegistry
+from .mockserver import MockWikipediaServer
+from .scraper import Scraper
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SOURCE = "wikipedia_benchmark"
+
+
+def make_source_config(
+    server_url: str,
+    mode: str = "summary",
+    concurrency: int = 4,
+    requests_per_second: float = 0,
+    batch_size: int = 20,
+    backoff_base: float = 0.05,
+) -> Dict:
+    """
+    Mock sunucuyu kullanan Wikipedia kaynak konfigürasyonu
+
+    Args:
+        server_url: Mock sunucunun kök URL'i
+        mode: "summary" veya "batch"
+        concurrency: Eşzamanlı istek sayısı
+        requests_per_second: İstek hızı (0: sınırsız)
+        batch_size: Toplu modda istek başına sayfa
+        backoff_base: Yeniden deneme geri çekilme tabanı (saniye)
+
+    Returns:
+        Kaynak konfigürasyonu
+    """
+    return {
+        "name": "Wikipedia (benchmark)",
+        "enabled": True,
+        "api": {
+            "base_url": server_url,
+            "random_page": "/page/random/summary",
+            "action_api": f"{server_url}/w/api.php",
+            "fetch_mode": mode,
+            "batch_size": batch_size,
+            "timeout": 10,
+        },
+        "rate_limit": {
+            "requests_per_second": requests_per_second,
+            "delay_between_requests": 0,
+            "max_concurrency": concurrency,
+        },
+        "retry": {"max_retries": 3, "backoff_base": backoff_base, "backoff_max": 2.0},
+    }
+
+
+class _RecordingScraper(Scraper):
+    """Oluşturduğu scraper instance'larını saklayan Scraper (istatistikler için)"""
+
+    def __init__(self):
+        super().__init__()
+        self.instances = []
+
+    def create_scraper(self, source_name, overrides=None):
+        instance = super().create_scraper(source_name, overrides)
+        if instance is not None:
+            self.instances.append(instance)
+        return instance
+
+
+def run_benchmark(
+    pages: int = 200,
+    mode: str = "summary",
+    concurrency: int = 4,
+    via: str = "scraper",
+    requests_per_second: float = 0,
+    batch_size: int = 20,
+    server: Optional[MockWikipediaServer] = None,
+    **server_options,
+) -> Dict:
+    """
+    Tek bir benchmark çalıştır
+
+    Args:
+        pages: Çekilecek sayfa sayısı
+        mode: "summary" veya "batch"
+        concurrency: Eşzamanlı istek sayısı
+        via: "scraper" (WikipediaScraper.iter_scrape) veya
+            "scrape_source" (Scraper.scrape_source üzerinden)
+        requests_per_second: İstek hızı (0: sınırsız)
+        batch_size: Toplu modda istek başına sayfa
+        server: Kullanılacak çalışan mock sunucu (varsayılan: yeni başlatılır)
+        **server_options: Yeni sunucu için MockWikipediaServer parametreleri
+
+    Returns:
+        Rapor sözlüğü (pages_per_second, p50_ms, p99_ms, retries, ...)
+    """
+    own_server = server is None
+    if own_server:
+        server = MockWikipediaServer(**server_options).start()
+
+    config = make_source_config(
+        server.url, mode, concurrency, requests_per_second, batch_size=batch_size
+    )
+    ScraperRegistry.register(BENCHMARK_SOURCE, ScraperRegistry.BUILTIN_SOURCES["wikipedia"])
+    app_config = get_config()
+    app_config.set(f"sources.{BENCHMARK_SOURCE}", config)
+
+    try:
+        start = time.perf_counter()
+        if via == "scrape_source":
+            scraper = _RecordingScraper()
+            records = scraper.scrape_source(BENCHMARK_SOURCE, limit=pages)
+            instances = scraper.instances
+        else:
+            instance = ScraperRegistry.create(BENCHMARK_SOURCE, config)
+            records = list(instance.iter_scrape(pages))
+            instances = [instance]
+        elapsed = time.perf_counter() - start
+    finally:
+        app_config.get("sources").pop(BENCHMARK_SOURCE, None)
+        ScraperRegistry.unregister(BENCHMARK_SOURCE)
+        if own_server:
+            server.stop()
+
+    latencies: List[float] = []
+    stats = {"requests": 0, "retries": 0, "failures": 0, "throttled": 0}
+    for instance in instances:
+        for controller in instance._controllers:
+            latencies.extend(controller.latencies)
+            for key in stats:
+                stats[key] += controller.stats[key]
+
+    return {
+        "mode": mode,
+        "via": via,
+        "concurrency": concurrency,
+        "pages": len(records),
+        "seconds": round(elapsed, 3),
+        "pages_per_second": round(len(records) / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        **stats,
+        "server": dict(server.stats),
+    }
+
+
+def format_report(results: List[Dict]) -> str:
+    """Sonuçları tablo olarak biçimlendir"""
+    columns = [
+        "mode",
+        "via",
+        "concurrency",
+        "pages",
+        "seconds",
+        "pages_per_second",
+        "p50_ms",
+        "p99_ms",
+        "requests",
+        "retries",
+        "throttled",
+    ]
+    widths = [max(len(c), *(len(str(r[c])) for r in results)) for c in columns]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    for result in results:
+        lines.append("  ".join(str(result[c]).ljust(w) for c, w in zip(columns, widths)))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Benchmark'ı komut satırından çalıştır"""
+    parser = argparse.ArgumentParser(description="data4tr - Scraper benchmark (mock sunucu)")
+    parser.add_argument("--pages", type=int, default=200, help="Sayfa sayısı (default: 200)")
+    parser.add_argument(
+        "--mode", choices=["summary", "batch", "all"], default="all", help="Çekme modu"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Eşzamanlılık değerleri"
+    )
+    parser.add_argument(
+        "--via", choices=["scraper", "scrape_source"], default="scraper", help="Giriş noktası"
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="Sunucu gecikmesi (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Rastgele ek gecikme (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 oranı (0-1)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="429 patlama aralığı")
+    parser.add_argument("--throttle-burst", type=int, default=0, help="Patlama uzunluğu")
+    parser.add_argument("--seed", type=int, default=0, help="Seed")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args(argv)
+
+    modes = ["summary", "batch"] if args.mode == "all" else [args.mode]
+    results = []
+    for mode in modes:
+        for concurrency in args.concurrency:
+            results.append(
+                run_benchmark(
+                    pages=args.pages,
+                    mode=mode,
+                    concurrency=concurrency,
+                    via=args.via,
+                    latency=args.latency,
+                    jitter=args.jitter,
+                    error_rate=args.error_rate,
+                    throttle_every=args.throttle_every,
+                    throttle_burst=args.throttle_burst,
+                    seed=args.seed,
+                )
+            )
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""
+data4tr - HTTP Response Cache
+Scraper'lar için diskte kalıcı, koşullu doğrulama (ETag/Last-Modified) destekli yanıt önbelleği
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+# Anahtar hesaplanırken dikkate alınmayan (koşullu istek) header'ları
+_IGNORED_KEY_HEADERS = {"if-none-match", "if-modified-since"}
+
+# Her istekte farklı yanıt dönen (rastgele örnekleme, değişiklik akışı) URL'ler;
+# önbelleğe alınırsa tekrar çalıştırmalar aynı "rastgele" sayfaları görür
+DEFAULT_BYPASS = ("/page/random/", "generator=random", "list=recentchanges")
+
+# 304 yanıtında gelse de saklanan gövdeye ait olduğu için güncellenmeyen header'lar
+_BODY_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)")
+
+
+def freshness_lifetime(headers: Dict[str, str], ttl: float) -> float:
+    """
+    Yanıtın doğrulama gerekmeden kullanılabileceği süre
+
+    Args:
+        headers: Yanıt header'ları
+        ttl: Önbelleğin üst sınırı (saniye)
+
+    Returns:
+        no-cache için 0, max-age verilmişse min(max-age, ttl), aksi halde ttl
+    """
+    cache_control = CaseInsensitiveDict(headers).get("Cache-Control", "").lower()
+    if "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return min(float(match.group(1)), ttl)
+    return ttl
+
+
+class ResponseCache:
+    """
+    SQLite tabanlı disk önbelleği
+    Kayıtlar URL ve istek header'larından türetilen anahtarla saklanır.
+    Toplam boyut max_size_mb'yi aşınca en uzun süredir erişilmeyen kayıtlar silinir (LRU).
+    """
+
+    def __init__(self, directory: str, ttl: float = 86400, max_size_mb: float = 256):
+        """
+        Args:
+            directory: Önbellek dizini
+            ttl: Kaydın doğrulama gerekmeden kullanılabileceği süre (saniye)
+            max_size_mb: Önbelleğin maksimum boyutu (MB)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = float(ttl)
+        self.max_size = int(float(max_size_mb) * 1024 * 1024)
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.directory / "responses.sqlite"), check_same_thread=False, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(method: str, url: str, headers: Dict[str, str]) -> str:
+        """
+        İstek için önbellek anahtarı oluştur
+
+        Args:
+            method: HTTP metodu
+            url: Tam URL (query string dahil)
+            headers: İstek header'ları
+
+        Returns:
+            SHA-256 hex anahtar
+        """
+        parts = [method.upper(), url]
+        for name in sorted(headers, key=str.lower):
+            if name.lower() not in _IGNORED_KEY_HEADERS:
+                parts.append(f"{name.lower()}:{headers[name]}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Önbellekteki kaydı al ve erişim zamanını güncelle
+
+        Args:
+            key: Önbellek anahtarı
+
+        Returns:
+            Kayıt sözlüğü veya None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        return {
+            "url": row[0],
+            "status": row[1],
+            "headers": json.loads(row[2]),
+            "body": row[3],
+            "etag": row[4],
+            "last_modified": row[5],
+            "stored_at": row[6],
+        }
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Kayıt tazelik süresi içinde mi (TTL, yanıtın max-age/no-cache değeriyle sınırlanır)"""
+        return time.time() - entry["stored_at"] < freshness_lifetime(entry["headers"], self.ttl)
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """
+        Yanıtı önbelleğe yaz
+
+        Args:
+            key: Önbellek anahtarı
+            response: Saklanacak yanıt (içeriği okunmuş olmalı)
+        """
+        body = response.content
+        headers = dict(response.headers)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._conn.commit()
+            self.stats["stored"] += 1
+            self._evict()
+
+    def refresh(self, key: str, entry: Dict, headers: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        304 sonrası kaydı yenile
+
+        304 yanıtının header'ları (yeni Cache-Control, ETag, Last-Modified, ...) saklanan
+        header'larla birleştirilir; tazelik bir sonraki istekte bunlarla hesaplanır.
+
+        Args:
+            key: Önbellek anahtarı
+            entry: get ile alınmış kayıt (yerinde güncellenir)
+            headers: 304 yanıtının header'ları
+
+        Returns:
+            Güncellenmiş kayıt
+        """
+        merged = CaseInsensitiveDict(entry["headers"])
+        for name, value in (headers or {}).items():
+            if name.lower() not in _BODY_HEADERS:
+                merged[name] = value
+        now = time.time()
+        entry.update(
+            headers=dict(merged),
+            etag=merged.get("ETag"),
+            last_modified=merged.get("Last-Modified"),
+            stored_at=now,
+        )
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, etag = ?, last_modified = ?, stored_at = ?, "
+                "accessed_at = ? WHERE key = ?",
+                (
+                    json.dumps(entry["headers"]),
+                    entry["etag"],
+                    entry["last_modified"],
+                    now,
+                    now,
+                    key,
+                ),
+            )
+            self._conn.commit()
+        return entry
+
+    def record(self, name: str) -> None:
+        """
+        İstatistik sayacını artır (önbellek birden fazla thread'den kullanılır)
+
+        Args:
+            name: stats anahtarı ("hits", "misses", "revalidated")
+        """
+        with self._lock:
+            self.stats[name] += 1
+
+    def size(self) -> int:
+        """Önbellekteki toplam gövde boyutu (byte)"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapat"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Boyut sınırı aşıldıysa en eski erişilen kayıtları sil (kilit altında çağrılır)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        evicted = 0
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC")
+        for key, size in rows.fetchall():
+            if total <= self.max_size:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        self._conn.commit()
+        self.stats["evicted"] += evicted
+        logger.debug(f"Önbellekten {evicted} kayıt silindi (LRU)")
+
+
+class CachedSession(requests.Session):
+    """
+    ResponseCache kullanan requests.Session
+    Yalnızca GET istekleri önbelleğe alınır. Taze kayıtlar ağa gitmeden döndürülür,
+    süresi dolmuş kayıtlar If-None-Match / If-Modified-Since ile doğrulanır.
+    Yanıtın Cache-Control değerine uyulur (no-store/private saklanmaz, no-cache her
+    kullanımda doğrulanır, max-age TTL'i kısaltır). URL'i bypass desenlerinden
+    birini içeren istekler (rastgele sayfa uçları gibi) önbelleğe hiç uğramaz.
+    Yönlendirmeler de send üzerinden geçtiği için her adım ayrı değerlendirilir.
+    """
+
+    def __init__(self, cache: ResponseCache, bypass: Iterable[str] = DEFAULT_BYPASS):
+        """
+        Args:
+            cache: Kullanılacak önbellek
+            bypass: Önbelleğe alınmayacak URL parçaları
+        """
+        super().__init__()
+        self.cache = cache
+        self.bypass = tuple(bypass)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """İsteği önbellek üzerinden gönder"""
+        if request.method != "GET" or kwargs.get("stream"):
+            return super().send(request, **kwargs)
+        if any(part in request.url for part in self.bypass):
+            return super().send(request, **kwargs)
+
+        key = self.cache.make_key(request.method, request.url, request.headers)
+        entry = self.cache.get(key)
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record("hits")
+            return self._build_response(request, entry)
+
+        if entry is not None:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            entry = self.cache.refresh(key, entry, response.headers)
+            return self._build_response(request, entry)
+
+        self.cache.record("misses")
+        if self._is_cacheable(response):
+            self.cache.put(key, response)
+
+        return response
+
+    @staticmethod
+    def _is_cacheable(response: requests.Response) -> bool:
+        """Yanıt önbelleğe alınabilir mi"""
+        if response.status_code != 200:
+            return False
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        return "no-store" not in cache_control and "private" not in cache_control
+
+    @staticmethod
+    def _build_response(request: requests.PreparedRequest, entry: Dict) -> requests.Response:
+        """Önbellek kaydından Response nesnesi oluştur"""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.url = entry["url"]
+        response.request = request
+        response.reason = "OK"
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        response.from_cache = True
+        return response
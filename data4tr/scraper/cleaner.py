@@ -5,7 +5,281 @@ HTML, karakter ve boşluk temizliği yapan modül.
 
 import re
 import html
-from typing import List, Optional
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# destructive_clean adımlarının derlenmiş desenleri (TextCleaner metodlarıyla aynı)
+_URL_PATTERN = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_SPECIAL_PATTERN = re.compile(r"[^a-zA-Z0-9çğıöşüÇĞIİÖŞÜ\s.,;:!?()\[\]{}'\"-]+")
+# (.)\1{3,} ile aynı eşleşme; sayaçlı tekrar yerine açık yazım daha hızlı
+_REPEAT_PATTERN = re.compile(r"(.)\1\1\1+")
+# html.unescape'in entity deseni (parça sınırında bekletme kararı için)
+_ENTITY_PATTERN = re.compile(r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)")
+_URL_PREFIXES = ("https://", "http://")
+
+
+class CleaningEngine:
+    """
+    destructive_clean için derlenmiş, tek geçişe yakın temizlik motoru
+
+    Desenler modül yüklenirken bir kez derlenir. Adımlar TextCleaner metodlarıyla
+    aynı sırada uygulanır, ancak:
+    - URL, HTML entity ve etiket adımları metinde ilgili işaret ("http", "&", "<")
+      yoksa atlanır,
+    - özel karakterler tek tek değil art arda gelen gruplar halinde silinir,
+    - boşluk daraltma ve kırpma regex yerine str.split / join ile tek geçişte yapılır
+      (\\s ile str.isspace aynı karakterleri kapsar),
+    - boşluklar daraltıldıktan sonra metinde satır sonu kalmadığından satır bölme
+      döngüsü tek satır kontrolüne iner.
+    Ara strip çağrıları son kırpma tarafından kapsandığı için atlanır. Çıktı
+    TextCleaner.stepwise_clean ile birebir aynıdır.
+    """
+
+    def __init__(self):
+        self.stats = {"texts": 0, "chars": 0, "seconds": 0.0}
+
+    def clean(self, text: str) -> str:
+        """
+        Kapsamlı temizlik (TextCleaner.destructive_clean ile aynı çıktı)
+
+        Args:
+            text: Ham metin
+
+        Returns:
+            Temizlenmiş metin (10 karakterden kısaysa boş)
+        """
+        if not text:
+            return ""
+
+        if "http" in text:
+            text = _URL_PATTERN.sub("", text)
+        if "&" in text:
+            text = html.unescape(text)
+        if "<" in text:
+            text = _TAG_PATTERN.sub("", text)
+
+        text = " ".join(_SPECIAL_PATTERN.sub("", text).split())
+        text = _REPEAT_PATTERN.sub(r"\1\1", text)
+
+        return text if len(text) > 10 else ""
+
+    def clean_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Metin grubunu temizle ve verim istatistiklerini güncelle
+
+        Args:
+            texts: Ham metinler
+
+        Returns:
+            Temizlenmiş metinler (aynı sırada)
+        """
+        start = time.perf_counter()
+        chars = 0
+        cleaned = []
+        for text in texts:
+            chars += len(text) if text else 0
+            cleaned.append(self.clean(text))
+
+        self.stats["texts"] += len(cleaned)
+        self.stats["chars"] += chars
+        self.stats["seconds"] += time.perf_counter() - start
+        return cleaned
+
+    @property
+    def chars_per_second(self) -> float:
+        """Şimdiye kadar clean_batch ile işlenen karakter/saniye"""
+        seconds = self.stats["seconds"]
+        return self.stats["chars"] / seconds if seconds > 0 else 0.0
+
+    def report(self) -> Dict:
+        """Toplam metin, karakter, süre ve karakter/saniye"""
+        return {**self.stats, "chars_per_second": round(self.chars_per_second, 1)}
+
+
+_ENGINE = CleaningEngine()
+
+
+class StreamingCleaner:
+    """
+    Parça parça (chunk) temizlik: çok büyük belgeler için akış halinde temizleyici
+
+    Adımlar CleaningEngine ile aynı sırada, her biri kendi akış aşaması olarak
+    uygulanır. Parça sınırını aşabilecek desenler için her aşama yalnızca
+    tamamlanamamış kuyruğu bekletir:
+    - URL: metin sonuna kadar uzanan eşleşme veya yarım "http(s)://" öneki,
+    - HTML entity: son "&" ile başlayıp metin sonuna kadar uzanan entity,
+    - etiket: son ">" işaretinden sonraki ilk "<" ile başlayan kısım,
+    - boşluk daraltma: son boşluktan sonraki yarım kelime,
+    - tekrar eden karakterler: metin sonundaki aynı karakter dizisi.
+    Bellek kullanımı parça boyutu ile sınırlıdır (kapanmayan tek bir etiket, URL
+    veya kelime dışında). Çıktı parçalarının birleşimi tüm metin üzerinde
+    çalışan yöntemlerin sonucuyla aynıdır.
+    """
+
+    def __init__(
+        self, remove_special: bool = True, collapse_repeats: bool = True, min_length: int = 11
+    ):
+        """
+        Args:
+            remove_special: Özel karakterleri sil (destructive_clean adımı)
+            collapse_repeats: 4+ tekrar eden karakteri ikiye indir (destructive_clean adımı)
+            min_length: Toplam çıktı bundan kısaysa hiçbir şey üretilmez
+        """
+        self.remove_special = remove_special
+        self.collapse_repeats = collapse_repeats
+        self.min_length = max(0, int(min_length))
+        self._tails = {"url": "", "entity": "", "tag": "", "word": "", "run": ""}
+        self._has_words = False
+        self._pending: Optional[List[str]] = [] if self.min_length else None
+        self._pending_length = 0
+
+    @classmethod
+    def destructive(cls) -> "StreamingCleaner":
+        """TextCleaner.destructive_clean ile aynı çıktıyı veren temizleyici"""
+        return cls()
+
+    @classmethod
+    def for_ai(cls) -> "StreamingCleaner":
+        """TextCleaner.preprocess_for_ai ile aynı çıktıyı veren temizleyici"""
+        return cls(remove_special=False, collapse_repeats=False, min_length=0)
+
+    def iter_clean(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Metin parçalarını temizleyerek üret
+
+        Args:
+            chunks: Ham metin parçaları
+
+        Yields:
+            Temizlenmiş parçalar (boş parçalar üretilmez)
+        """
+        for chunk in chunks:
+            cleaned = self.feed(chunk)
+            if cleaned:
+                yield cleaned
+
+        cleaned = self.flush()
+        if cleaned:
+            yield cleaned
+
+    def feed(self, chunk: str) -> str:
+        """
+        Sonraki parçayı işle
+
+        Args:
+            chunk: Ham metin parçası
+
+        Returns:
+            Kesinleşen temizlenmiş metin (sonraki parçaya bağlı kısım bekletilir)
+        """
+        return self._run(chunk or "", final=False)
+
+    def flush(self) -> str:
+        """Bekletilen kuyrukları işle ve akışı bitir"""
+        output = self._run("", final=True)
+        if self._pending is not None:
+            # Toplam çıktı min_length'e ulaşmadı
+            self._pending = []
+            return ""
+        return output
+
+    def _run(self, text: str, final: bool) -> str:
+        text = self._urls(text, final)
+        text = self._entities(text, final)
+        text = self._tags(text, final)
+        if self.remove_special:
+            text = _SPECIAL_PATTERN.sub("", text)
+        text = self._whitespace(text, final)
+        if self.collapse_repeats:
+            text = self._repeats(text, final)
+        return self._emit(text)
+
+    def _urls(self, text: str, final: bool) -> str:
+        buf = self._tails["url"] + text
+        hold = len(buf)
+        if not final:
+            last = None
+            for last in _URL_PATTERN.finditer(buf):
+                pass
+            if last is not None and last.end() == len(buf):
+                hold = last.start()
+            else:
+                # En uzun yarım önek en erken başlangıcı verir
+                for size in range(min(8, len(buf)), 0, -1):
+                    if any(prefix.startswith(buf[-size:]) for prefix in _URL_PREFIXES):
+                        hold = len(buf) - size
+                        break
+
+        self._tails["url"] = buf[hold:]
+        return _URL_PATTERN.sub("", buf[:hold]) if "http" in buf[:hold] else buf[:hold]
+
+    def _entities(self, text: str, final: bool) -> str:
+        buf = self._tails["entity"] + text
+        hold = len(buf)
+        amp = buf.rfind("&")
+        if not final and amp != -1:
+            match = _ENTITY_PATTERN.match(buf, amp)
+            if match is None and buf[amp:] in ("&", "&#", "&#x", "&#X"):
+                hold = amp
+            elif match is not None and match.end() == len(buf):
+                hold = amp
+
+        self._tails["entity"] = buf[hold:]
+        return html.unescape(buf[:hold])
+
+    def _tags(self, text: str, final: bool) -> str:
+        buf = self._tails["tag"] + text
+        hold = len(buf)
+        if not final:
+            # Kapanmamış etiket başlangıcı: son ">" işaretinden sonraki ilk "<"
+            start = buf.find("<", buf.rfind(">") + 1)
+            if start != -1:
+                hold = start
+
+        self._tails["tag"] = buf[hold:]
+        return _TAG_PATTERN.sub("", buf[:hold]) if "<" in buf[:hold] else buf[:hold]
+
+    def _whitespace(self, text: str, final: bool) -> str:
+        buf = self._tails["word"] + text
+        cut = len(buf)
+        if not final:
+            while cut > 0 and not buf[cut - 1].isspace():
+                cut -= 1
+
+        self._tails["word"] = buf[cut:]
+        words = buf[:cut].split()
+        if not words:
+            return ""
+        separator = " " if self._has_words else ""
+        self._has_words = True
+        return separator + " ".join(words)
+
+    def _repeats(self, text: str, final: bool) -> str:
+        buf = self._tails["run"] + text
+        cut = len(buf)
+        if not final and buf:
+            # Sondaki aynı karakter dizisi sonraki parçada devam edebilir
+            cut -= 1
+            while cut > 0 and buf[cut - 1] == buf[-1]:
+                cut -= 1
+
+        self._tails["run"] = buf[cut:]
+        return _REPEAT_PATTERN.sub(r"\1\1", buf[:cut])
+
+    def _emit(self, text: str) -> str:
+        if self._pending is None:
+            return text
+
+        self._pending.append(text)
+        self._pending_length += len(text)
+        if self._pending_length < self.min_length:
+            return ""
+
+        output, self._pending = "".join(self._pending), None
+        return output
 
 
 class TextCleaner:
@@ -25,6 +299,39 @@ class TextCleaner:
 
         return text.strip()
 
+    @staticmethod
+    def extract_html(html_text, **options) -> str:
+        """
+        HTML'den ana metni paragraflar halinde çıkar (lxml, şablon metin ayıklamalı)
+        clean_html'in aksine script/style içeriği ve menü/altbilgi blokları atlanır.
+
+        Args:
+            html_text: HTML metni, dosya nesnesi veya parça iterable'ı
+            **options: HTMLExtractor parametreleri (min_words, max_link_density, ...)
+
+        Returns:
+            Boş satırla ayrılmış paragraflar
+        """
+        from .extract import HTMLExtractor
+
+        return HTMLExtractor(**options).extract(html_text)
+
+    @staticmethod
+    def scrub_pii(text: str, policy: str = "replace") -> str:
+        """
+        E-posta, telefon, IBAN ve geçerli TC kimlik numaralarını tek geçişte temizle
+
+        Args:
+            text: Metin
+            policy: "replace", "mask" veya "remove" (bkz. PIIScrubber)
+
+        Returns:
+            Temizlenmiş metin
+        """
+        from .pii import PIIScrubber
+
+        return PIIScrubber(policy=policy).scrub(text)[0]
+
     @staticmethod
     def clean_whitespace(text: str) -> str:
         """Gereksiz boşlukları temizle"""
@@ -72,7 +379,12 @@ class TextCleaner:
 
     @staticmethod
     def destructive_clean(text: str) -> str:
-        """Kapsamlı temizlik (tüm işlemler)"""
+        """Kapsamlı temizlik (tüm işlemler, derlenmiş motor ile, bkz. CleaningEngine)"""
+        return _ENGINE.clean(text)
+
+    @staticmethod
+    def stepwise_clean(text: str) -> str:
+        """Kapsamlı temizlik, adım adım (destructive_clean'in referans tanımı)"""
         if not text:
             return ""
 
@@ -94,6 +406,22 @@ class TextCleaner:
 
         return "\n".join(cleaned_lines)
 
+    @staticmethod
+    def iter_destructive_clean(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        destructive_clean'in akış hali: parçaları temizleyerek üretir
+        Birleşik çıktı destructive_clean(tüm metin) ile aynıdır (bkz. StreamingCleaner).
+        """
+        return StreamingCleaner.destructive().iter_clean(chunks)
+
+    @staticmethod
+    def iter_preprocess_for_ai(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        preprocess_for_ai'in akış hali: parçaları temizleyerek üretir
+        Birleşik çıktı preprocess_for_ai(tüm metin) ile aynıdır (bkz. StreamingCleaner).
+        """
+        return StreamingCleaner.for_ai().iter_clean(chunks)
+
     @staticmethod
     def preprocess_for_ai(text: str) -> str:
         """AI işleme için optimizasyon"""
@@ -0,0 +1,627 @@
+"""
+data4tr - Scrape Coordinator
+Birden fazla process/makinede çalışan scraper worker'ları için dağıtık iş kuyruğu
+ve paylaşılan rate limit. Harici bir broker gerektirmez; durum, worker'ların
+erişebildiği bir dizindeki SQLite veritabanında tutulur.
+
+Veritabanı WAL yerine rollback journal kullanır: WAL paylaşılan belleğe (-shm)
+dayandığı için ağ dosya sistemlerinde güvenli değildir. Birden fazla makine aynı
+dizini kullanacaksa dosya sistemi POSIX dosya kilitlerini desteklemelidir
+(ör. kilitleme açık NFSv4); kilit desteği olmayan paylaşımlarda tek makine kullanın.
+"""
+
+import asyncio
+import collections
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Kuyruk veritabanına bağlan (işlemler BEGIN IMMEDIATE ile elle yönetilir)"""
+    conn = sqlite3.connect(str(path), timeout=60, isolation_level=None, check_same_thread=False)
+    # Ağ dosya sistemlerinde de çalışan rollback journal (bkz. modül açıklaması)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.execute("PRAGMA busy_timeout=60000")
+    return conn
+
+
+class SharedRateLimiter:
+    """
+    Process'ler arası paylaşılan token bucket
+    TokenBucket ile aynı arayüze sahiptir (acquire, acquire_async, set_rate, rate);
+    token durumu SQLite'ta tutulur. Her yazma işlemi bir grup token ayırır ve
+    tokenlar process içinde sırayla dağıtılır; böylece worker'lar her istek için
+    veritabanı kilidini beklemez. Aynı anahtarı kullanan tüm worker'lar toplamda
+    `rate` istek/sn aşmaz ve RequestController'ın AIMD ayarlamaları tüm worker'lara
+    yansır.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        reserve_seconds: float = 0.1,
+    ):
+        """
+        Args:
+            path: Paylaşılan SQLite dosyası
+            key: Limitin anahtarı (genellikle kaynak adı)
+            rate: Başlangıç hızı (saniyede token, <= 0 ise sınırsız); limit daha önce
+                başka bir worker tarafından oluşturulduysa kayıtlı değer kullanılır
+            capacity: Biriktirilebilecek maksimum token (burst) sayısı
+            reserve_seconds: Bir yazma işleminde ayrılan token miktarı (hızın kaç
+                saniyelik kısmı; en az 1 token)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.key = key
+        self.reserve_seconds = max(0.0, float(reserve_seconds))
+        # Ayrılmış ama henüz dağıtılmamış tokenların kullanılabilir olacağı zamanlar
+        self._reserved = collections.deque()
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                rate REAL NOT NULL,
+                capacity REAL NOT NULL,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            )
+            """)
+
+        rate = float(rate)
+        capacity = float(capacity) if capacity else max(1.0, rate)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO rate_limits VALUES (?, ?, ?, ?, ?)",
+            (key, rate, capacity, capacity, time.time()),
+        )
+        self._rate = self._conn.execute(
+            "SELECT rate FROM rate_limits WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    @property
+    def rate(self) -> float:
+        """Son okunan ortak hız (saniyede token)"""
+        return self._rate
+
+    def _reserve(self) -> float:
+        """
+        Bir token al (yerel grup boşsa ortak bucket'tan yeni grup ayrılır)
+
+        Returns:
+            Token kullanılabilir olana kadar beklenmesi gereken süre (saniye)
+        """
+        with self._lock:
+            if not self._reserved and not self._reserve_batch():
+                return 0.0
+            ready = self._reserved.popleft()
+
+        return max(0.0, ready - time.time())
+
+    def _reserve_batch(self) -> bool:
+        """
+        Ortak bucket'tan tek bir yazma işleminde bir grup token ayır (kilit altında)
+
+        Grup içindeki tokenların zamanları, aynı anda tek tek ayrılmış gibi hesaplanır.
+
+        Returns:
+            Hız sınırsızsa False (token ayrılmaz)
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            rate, capacity, tokens, updated = self._conn.execute(
+                "SELECT rate, capacity, tokens, updated FROM rate_limits WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            self._rate = rate
+            if rate <= 0:
+                self._conn.execute("COMMIT")
+                return False
+
+            now = time.time()
+            available = min(capacity, tokens + max(0.0, now - updated) * rate)
+            count = max(1, int(rate * self.reserve_seconds))
+            self._conn.execute(
+                "UPDATE rate_limits SET tokens = ?, updated = ? WHERE key = ?",
+                (available - count, now, self.key),
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        for i in range(count):
+            self._reserved.append(now + max(0.0, (i + 1 - available) / rate))
+        return True
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Ortak hızı güncelle (biriken tokenlar korunur)
+
+        Args:
+            rate: Yeni hız (saniyede token)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                old_rate, capacity, tokens, updated = self._conn.execute(
+                    "SELECT rate, capacity, tokens, updated FROM rate_limits WHERE key = ?",
+                    (self.key,),
+                ).fetchone()
+                now = time.time()
+                if old_rate > 0:
+                    tokens = min(capacity, tokens + max(0.0, now - updated) * old_rate)
+                self._conn.execute(
+                    "UPDATE rate_limits SET rate = ?, tokens = ?, updated = ? WHERE key = ?",
+                    (float(rate), tokens, now, self.key),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._rate = float(rate)
+            # Eski hızla ayrılmış tokenlar bırakılır (ortak bütçe aşılmaz)
+            self._reserved.clear()
+
+    def acquire(self) -> None:
+        """Token alınana kadar bekle (blocking)"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Token alınana kadar bekle (asyncio)"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class WorkQueue:
+    """
+    SQLite tabanlı kalıcı iş kuyruğu
+    Her iş birimi bir kaynaktan çekilecek kayıt sayısını (limit) ve scraper
+    konfigürasyonuna uygulanacak ek ayarları (params) taşır. Birimler süreli
+    kiralama (lease) ile dağıtılır; heartbeat gelmeyen birimler süre dolunca
+    başka bir worker'a verilir.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        """
+        Args:
+            path: Kuyruk veritabanı dosyası
+            max_attempts: Bir birimin başarısız sayılmadan önce kiralanabileceği sayı
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, int(max_attempts))
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS work_units (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                output TEXT,
+                produced INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            )
+            """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON work_units (status, id)")
+
+    def _transaction(self, func, *args):
+        """Fonksiyonu yazma kilidi alınmış tek bir işlem içinde çalıştır"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = func(*args)
+                self._conn.execute("COMMIT")
+                return result
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def add(self, source: str, size: int, params: Optional[Dict] = None) -> int:
+        """
+        Kuyruğa iş birimi ekle
+
+        Args:
+            source: Kaynak adı
+            size: Çekilecek kayıt sayısı
+            params: Kaynak konfigürasyonuna uygulanacak ek ayarlar
+
+        Returns:
+            Birim ID'si
+        """
+        cursor = self._transaction(
+            self._conn.execute,
+            "INSERT INTO work_units (source, size, params) VALUES (?, ?, ?)",
+            (source, int(size), json.dumps(params or {}, ensure_ascii=False)),
+        )
+        return cursor.lastrowid
+
+    def lease(self, worker: str, lease_seconds: float = 60.0) -> Optional[Dict]:
+        """
+        Bekleyen bir birimi kirala
+
+        Süresi dolmuş kiralamalar önce kuyruğa geri alınır (ölü worker tespiti).
+
+        Args:
+            worker: Worker kimliği
+            lease_seconds: Kiralama süresi (heartbeat ile uzatılır)
+
+        Returns:
+            Birim sözlüğü veya bekleyen birim yoksa None
+        """
+
+        def lease_unit():
+            now = time.time()
+            expired = self._conn.execute(
+                "SELECT id, worker, attempts FROM work_units "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (now,),
+            ).fetchall()
+            for unit_id, dead_worker, attempts in expired:
+                status = "failed" if attempts >= self.max_attempts else "pending"
+                self._conn.execute(
+                    "UPDATE work_units SET status = ?, worker = NULL, error = ? WHERE id = ?",
+                    (status, f"Kiralama süresi doldu: {dead_worker}", unit_id),
+                )
+                logger.warning(f"Birim {unit_id} geri alındı, worker yanıt vermiyor: {dead_worker}")
+
+            row = self._conn.execute(
+                "SELECT id, source, size, params, attempts FROM work_units "
+                "WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE work_units SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (worker, now + lease_seconds, row[0]),
+            )
+            return {
+                "id": row[0],
+                "source": row[1],
+                "size": row[2],
+                "params": json.loads(row[3]),
+                "attempt": row[4] + 1,
+            }
+
+        return self._transaction(lease_unit)
+
+    def heartbeat(self, unit_id: int, worker: str, lease_seconds: float = 60.0) -> bool:
+        """
+        Kiralamayı uzat
+
+        Returns:
+            Kiralama hâlâ bu worker'daysa True
+        """
+        cursor = self._transaction(
+            self._conn.execute,
+            "UPDATE work_units SET lease_expires = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (time.time() + lease_seconds, unit_id, worker),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, unit_id: int, worker: str, output: str, produced: int) -> bool:
+        """
+        Birimi tamamlandı olarak işaretle
+
+        Args:
+            unit_id: Birim ID'si
+            worker: Worker kimliği
+            output: Birimin çıktı dosyası
+            produced: Üretilen kayıt sayısı
+
+        Returns:
+            Kiralama hâlâ bu worker'daysa True (değilse çıktı yok sayılır)
+        """
+        cursor = self._transaction(
+            self._conn.execute,
+            "UPDATE work_units SET status = 'done', output = ?, produced = ?, "
+            "lease_expires = NULL, error = NULL WHERE id = ? AND worker = ? AND status = 'leased'",
+            (output, int(produced), unit_id, worker),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, unit_id: int, worker: str, error: str = "") -> None:
+        """Başarısız birimi kuyruğa geri bırak (deneme hakkı bittiyse başarısız say)"""
+        self._transaction(
+            self._conn.execute,
+            "UPDATE work_units SET status = CASE WHEN attempts >= ? THEN 'failed' "
+            "ELSE 'pending' END, worker = NULL, lease_expires = NULL, error = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (self.max_attempts, error, unit_id, worker),
+        )
+
+    def outputs(self) -> List[str]:
+        """Tamamlanan birimlerin çıktı dosyaları (birim sırasıyla)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT output FROM work_units WHERE status = 'done' ORDER BY id"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def status(self) -> Dict[str, int]:
+        """
+        Kuyruk durumu
+
+        Returns:
+            Durum -> birim sayısı sözlüğü ve üretilen toplam kayıt ("produced")
+        """
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        with self._lock:
+            for status, count in self._conn.execute(
+                "SELECT status, COUNT(*) FROM work_units GROUP BY status"
+            ):
+                counts[status] = count
+            counts["produced"] = self._conn.execute(
+                "SELECT COALESCE(SUM(produced), 0) FROM work_units WHERE status = 'done'"
+            ).fetchone()[0]
+        return counts
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapat"""
+        with self._lock:
+            self._conn.close()
+
+
+class ScrapeCoordinator:
+    """
+    Dağıtık scrape koordinatörü
+    Dizin yapısı:
+        queue.sqlite   - İş birimleri ve paylaşılan rate limit
+        parts/         - Worker çıktıları (birim ve worker başına bir JSONL)
+
+    Aynı dizine erişen her process (veya makine) run_worker ile kuyruğa katılır;
+    makineler arası paylaşım için dosya kilidi destekleyen bir dosya sistemi gerekir.
+    Worker'ların scraper'ları rate_limit.shared_state ayarıyla oluşturulur, böylece
+    kaynağın istek bütçesi tüm worker'lar arasında paylaşılır.
+    """
+
+    def __init__(self, directory: str, source_name: str, max_attempts: int = 3):
+        """
+        Args:
+            directory: Koordinasyon dizini (tüm worker'lar için ortak)
+            source_name: Kaynak adı
+            max_attempts: Birim başına maksimum deneme
+        """
+        self.directory = Path(directory)
+        self.source_name = source_name
+        self.parts_dir = self.directory / "parts"
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        self.queue_path = self.directory / "queue.sqlite"
+        self.queue = WorkQueue(self.queue_path, max_attempts=max_attempts)
+
+    def plan(self, total: int, unit_size: int = 500, params: Optional[Dict] = None) -> int:
+        """
+        Toplam kayıt sayısını iş birimlerine böl ve kuyruğa ekle
+
+        Args:
+            total: Çekilecek toplam kayıt sayısı
+            unit_size: Birim başına kayıt sayısı
+            params: Tüm birimlere uygulanacak ek kaynak ayarları
+
+        Returns:
+            Eklenen birim sayısı
+        """
+        unit_size = max(1, int(unit_size))
+        units = 0
+        for start in range(0, int(total), unit_size):
+            self.queue.add(self.source_name, min(unit_size, total - start), params)
+            units += 1
+
+        logger.info(f"{units} iş birimi planlandı ({total} kayıt, {self.source_name})")
+        return units
+
+    def plan_ranges(self, ranges: List[Tuple[Optional[str], Optional[str]]]) -> int:
+        """
+        Başlık aralıklarını enumeration modunda birer iş birimi olarak kuyruğa ekle
+        Her birim aralığın tamamını çeker (bkz. partition_title_space).
+
+        Args:
+            ranges: (title_from, title_to) çiftleri
+
+        Returns:
+            Eklenen birim sayısı
+        """
+        for title_from, title_to in ranges:
+            params = {
+                "api": {"fetch_mode": "enumerate", "title_from": title_from, "title_to": title_to}
+            }
+            self.queue.add(self.source_name, 0, params)
+
+        logger.info(f"{len(ranges)} başlık aralığı planlandı ({self.source_name})")
+        return len(ranges)
+
+    def run_worker(
+        self,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 60.0,
+        max_units: Optional[int] = None,
+        scraper=None,
+    ) -> int:
+        """
+        Kuyruk boşalana kadar birim kirala, çek ve çıktıyı yaz
+
+        Kiralama arka planda lease_seconds / 3 aralıkla uzatılır. Kiralama
+        kaybedilirse (ör. worker uzun süre donduysa ve birim başkasına verildiyse)
+        birim bırakılır ve çıktısı kullanılmaz.
+
+        Args:
+            worker_id: Worker kimliği (varsayılan: makine-pid-rastgele)
+            lease_seconds: Kiralama süresi
+            max_units: En fazla işlenecek birim sayısı
+            scraper: Kullanılacak Scraper instance'ı (varsayılan: yeni oluşturulur)
+
+        Returns:
+            Bu worker'ın ürettiği kayıt sayısı
+        """
+        if scraper is None:
+            from .scraper import Scraper
+
+            scraper = Scraper()
+
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        produced = 0
+        units = 0
+
+        while max_units is None or units < max_units:
+            unit = self.queue.lease(worker_id, lease_seconds)
+            if unit is None:
+                break
+
+            units += 1
+            produced += self._run_unit(scraper, unit, worker_id, lease_seconds)
+
+        logger.info(f"Worker {worker_id} bitti: {units} birim, {produced} kayıt")
+        return produced
+
+    def _run_unit(self, scraper, unit: Dict, worker_id: str, lease_seconds: float) -> int:
+        """Tek bir birimi işle; tamamlanırsa üretilen kayıt sayısını döndür"""
+        output = self.parts_dir / f"unit-{unit['id']:06d}.{worker_id}.jsonl"
+        lost = threading.Event()
+        stop = threading.Event()
+
+        def heartbeat() -> None:
+            while not stop.wait(lease_seconds / 3):
+                if not self.queue.heartbeat(unit["id"], worker_id, lease_seconds):
+                    lost.set()
+                    return
+
+        overrides = dict(unit["params"])
+        overrides["rate_limit"] = {
+            **overrides.get("rate_limit", {}),
+            "shared_state": str(self.queue_path),
+            "shared_key": unit["source"],
+        }
+        # Birimin devam noktası kuyruktur: birim ya tamamlanıp çıktısıyla kaydedilir ya
+        # da baştan yeniden çalıştırılır. Makineye özel aralık checkpoint'i kullanılırsa
+        # başarısız denemede çekilen sayfalar yeni denemede atlanır, eski bir "bitti"
+        # kaydı da yeniden planlanan aralığın boş çıktı üretmesine yol açar.
+        overrides["enumeration"] = {
+            **overrides.get("enumeration", {}),
+            "checkpoint_dir": None,
+        }
+
+        beat = threading.Thread(target=heartbeat, daemon=True)
+        beat.start()
+        count = 0
+        try:
+            scraper_instance = scraper.create_scraper(unit["source"], overrides)
+            if scraper_instance is None:
+                raise RuntimeError(f"Scraper oluşturulamadı: {unit['source']}")
+
+            stream = scraper_instance.iter_scrape(unit["size"])
+            try:
+                with open(output, "w", encoding="utf-8") as f:
+                    for record in stream:
+                        if lost.is_set():
+                            break
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        count += 1
+            finally:
+                stream.close()
+        except Exception as e:
+            logger.error(f"Birim {unit['id']} başarısız: {e}")
+            self.queue.release(unit["id"], worker_id, str(e))
+            return 0
+        finally:
+            stop.set()
+            beat.join()
+
+        if lost.is_set() or not self.queue.complete(unit["id"], worker_id, str(output), count):
+            logger.warning(f"Birim {unit['id']} kiralaması kaybedildi, çıktı yok sayılıyor")
+            output.unlink(missing_ok=True)
+            return 0
+
+        logger.info(f"Birim {unit['id']} tamamlandı: {count} kayıt")
+        return count
+
+    def run_local(self, processes: int = 2, lease_seconds: float = 60.0) -> int:
+        """
+        Bu makinede birden fazla worker process'i çalıştır ve bitmelerini bekle
+
+        Args:
+            processes: Worker process sayısı
+            lease_seconds: Kiralama süresi
+
+        Returns:
+            Kuyrukta üretilmiş toplam kayıt sayısı
+        """
+        workers = [
+            multiprocessing.Process(
+                target=_worker_main,
+                args=(str(self.directory), self.source_name, lease_seconds),
+            )
+            for _ in range(max(1, int(processes)))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return self.queue.status()["produced"]
+
+    def merge(self, output_path: str) -> int:
+        """
+        Tamamlanan birimlerin çıktılarını tek bir JSONL dosyasında birleştir
+        Aynı ID'li kayıtların yalnızca ilki yazılır.
+
+        Args:
+            output_path: Çıktı dosyası
+
+        Returns:
+            Yazılan kayıt sayısı
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        seen = set()
+        written = 0
+
+        with open(output_path, "w", encoding="utf-8") as out:
+            for part in self.queue.outputs():
+                with open(part, "r", encoding="utf-8") as f:
+                    for line in f:
+                        record = json.loads(line)
+                        record_id = record.get("id")
+                        if record_id is not None:
+                            if record_id in seen:
+                                continue
+                            seen.add(record_id)
+                        out.write(line)
+                        written += 1
+
+        logger.info(f"{written} kayıt birleştirildi: {output_path}")
+        return written
+
+    def status(self) -> Dict[str, int]:
+        """Kuyruk durumu (bkz. WorkQueue.status)"""
+        return self.queue.status()
+
+
+def _worker_main(directory: str, source_name: str, lease_seconds: float) -> None:
+    """Worker process giriş noktası"""
+    coordinator = ScrapeCoordinator(directory, source_name)
+    coordinator.run_worker(lease_seconds=lease_seconds)
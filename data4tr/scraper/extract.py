@@ -0,0 +1,293 @@
+"""
+data4tr - HTML Extractor
+HTML sayfalarından ana metni paragraflar halinde çıkaran modül.
+
+lxml'in C ayrıştırıcısı target arayüzüyle kullanılır: DOM ağacı kurulmaz,
+etiket olayları geldikçe metin blokları toplanır. Sayfa parça parça beslenebildiği
+için çok megabaytlık sayfalarda bellek kullanımı sayfa boyutundan bağımsız kalır.
+script/style/nav/footer gibi içerik dışı bölümler atlanır, kalan bloklar kelime
+sayısı ve bağlantı yoğunluğuna göre puanlanarak şablon metin (menü, bağlantı
+listeleri, telif satırları) elenir.
+"""
+
+import logging
+import re
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Union
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# İçeriği tamamen atlanan etiketler
+SKIP_TAGS = frozenset(
+    [
+        "script", "style", "noscript", "template", "nav", "footer", "header", "aside",
+        "form", "button", "select", "iframe", "svg", "canvas", "object", "head",
+    ]
+)  # fmt: skip
+
+# Yeni metin bloğu başlatan etiketler
+BLOCK_TAGS = frozenset(
+    [
+        "p", "div", "section", "article", "main", "li", "ul", "ol", "dl", "dt", "dd",
+        "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "table", "tr", "td", "th",
+        "caption", "figcaption", "figure", "br", "hr", "body", "address", "details", "summary",
+    ]
+)  # fmt: skip
+
+HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+
+# class/id değerinin bir parçası bu işaretlerle başlıyorsa bölüm atlanır (örn. "sidebar-left")
+_BOILERPLATE_PATTERN = re.compile(
+    r"(?:nav|navbar|navigation|menu|sidebar|footer|header|breadcrumbs?|cookie|share|"
+    r"social|advert\w*|ads?|banner|comments?|related|subscribe|popup)(?:[-_]|$)",
+    re.IGNORECASE,
+)
+
+# class/id işaretlerine bakılmayan kapsayıcı etiketler
+_CONTAINER_TAGS = frozenset(["html", "body", "main", "article"])
+
+
+class _Block:
+    """Toplanan metin bloğu"""
+
+    __slots__ = ("parts", "link_chars", "heading")
+
+    def __init__(self, heading: bool = False):
+        self.parts: List[str] = []
+        self.link_chars = 0
+        self.heading = heading
+
+
+class _BlockCollector:
+    """HTMLParser target'ı: etiket olaylarından metin blokları çıkarır"""
+
+    def __init__(self, extractor: "HTMLExtractor"):
+        self.extractor = extractor
+        self.paragraphs: List[str] = []
+        self._block = _Block()
+        self._stack: List[tuple] = []
+        self._skip_depth = 0
+        self._link_depth = 0
+        self._pending_headings: List[str] = []
+
+    def start(self, tag, attrib):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        skip = tag in SKIP_TAGS or (tag not in _CONTAINER_TAGS and self._is_boilerplate(attrib))
+        self._stack.append((tag, skip))
+
+        if skip:
+            self._skip_depth += 1
+        if self._skip_depth:
+            return
+        if tag in BLOCK_TAGS:
+            self._flush(heading=tag in HEADING_TAGS)
+        elif tag == "a":
+            self._link_depth += 1
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+
+        # Kapanmamış iç etiketler de kapatılır; yığını eşleşen etikete kadar boşalt
+        while self._stack:
+            open_tag, skip = self._stack.pop()
+            if skip:
+                self._skip_depth -= 1
+            elif not self._skip_depth:
+                if open_tag in BLOCK_TAGS:
+                    self._flush()
+                elif open_tag == "a":
+                    self._link_depth = max(0, self._link_depth - 1)
+            if open_tag == tag:
+                break
+
+    def data(self, text):
+        if self._skip_depth:
+            return
+        self._block.parts.append(text)
+        if self._link_depth:
+            self._block.link_chars += len(text.strip())
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        self._flush()
+        self._pending_headings = []
+        return None
+
+    def _is_boilerplate(self, attrib) -> bool:
+        """class/id şablon işareti içeriyor mu"""
+        if not attrib:
+            return False
+        marker = f"{attrib.get('class', '')} {attrib.get('id', '')}"
+        return any(_BOILERPLATE_PATTERN.match(token) for token in marker.split())
+
+    def _flush(self, heading: bool = False) -> None:
+        """Mevcut bloğu puanla, yeni blok başlat"""
+        block, self._block = self._block, _Block(heading)
+        text = " ".join("".join(block.parts).split())
+        if not text:
+            return
+
+        if block.heading:
+            # Başlıklar ancak ardından içerik bloğu gelirse yazılır
+            if block.link_chars <= len(text) * self.extractor.max_link_density:
+                self._pending_headings.append(text)
+            return
+
+        if self.extractor.score(text, block.link_chars) >= self.extractor.min_score:
+            self.paragraphs.extend(self._pending_headings)
+            self.paragraphs.append(text)
+        self._pending_headings = []
+
+
+class HTMLExtractor:
+    """
+    lxml tabanlı, artımlı HTML -> metin çıkarıcı
+
+    Örnek:
+        extractor = HTMLExtractor()
+        text = extractor.extract(html)
+        for paragraph in extractor.iter_paragraphs(open("sayfa.html", "rb")):
+            ...
+    """
+
+    def __init__(
+        self,
+        min_words: int = 5,
+        max_link_density: float = 0.33,
+        min_score: float = 1.0,
+        chunk_size: int = 64 * 1024,
+        encoding: Optional[str] = "utf-8",
+    ):
+        """
+        Args:
+            min_words: İçerik sayılması için bloktaki en az kelime sayısı
+            max_link_density: Bağlantı metni / blok metni oranının üst sınırı
+            min_score: Bloğun tutulması için gereken en düşük puan (bkz. score)
+            chunk_size: Dosya ve byte girdilerinde ayrıştırıcıya beslenen parça boyutu
+            encoding: Byte girdilerin kodlaması (None: libxml2 sayfadan tespit etmeye çalışır)
+        """
+        self.min_words = max(1, int(min_words))
+        self.max_link_density = float(max_link_density)
+        self.min_score = float(min_score)
+        self.chunk_size = max(1024, int(chunk_size))
+        self.encoding = encoding
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> "HTMLExtractor":
+        """
+        Kaynağın html konfigürasyon bölümünden çıkarıcı oluştur
+
+        Args:
+            config: {"min_words", "max_link_density", "min_score", "chunk_size", "encoding"}
+
+        Returns:
+            HTMLExtractor instance
+        """
+        config = config or {}
+        keys = ("min_words", "max_link_density", "min_score", "chunk_size", "encoding")
+        return cls(**{key: config[key] for key in keys if key in config})
+
+    def score(self, text: str, link_chars: int = 0) -> float:
+        """
+        Blok yoğunluk puanı
+
+        Puan = (kelime sayısı / min_words) * (1 - bağlantı yoğunluğu); bağlantı
+        yoğunluğu max_link_density'yi aşan bloklar 0 alır. Cümle sonu noktalaması
+        içermeyen kısa bloklar (menü öğeleri, etiket listeleri) yarı puan alır.
+
+        Args:
+            text: Boşlukları daraltılmış blok metni
+            link_chars: Blok içindeki bağlantı metni karakter sayısı
+
+        Returns:
+            Puan (min_score ve üzeri: içerik)
+        """
+        link_density = link_chars / len(text) if text else 1.0
+        if link_density > self.max_link_density:
+            return 0.0
+
+        words = text.count(" ") + 1
+        score = words / self.min_words * (1.0 - link_density)
+        if words < 2 * self.min_words and text[-1] not in ".!?:;\"'”»)":
+            score *= 0.5
+        return score
+
+    def iter_paragraphs(self, source: Union[str, bytes, IO, Iterable]) -> Iterator[str]:
+        """
+        HTML'den içerik paragraflarını geldikçe üret (streaming)
+
+        Args:
+            source: HTML metni (str/bytes), okunabilir dosya nesnesi veya
+                str/bytes parçaları üreten iterable
+
+        Yields:
+            Paragraf metinleri (sayfa sırasıyla)
+        """
+        collector = _BlockCollector(self)
+        parser = etree.HTMLParser(
+            target=collector, encoding=self.encoding, remove_comments=True, no_network=True
+        )
+
+        fed = False
+        for chunk in self._chunks(source):
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            fed = True
+            if collector.paragraphs:
+                yield from collector.paragraphs
+                collector.paragraphs.clear()
+
+        if not fed:
+            return
+        try:
+            parser.close()
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"HTML ayrıştırma hatası: {e}")
+        yield from collector.paragraphs
+        collector.paragraphs.clear()
+
+    def extract(self, source: Union[str, bytes, IO, Iterable]) -> str:
+        """
+        HTML'den ana metni çıkar
+
+        Args:
+            source: HTML metni, dosya nesnesi veya parça iterable'ı (bkz. iter_paragraphs)
+
+        Returns:
+            Boş satırla ayrılmış paragraflar
+        """
+        return "\n\n".join(self.iter_paragraphs(source))
+
+    def _chunks(self, source) -> Iterator[Union[str, bytes]]:
+        """Girdiyi chunk_size'lık parçalara böl"""
+        if isinstance(source, (str, bytes)):
+            for offset in range(0, len(source), self.chunk_size):
+                yield source[offset : offset + self.chunk_size]
+        elif hasattr(source, "read"):
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            yield from source
+
+
+def extract_text(html: Union[str, bytes, IO, Iterable], **options) -> str:
+    """
+    HTML'den ana metni çıkar (basit API)
+
+    Args:
+        html: HTML metni, dosya nesnesi veya parça iterable'ı
+        **options: HTMLExtractor parametreleri
+
+    Returns:
+        Boş satırla ayrılmış paragraflar
+    """
+    return HTMLExtractor(**options).extract(html)
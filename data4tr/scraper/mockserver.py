@@ -0,0 +1,454 @@
+"""
+data4tr - Mock Wikipedia Server
+Scraper testleri ve performans ölçümleri için yerel Wikipedia benzeri HTTP sunucusu.
+REST özet endpoint'ini (/page/random/summary) ve action API'yi (/w/api.php:
+generator=random, generator=allpages, list=recentchanges ve titles=) gecikme,
+hata oranı ve 429 patlamaları ile taklit eder. edit/delete/move ile son
+değişiklikler akışına olay eklenebilir.
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlparse
+
+from .sources.wikipedia import title_key
+
+logger = logging.getLogger(__name__)
+
+_WORDS = (
+    "türkiye tarih kültür şehir nehir dağ bölge halk dil edebiyat müzik sanat bilim "
+    "üniversite yüzyıl savaş antlaşma imparatorluk cumhuriyet nüfus ekonomi tarım "
+    "sanayi deniz göl ada köprü cami saray kale yazar şair ressam besteci oyuncu "
+    "film roman şiir gazete dergi takım lig kupa maç spor ilçe köy mahalle"
+).split()
+
+_TR_UPPER = {"i": "İ", "ı": "I"}
+
+
+class MockWikipediaServer:
+    """
+    Yerel Wikipedia benzeri sunucu
+    Sayfalar seed'den deterministik olarak üretilir; aynı ayarlarla her çalıştırma
+    aynı içeriği ve aynı hata dizisini üretir.
+
+    Kullanım:
+        with MockWikipediaServer(latency=0.02, error_rate=0.01) as server:
+            config["api"]["base_url"] = server.url
+    """
+
+    def __init__(
+        self,
+        pages: int = 10000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_every: int = 0,
+        throttle_burst: int = 0,
+        retry_after: Optional[float] = None,
+        extract_limit: int = 20,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            pages: Sanal vikideki sayfa sayısı
+            latency: Yanıt başına sabit gecikme (saniye)
+            jitter: Gecikmeye eklenen rastgele süre üst sınırı (saniye)
+            error_rate: 503 döndürülen isteklerin oranı (0-1)
+            throttle_every: Kaç istekte bir 429 patlaması başlayacağı (0: kapalı)
+            throttle_burst: Patlama başına art arda 429 döndürülen istek sayısı
+            retry_after: 429 yanıtlarındaki Retry-After değeri (saniye)
+            extract_limit: Action API'de istek başına döndürülen özet sayısı
+                (gerçek API'deki exlimit sınırı gibi; kalanlar excontinue ile gelir)
+            seed: İçerik ve hata dizisi için seed
+            host: Dinlenecek adres
+            port: Dinlenecek port (0: boş bir port seçilir)
+        """
+        self.pages = max(1, int(pages))
+        self.latency = float(latency)
+        self.jitter = float(jitter)
+        self.error_rate = float(error_rate)
+        self.throttle_every = int(throttle_every)
+        self.throttle_burst = int(throttle_burst)
+        self.retry_after = retry_after
+        self.extract_limit = max(1, int(extract_limit))
+        self.seed = seed
+        self.host = host
+        self.port = port
+
+        self.stats = {"requests": 0, "ok": 0, "errors": 0, "throttled": 0}
+        self._random = random.Random(seed)
+        self._batches = 0
+        self._order = None
+        self._index = None
+        self._revisions = {}
+        self._deleted = set()
+        self._moved = {}
+        self._changes = []
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Sunucunun kök URL'i"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockWikipediaServer":
+        """Sunucuyu arka plan thread'inde başlat"""
+        handler = type("Handler", (_Handler,), {"server_state": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Mock Wikipedia sunucusu başladı: {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Sunucuyu durdur"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockWikipediaServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def title(self, index: int) -> str:
+        """Sayfa başlığı (farklı Türkçe baş harfleriyle, örn. "Şehir 000012")"""
+        if index in self._moved:
+            return self._moved[index]
+        word = _WORDS[index % len(_WORDS)]
+        return _TR_UPPER.get(word[0], word[0].upper()) + word[1:] + f" {index:06d}"
+
+    def edit(self, index: int) -> None:
+        """Sayfayı düzenle (özet değişir, son değişikliklere "edit" eklenir)"""
+        self._revisions[index] = self._revisions.get(index, 0) + 1
+        self._record_change("edit", index)
+
+    def delete(self, index: int) -> None:
+        """Sayfayı sil (son değişikliklere silme günlüğü eklenir)"""
+        self._deleted.add(index)
+        self._record_change("log", index, logtype="delete", logaction="delete")
+
+    def move(self, index: int, new_title: str) -> None:
+        """Sayfayı yeni başlığa taşı (son değişikliklere taşıma günlüğü eklenir)"""
+        old_title = self.title(index)
+        self._moved[index] = new_title
+        self._order = self._index = None
+        self._record_change(
+            "log",
+            index,
+            title=old_title,
+            logtype="move",
+            logaction="move",
+            logparams={"target_ns": 0, "target_title": new_title},
+        )
+
+    def _record_change(self, change_type: str, index: int, title: Optional[str] = None, **log):
+        with self._lock:
+            self._changes.append(
+                {
+                    "type": change_type,
+                    "ns": 0,
+                    "title": title or self.title(index),
+                    "pageid": index + 1,
+                    "rcid": len(self._changes) + 1,
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    **log,
+                }
+            )
+
+    def title_order(self) -> List[Tuple[bytes, int]]:
+        """
+        Başlıkların MediaWiki sıralaması (boşluk yerine alt çizgi, UTF-8 byte sırası)
+
+        Returns:
+            (sıralama anahtarı, sayfa numarası) çiftleri
+        """
+        if self._order is None:
+            self._order = sorted((title_key(self.title(i)), i) for i in range(self.pages))
+        return self._order
+
+    def page(self, index: int) -> Dict:
+        """
+        Deterministik sayfa içeriği
+
+        Args:
+            index: Sayfa numarası (0 .. pages - 1)
+
+        Returns:
+            pageid, title, url ve extract alanlarını içeren sözlük
+        """
+        rng = random.Random(self.seed * 1_000_003 + index)
+        sentences = []
+        for _ in range(rng.randint(3, 6)):
+            words = rng.choices(_WORDS, k=rng.randint(6, 14))
+            sentences.append(" ".join(words).capitalize() + ".")
+
+        revision = self._revisions.get(index)
+        if revision:
+            sentences.append(f"Düzenleme {revision}.")
+
+        title = self.title(index)
+        return {
+            "pageid": index + 1,
+            "title": title,
+            "url": f"https://tr.wikipedia.org/wiki/{quote(title.replace(' ', '_'))}",
+            "extract": f"{title} " + " ".join(sentences),
+        }
+
+    def _next_fault(self) -> Optional[int]:
+        """Bu isteğe enjekte edilecek hata durum kodu (yoksa None)"""
+        with self._lock:
+            self.stats["requests"] += 1
+            n = self.stats["requests"]
+            if self.throttle_every > 0 and (n - 1) % self.throttle_every < self.throttle_burst:
+                self.stats["throttled"] += 1
+                return 429
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 503
+            self.stats["ok"] += 1
+            return None
+
+    def _delay(self) -> None:
+        """Yapılandırılmış gecikmeyi uygula"""
+        delay = self.latency
+        if self.jitter > 0:
+            with self._lock:
+                delay += self._random.random() * self.jitter
+        if delay > 0:
+            time.sleep(delay)
+
+    def _random_index(self) -> int:
+        with self._lock:
+            return self._random.randrange(self.pages)
+
+    def random_summary(self) -> Dict:
+        """/page/random/summary yanıtı"""
+        page = self.page(self._random_index())
+        return {
+            "type": "standard",
+            "title": page["title"],
+            "displaytitle": page["title"],
+            "pageid": page["pageid"],
+            "extract": page["extract"],
+            "content_urls": {"desktop": {"page": page["url"]}},
+        }
+
+    def action_query(self, params: Dict[str, str]) -> Dict:
+        """
+        /w/api.php?action=query yanıtı (generator=random, formatversion=2)
+
+        Rastgele grup grncontinue token'ından türetilir; böylece excontinue ile
+        gelen devam isteği aynı sayfaları döndürür.
+        """
+        limit = min(int(params.get("grnlimit", 1)), 500)
+
+        if "grncontinue" in params:
+            token = int(params["grncontinue"])
+        else:
+            with self._lock:
+                self._batches += 1
+                token = self._batches * 7919 + self.seed
+
+        rng = random.Random(token)
+        indices = [rng.randrange(self.pages) for _ in range(limit)]
+        response = self._query_window(indices, params)
+        if "excontinue" in response["continue"]:
+            response["continue"]["grncontinue"] = str(token)
+        else:
+            response["continue"]["grncontinue"] = str(token + 1)
+        response["continue"]["continue"] = "grncontinue||"
+        return response
+
+    def allpages_query(self, params: Dict[str, str]) -> Dict:
+        """
+        /w/api.php?action=query yanıtı (generator=allpages, formatversion=2)
+
+        Başlıklar sıralı olarak gapfrom/gapcontinue'dan başlayıp gapto'ya kadar
+        (dahil) listelenir. Son grupta "continue" nesnesi döndürülmez.
+        """
+        limit = min(int(params.get("gaplimit", 10)), 500)
+        order = self.title_order()
+        keys = [key for key, _ in order]
+
+        start = params.get("gapcontinue", params.get("gapfrom"))
+        position = bisect_left(keys, title_key(start)) if start else 0
+        stop = bisect_right(keys, title_key(params["gapto"])) if "gapto" in params else len(keys)
+
+        window = order[position : min(position + limit, stop)]
+        indices = [index for _, index in window if index not in self._deleted]
+        response = self._query_window(indices, params)
+
+        if "excontinue" in response["continue"]:
+            if "gapcontinue" in params:
+                response["continue"]["gapcontinue"] = params["gapcontinue"]
+            response["continue"]["continue"] = "gapcontinue||"
+        elif position + limit < stop:
+            next_title = self.title(order[position + limit][1]).replace(" ", "_")
+            response["continue"] = {"gapcontinue": next_title, "continue": "gapcontinue||"}
+        else:
+            del response["continue"]
+        return response
+
+    def recentchanges_query(self, params: Dict[str, str]) -> Dict:
+        """
+        /w/api.php?action=query&list=recentchanges yanıtı (rcdir=newer)
+
+        rcstart'tan (dahil) itibaren değişiklikler eskiden yeniye listelenir.
+        """
+        limit = min(int(params.get("rclimit", 10)), 500)
+        start = params.get("rcstart", "")
+        position = int(params.get("rccontinue", 0))
+
+        with self._lock:
+            changes = [c for c in self._changes[position:] if c["timestamp"] >= start]
+
+        response = {"batchcomplete": True, "query": {"recentchanges": changes[:limit]}}
+        if len(changes) > limit:
+            # Bir sonraki isteğin başlayacağı günlük pozisyonu (rcid - 1)
+            response["continue"] = {
+                "rccontinue": str(changes[limit]["rcid"] - 1),
+                "continue": "-||",
+            }
+        return response
+
+    def titles_query(self, params: Dict[str, str]) -> Dict:
+        """
+        /w/api.php?action=query&titles=... yanıtı
+        Silinmiş veya bilinmeyen başlıklar "missing" olarak döner.
+        """
+        if self._index is None:
+            self._index = {self.title(i): i for i in range(self.pages)}
+
+        found, missing = [], []
+        for title in params["titles"].split("|"):
+            index = self._index.get(title.replace("_", " "))
+            if index is None or index in self._deleted:
+                missing.append({"ns": 0, "title": title, "missing": True})
+            else:
+                found.append(index)
+
+        response = self._query_window(found, params)
+        response["query"]["pages"] += missing
+        if not response["continue"]:
+            del response["continue"]
+        return response
+
+    def _query_window(self, indices: List[int], params: Dict[str, str]) -> Dict:
+        """
+        Sayfa grubunu query yanıtına dönüştür
+        Özetler extract_limit'lik dilimler halinde verilir, kalanlar için excontinue döner.
+        """
+        offset = int(params.get("excontinue", 0))
+        end = offset + self.extract_limit
+
+        pages = []
+        for i, index in enumerate(indices):
+            page = self.page(index)
+            item = {
+                "pageid": page["pageid"],
+                "ns": 0,
+                "title": page["title"],
+                "fullurl": page["url"],
+            }
+            if offset <= i < end:
+                item["extract"] = page["extract"]
+            pages.append(item)
+
+        cont = {"excontinue": end} if end < len(indices) else {}
+        return {"batchcomplete": not cont, "continue": cont, "query": {"pages": pages}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """MockWikipediaServer istek handler'ı"""
+
+    server_state: MockWikipediaServer = None
+
+    def do_GET(self):
+        state = self.server_state
+        parsed = urlparse(self.path)
+        state._delay()
+
+        fault = state._next_fault()
+        if fault is not None:
+            headers = {}
+            if fault == 429 and state.retry_after is not None:
+                headers["Retry-After"] = str(state.retry_after)
+            return self._send_json(fault, {"error": "mock"}, headers)
+
+        if parsed.path.endswith("/page/random/summary"):
+            return self._send_json(200, state.random_summary())
+
+        if parsed.path.endswith("/w/api.php"):
+            params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            if params.get("action") == "query" and params.get("generator") == "random":
+                return self._send_json(200, state.action_query(params))
+            if params.get("action") == "query" and params.get("generator") == "allpages":
+                return self._send_json(200, state.allpages_query(params))
+            if params.get("action") == "query" and params.get("list") == "recentchanges":
+                return self._send_json(200, state.recentchanges_query(params))
+            if params.get("action") == "query" and "titles" in params:
+                return self._send_json(200, state.titles_query(params))
+
+        self._send_json(404, {"error": "bulunamadı"})
+
+    def _send_json(self, status: int, data: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv: Optional[List[str]] = None):
+    """Sunucuyu komut satırından çalıştır"""
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="data4tr - Mock Wikipedia sunucusu")
+    parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    parser.add_argument("--pages", type=int, default=10000, help="Sayfa sayısı")
+    parser.add_argument("--latency", type=float, default=0.05, help="Gecikme (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Rastgele ek gecikme (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 oranı (0-1)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="429 patlama aralığı")
+    parser.add_argument("--throttle-burst", type=int, default=0, help="Patlama uzunluğu")
+    args = parser.parse_args(argv)
+
+    server = MockWikipediaServer(
+        pages=args.pages,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_every=args.throttle_every,
+        throttle_burst=args.throttle_burst,
+        port=args.port,
+    ).start()
+    print(f"Mock Wikipedia: {server.url}/page/random/summary, {server.url}/w/api.php")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
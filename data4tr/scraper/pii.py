@@ -0,0 +1,205 @@
+"""
+data4tr - PII Scrubber
+Yayınlamadan önce kişisel verileri (e-posta, telefon, IBAN, TC kimlik no) temizleyen modül.
+
+Tüm varlık türleri tek bir birleşik desenle, metin üzerinde tek geçişte bulunur.
+IBAN (mod-97) ve TC kimlik numarası sağlama toplamı yalnızca aday eşleşmelerde
+doğrulanır; geçersiz adaylar metinde olduğu gibi bırakılır. Kayıt başına bulunan
+varlık sayıları aynı geçişte tutulur.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = ("email", "iban", "tckn", "phone")
+
+# Varsayılan "replace" politikası yer tutucuları
+PLACEHOLDERS = {
+    "email": "[EPOSTA]",
+    "iban": "[IBAN]",
+    "tckn": "[TCKN]",
+    "phone": "[TELEFON]",
+}
+
+# Adaylar yalnızca token başında aranır (lookbehind), böylece tarama doğrusal kalır
+_PII_PATTERN = re.compile(
+    # E-posta
+    r"(?P<email>(?<![\w.%+-])[\w.%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}\b)"
+    # IBAN: ülke kodu + 2 kontrol hanesi + 11-30 karakter, 4'lü gruplar arasında boşluk olabilir
+    r"|(?P<iban>(?<![A-Za-z0-9])[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?"
+    r"(?![A-Za-z0-9]))"
+    # TC kimlik no: 0 ile başlamayan 11 hane
+    r"|(?P<tckn>(?<![\d+])[1-9]\d{10}(?!\d))"
+    # Telefon: +90 / 0090 / 0 önekli veya öneksiz, alan kodu parantezli olabilir,
+    # gruplar boşluk, nokta veya tire ile ayrılabilir
+    r"|(?P<phone>(?<![\w+])(?:(?:\+|00)90[ .-]?|0)?(?:\([2-5]\d{2}\)|[2-5]\d{2})[ .-]?"
+    r"\d{3}[ .-]?\d{2}[ .-]?\d{2}(?!\d))"
+)
+
+
+def is_valid_tckn(value: str) -> bool:
+    """
+    TC kimlik numarası sağlama kontrolü
+
+    10. hane: ((tek sıradaki ilk 5 hane toplamı) * 7 - (çift sıradaki ilk 4 hane toplamı)) mod 10
+    11. hane: (ilk 10 hane toplamı) mod 10
+
+    Args:
+        value: 11 haneli numara
+
+    Returns:
+        Geçerli ise True
+    """
+    if len(value) != 11 or not value.isdigit() or value[0] == "0":
+        return False
+    digits = [int(c) for c in value]
+    odd, even = sum(digits[0:9:2]), sum(digits[1:8:2])
+    return (odd * 7 - even) % 10 == digits[9] and sum(digits[:10]) % 10 == digits[10]
+
+
+def is_valid_iban(value: str) -> bool:
+    """
+    IBAN mod-97 kontrolü (ISO 13616)
+
+    Args:
+        value: IBAN (boşluklu olabilir)
+
+    Returns:
+        Geçerli ise True
+    """
+    iban = value.replace(" ", "").upper()
+    if len(iban) < 15 or len(iban) > 34:
+        return False
+    if iban.startswith("TR") and len(iban) != 26:
+        return False
+    rearranged = iban[4:] + iban[:4]
+    # Harfler 10-35 arası sayılara çevrilir
+    number = "".join(str(int(c, 36)) for c in rearranged)
+    return int(number) % 97 == 1
+
+
+_VALIDATORS = {"iban": is_valid_iban, "tckn": is_valid_tckn}
+
+
+class PIIScrubber:
+    """
+    Tek geçişli kişisel veri temizleyici
+
+    Örnek:
+        scrubber = PIIScrubber(policy="mask")
+        text, counts = scrubber.scrub("Bana ali@ornek.com adresinden ulaşın")
+        # text: "Bana ***@******.*** adresinden ulaşın", counts: {"email": 1}
+    """
+
+    def __init__(
+        self,
+        policy: Union[str, Dict[str, str]] = "replace",
+        entities: Optional[Iterable[str]] = None,
+        mask_char: str = "*",
+        placeholders: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            policy: "replace" (yer tutucu), "mask" (harf ve rakamlar maskelenir,
+                biçim korunur) veya "remove"; varlık türü -> politika sözlüğü de olabilir
+            entities: Temizlenecek varlık türleri (varsayılan: hepsi)
+            mask_char: Maskeleme karakteri
+            placeholders: Varlık türü -> yer tutucu (varsayılan: PLACEHOLDERS)
+        """
+        self.entities = set(entities) if entities is not None else set(ENTITY_TYPES)
+        unknown = self.entities - set(ENTITY_TYPES)
+        if unknown:
+            raise ValueError(f"Bilinmeyen varlık türü: {', '.join(sorted(unknown))}")
+
+        if isinstance(policy, str):
+            policy = {entity: policy for entity in ENTITY_TYPES}
+        self.policies = {entity: policy.get(entity, "replace") for entity in ENTITY_TYPES}
+        invalid = set(self.policies.values()) - {"replace", "mask", "remove"}
+        if invalid:
+            raise ValueError(f"Bilinmeyen politika: {', '.join(sorted(invalid))}")
+
+        self.mask_char = mask_char
+        self.placeholders = {**PLACEHOLDERS, **(placeholders or {})}
+        self.stats = {"records": 0, **{entity: 0 for entity in ENTITY_TYPES}}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> "PIIScrubber":
+        """
+        processing.pii konfigürasyon bölümünden temizleyici oluştur
+
+        Args:
+            config: {"policy", "entities", "mask_char", "placeholders"}
+
+        Returns:
+            PIIScrubber instance
+        """
+        config = config or {}
+        keys = ("policy", "entities", "mask_char", "placeholders")
+        return cls(**{key: config[key] for key in keys if key in config})
+
+    def _mask(self, value: str) -> str:
+        """Harf ve rakamları maskele, ayraçları koru"""
+        return "".join(self.mask_char if c.isalnum() else c for c in value)
+
+    def scrub(self, text: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Metindeki kişisel verileri tek geçişte temizle
+
+        Args:
+            text: Metin
+
+        Returns:
+            (temizlenmiş metin, varlık türü -> bulunan sayı)
+        """
+        counts: Dict[str, int] = {}
+        if not text:
+            return text or "", counts
+
+        def replace(match: re.Match) -> str:
+            entity, value = match.lastgroup, match.group()
+            if entity not in self.entities:
+                return value
+            validator = _VALIDATORS.get(entity)
+            if validator is not None and not validator(value):
+                return value
+
+            counts[entity] = counts.get(entity, 0) + 1
+            policy = self.policies[entity]
+            if policy == "mask":
+                return self._mask(value)
+            if policy == "remove":
+                return ""
+            return self.placeholders[entity]
+
+        return _PII_PATTERN.sub(replace, text), counts
+
+    def scrub_record(self, record: Dict, fields: Iterable[str] = ("text", "title")) -> Dict:
+        """
+        Kaydın metin alanlarını temizle, bulunan sayıları kayda yaz
+
+        Sayılar denetim için record["pii"] alanına yazılır (yalnızca bulunan türler).
+
+        Args:
+            record: Kayıt (yerinde değiştirilir)
+            fields: Temizlenecek alanlar
+
+        Returns:
+            Aynı kayıt
+        """
+        totals: Dict[str, int] = {}
+        for field in fields:
+            value = record.get(field)
+            if not isinstance(value, str):
+                continue
+            record[field], counts = self.scrub(value)
+            for entity, count in counts.items():
+                totals[entity] = totals.get(entity, 0) + count
+
+        record["pii"] = totals
+        self.stats["records"] += 1
+        for entity, count in totals.items():
+            self.stats[entity] += count
+        return record
@@ -0,0 +1,304 @@
+"""
+data4tr - Source Scheduler
+Birden fazla kaynak arasında toplama bütçesini verime göre dağıtan zamanlayıcı.
+
+Toplama turlar halinde yapılır. Her turda kaynak başına verim ölçülür:
+istek başına yeni (daha önce görülmemiş) kayıt sayısı ile bu kayıtların ortalama
+TextMetrics.calculate_quality_score değerinin çarpımı. Sonraki turun kayıt kotası
+ve eşzamanlı istek sayısı bu verime göre paylaştırılır. Her kaynağın kendi
+rate limiter'ı korunur, yani verimli kaynak daha fazla pay alsa da kendi hız
+sınırını aşmaz. Her dağıtım kararı raporlanır.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from data4tr.algorithms.metrics import TextMetrics
+from data4tr.processor.deduplicate import Deduplicator
+from .base import BaseScraper
+from .scraper import Scraper
+
+logger = logging.getLogger(__name__)
+
+
+class SourceScheduler:
+    """
+    Verime göre kaynaklar arası bütçe dağıtımı yapan zamanlayıcı
+
+    Her kaynak için tek bir scraper instance'ı kullanılır; eşzamanlılık her turda
+    kaynağa özel bir semaphore ile (bkz. BaseScraper.set_request_slots) ayarlanır.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[Scraper] = None,
+        source_names: Optional[List[str]] = None,
+        round_size: int = 50,
+        concurrency: int = 8,
+        min_share: float = 0.1,
+        smoothing: float = 0.5,
+        patience: int = 3,
+    ):
+        """
+        Args:
+            scraper: Kaynak instance'larını oluşturan Scraper (varsayılan: yeni oluşturulur)
+            source_names: Kaynak adları (varsayılan: etkin tüm kaynaklar)
+            round_size: Tur başına toplam kayıt kotası
+            concurrency: Tur başına tüm kaynaklara dağıtılacak eşzamanlı istek sayısı
+            min_share: Her kaynağın alacağı en düşük pay (verimsiz kaynaklar da ölçülmeye devam eder)
+            smoothing: Verim ortalamasında son turun ağırlığı (0-1, üstel ortalama)
+            patience: Art arda bu kadar turda hiç yeni kayıt getirmeyen (boş veya
+                yalnızca tekrar döndüren) kaynak tükenmiş sayılır
+        """
+        self.scraper = scraper or Scraper()
+        self.source_names = (
+            source_names if source_names is not None else self.scraper.list_sources()
+        )
+        self.round_size = max(1, int(round_size))
+        self.concurrency = max(1, int(concurrency))
+        self.min_share = min(max(0.0, float(min_share)), 1.0 / max(1, len(self.source_names)))
+        self.smoothing = float(smoothing)
+        self.patience = max(1, int(patience))
+
+        self.deduplicator = Deduplicator()
+        self.decisions: List[Dict] = []
+        self.totals = {
+            name: {"records": 0, "unique": 0, "requests": 0, "quality": 0.0, "seconds": 0.0}
+            for name in self.source_names
+        }
+        self._yields: Dict[str, Optional[float]] = {name: None for name in self.source_names}
+        self._instances: Dict[str, BaseScraper] = {}
+        self._exhausted = set()
+        self._idle_rounds: Dict[str, int] = {name: 0 for name in self.source_names}
+        self._round = 0
+
+    def run(self, total: int) -> List[Dict]:
+        """
+        Toplam kayıt hedefine ulaşana kadar topla (stream sarmalayıcısı)
+
+        Args:
+            total: Toplanacak yeni kayıt sayısı
+
+        Returns:
+            Kaynak adıyla etiketlenmiş yeni kayıtlar
+        """
+        return list(self.stream(total))
+
+    def stream(self, total: int) -> Iterator[Dict]:
+        """
+        Turlar halinde topla, yeni kayıtları her turun sonunda üret
+
+        Tekrar eden metinler (Deduplicator hash'i ile) elenir. Art arda patience
+        turda hiç yeni kayıt getirmeyen kaynak tükenmiş sayılır ve sonraki turlara
+        alınmaz; tek bir boş tur (ör. geçici devre kesici) kaynağı tüketmez.
+        Böylece yalnızca tekrar döndüren kaynaklarla döngü sonsuza kadar sürmez.
+
+        Args:
+            total: Toplanacak yeni kayıt sayısı
+
+        Yields:
+            Yeni kayıtlar ("source" alanı kaynak adıyla etiketlenmiş)
+        """
+        produced = 0
+        while produced < total:
+            active = [name for name in self.source_names if name not in self._exhausted]
+            if not active:
+                logger.warning("Tüm kaynaklar tükendi, zamanlama durduruluyor")
+                return
+
+            plan = self.allocate(active, min(self.round_size, total - produced))
+            for record in self._run_round(plan):
+                if produced >= total:
+                    return
+                produced += 1
+                yield record
+
+    def allocate(self, source_names: List[str], budget: int) -> Dict[str, Dict]:
+        """
+        Tur bütçesini kaynaklara verim oranında paylaştır
+
+        Henüz ölçülmemiş kaynaklar ölçülmüş en yüksek verimle değerlendirilir
+        (böylece her kaynak en az bir kez denenir). Her kaynak en az min_share
+        pay alır; eşzamanlılık kaynağın kendi max_concurrency değerini aşmaz.
+
+        Args:
+            source_names: Bu turda çalışacak kaynaklar
+            budget: Tur kayıt kotası
+
+        Returns:
+            Kaynak adı -> {"share", "limit", "concurrency", "yield"}
+        """
+        measured = [y for y in (self._yields[name] for name in source_names) if y is not None]
+        default = max(measured) if measured else 1.0
+        scores = {
+            name: self._yields[name] if self._yields[name] is not None else default
+            for name in source_names
+        }
+
+        total_score = sum(scores.values())
+        free = 1.0 - self.min_share * len(source_names)
+        plan = {}
+        for name in source_names:
+            if total_score > 0:
+                share = self.min_share + free * scores[name] / total_score
+            else:
+                share = 1.0 / len(source_names)
+
+            instance = self._instance(name)
+            limit_concurrency = instance.get_concurrency() if instance else 1
+            plan[name] = {
+                "share": share,
+                "limit": max(1, round(budget * share)),
+                "concurrency": max(1, min(limit_concurrency, round(self.concurrency * share))),
+                "yield": scores[name],
+            }
+        return plan
+
+    def _run_round(self, plan: Dict[str, Dict]) -> List[Dict]:
+        """Planı çalıştır, verimleri güncelle, kararları kaydet"""
+        self._round += 1
+        results = {}
+
+        def run(name: str) -> None:
+            instance = self._instance(name)
+            if instance is None:
+                results[name] = ([], 0, 0.0)
+                return
+
+            instance.set_request_slots(threading.BoundedSemaphore(plan[name]["concurrency"]))
+            before = self._request_count(instance)
+            start = time.perf_counter()
+            try:
+                records = list(instance.iter_scrape(plan[name]["limit"]))
+            except Exception as e:
+                logger.error(f"Kaynak hatası ({name}): {e}")
+                records = []
+            seconds = time.perf_counter() - start
+            results[name] = (records, self._request_count(instance) - before, seconds)
+
+        with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+            list(executor.map(run, plan))
+
+        new_records = []
+        for name in plan:
+            records, requests_made, seconds = results[name]
+            unique = []
+            for record in records:
+                if self.deduplicator.is_duplicate(record.get("text", "")):
+                    continue
+                record["source"] = name
+                unique.append(record)
+
+            quality = (
+                sum(TextMetrics.calculate_quality_score(r.get("text", "")) for r in unique)
+                / len(unique)
+                if unique
+                else 0.0
+            )
+            # İstek sayılamayan kaynaklarda (ör. yerel dump) kayıt başına bir istek varsayılır
+            round_yield = len(unique) / max(1, requests_made or len(records)) * quality
+            self._update_yield(name, round_yield)
+            self._idle_rounds[name] = 0 if unique else self._idle_rounds[name] + 1
+            if self._idle_rounds[name] >= self.patience:
+                logger.info(f"{name}: {self.patience} turdur yeni kayıt yok, kaynak tükendi")
+                self._exhausted.add(name)
+
+            totals = self.totals[name]
+            totals["quality"] = (
+                (totals["quality"] * totals["unique"] + quality * len(unique))
+                / (totals["unique"] + len(unique))
+                if unique
+                else totals["quality"]
+            )
+            totals["records"] += len(records)
+            totals["unique"] += len(unique)
+            totals["requests"] += requests_made
+            totals["seconds"] += seconds
+
+            decision = {
+                "round": self._round,
+                "source": name,
+                "share": round(plan[name]["share"], 3),
+                "limit": plan[name]["limit"],
+                "concurrency": plan[name]["concurrency"],
+                "records": len(records),
+                "unique": len(unique),
+                "requests": requests_made,
+                "quality": round(quality, 3),
+                "yield": round(round_yield, 3),
+                "unique_per_second": round(len(unique) / seconds, 2) if seconds > 0 else 0.0,
+                "exhausted": name in self._exhausted,
+            }
+            self.decisions.append(decision)
+            logger.info(
+                f"Tur {self._round} - {name}: pay {decision['share']:.0%}, "
+                f"kota {decision['limit']}, eşzamanlılık {decision['concurrency']}, "
+                f"{len(unique)}/{len(records)} yeni kayıt, {requests_made} istek, "
+                f"verim {decision['yield']:.3f}"
+            )
+            new_records.extend(unique)
+
+        return new_records
+
+    def _update_yield(self, name: str, value: float) -> None:
+        """Kaynağın verim ortalamasını güncelle (üstel ortalama)"""
+        previous = self._yields[name]
+        if previous is None:
+            self._yields[name] = value
+        else:
+            self._yields[name] = self.smoothing * value + (1 - self.smoothing) * previous
+
+    def _instance(self, name: str) -> Optional[BaseScraper]:
+        """Kaynak için scraper instance'ı (turlar arasında paylaşılır)"""
+        if name not in self._instances:
+            self._instances[name] = self.scraper.create_scraper(name)
+            if self._instances[name] is None:
+                self._exhausted.add(name)
+        return self._instances[name]
+
+    @staticmethod
+    def _request_count(instance: BaseScraper) -> int:
+        """Scraper'ın şimdiye kadar gönderdiği istek sayısı"""
+        return sum(controller.stats["requests"] for controller in instance._controllers)
+
+    def report(self) -> Dict:
+        """
+        Zamanlama raporu
+
+        Returns:
+            {"rounds", "sources": kaynak başına toplamlar ve son verim,
+             "decisions": tur başına dağıtım kararları}
+        """
+        sources = {}
+        for name, totals in self.totals.items():
+            sources[name] = {
+                **totals,
+                "quality": round(totals["quality"], 3),
+                "seconds": round(totals["seconds"], 3),
+                "yield": round(self._yields[name] or 0.0, 3),
+                "exhausted": name in self._exhausted,
+            }
+        return {"rounds": self._round, "sources": sources, "decisions": list(self.decisions)}
+
+    def format_report(self) -> str:
+        """Dağıtım kararlarını tablo olarak biçimlendir"""
+        columns = [
+            "round",
+            "source",
+            "share",
+            "limit",
+            "concurrency",
+            "unique",
+            "requests",
+            "quality",
+            "yield",
+        ]
+        rows = self.decisions
+        widths = [max([len(c)] + [len(str(r[c])) for r in rows]) for c in columns]
+        lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+        for row in rows:
+            lines.append("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
+        return "\n".join(lines)
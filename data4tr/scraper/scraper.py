@@ -5,22 +5,19 @@ Refactored with configuration-based architecture
 """
 
 import logging
-from typing import List, Dict, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Union
 import yaml
 from pathlib import Path
 
 from data4tr.config import get_config
 from .base import ScraperRegistry, BaseScraper
-from .sources import WikipediaScraper
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Scraper'ları registry'ye kaydet
-ScraperRegistry.register("wikipedia", WikipediaScraper)
-
-
 class Scraper:
     """
     Web'den Türkçe metinleri çeken ana sınıf
@@ -57,7 +54,7 @@ class Scraper:
 
     def scrape_source(self, source_name: str, limit: int = 100) -> List[Dict]:
         """
-        Belirtilen kaynaktan veri çeker
+        Belirtilen kaynaktan veri çeker (stream_source sarmalayıcısı)
 
         Args:
             source_name: Kaynak adı
@@ -66,6 +63,147 @@ class Scraper:
         Returns:
             Çekilen metinlerin listesi
         """
+        return list(self.stream_source(source_name, limit))
+
+    def stream_source(self, source_name: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Belirtilen kaynaktan veriyi geldikçe üretir
+
+        Kayıtlar çekildiği anda döndürülür, böylece temizleme ve dışa aktarma
+        hemen başlayabilir ve bellek kullanımı limit'ten bağımsız kalır.
+
+        Args:
+            source_name: Kaynak adı
+            limit: Maksimum çekilecek kayıt sayısı
+
+        Yields:
+            Çekilen kayıtlar
+        """
+        scraper_instance = self.create_scraper(source_name)
+
+        if scraper_instance is None:
+            return
+
+        # Veriyi çek
+        yield from scraper_instance.iter_scrape(limit)
+
+    def scrape_sources(
+        self,
+        source_names: Optional[List[str]] = None,
+        limit: Union[int, Dict[str, int]] = 100,
+        max_parallel: Optional[int] = None,
+        global_concurrency: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Birden fazla kaynaktan eşzamanlı veri çeker (stream_sources sarmalayıcısı)
+
+        Args:
+            source_names: Kaynak adları (varsayılan: etkin tüm kaynaklar)
+            limit: Kaynak başına kayıt sayısı veya kaynak adı -> limit sözlüğü
+            max_parallel: Aynı anda çalışan kaynak sayısı
+            global_concurrency: Tüm kaynaklarda aynı anda uçuşta olabilecek istek sayısı
+
+        Returns:
+            Kaynak adıyla etiketlenmiş kayıtların listesi
+        """
+        return list(self.stream_sources(source_names, limit, max_parallel, global_concurrency))
+
+    def stream_sources(
+        self,
+        source_names: Optional[List[str]] = None,
+        limit: Union[int, Dict[str, int]] = 100,
+        max_parallel: Optional[int] = None,
+        global_concurrency: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Birden fazla kaynaktan eşzamanlı veri çeker ve tek bir akışta birleştirir
+
+        Her kaynak kendi scraper instance'ı ile, yani kendi rate limiter'ı ve bağlantı
+        havuzu ile ayrı bir thread'de çalışır; toplam süre kaynak gecikmelerinin toplamı
+        yerine en yavaş kaynağa yakın olur. global_concurrency verilirse tüm kaynakların
+        istekleri ortak bir semaphore ile sınırlanır.
+
+        Args:
+            source_names: Kaynak adları (varsayılan: etkin tüm kaynaklar)
+            limit: Kaynak başına kayıt sayısı veya kaynak adı -> limit sözlüğü
+            max_parallel: Aynı anda çalışan kaynak sayısı (varsayılan: kaynak sayısı)
+            global_concurrency: Tüm kaynaklarda aynı anda uçuşta olabilecek istek sayısı
+
+        Yields:
+            Kayıtlar ("source" alanı kaynak adıyla etiketlenmiş, geliş sırasıyla)
+        """
+        source_names = source_names if source_names is not None else self.list_sources()
+        if not source_names:
+            logger.warning("Çekilecek kaynak yok")
+            return
+
+        slots = threading.BoundedSemaphore(global_concurrency) if global_concurrency else None
+        records = queue.Queue(maxsize=len(source_names) * 10)
+        stop = threading.Event()
+        finished = object()
+
+        def put(item) -> bool:
+            # Tüketici durduysa bekleyen thread'leri serbest bırak
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(source_name: str) -> None:
+            try:
+                source_limit = limit.get(source_name, 0) if isinstance(limit, dict) else limit
+                scraper_instance = self.create_scraper(source_name)
+                if scraper_instance is None or source_limit <= 0:
+                    return
+
+                scraper_instance.set_request_slots(slots)
+                stream = scraper_instance.iter_scrape(source_limit)
+                try:
+                    for record in stream:
+                        record["source"] = source_name
+                        if not put(record):
+                            break
+                finally:
+                    stream.close()
+            except Exception as e:
+                logger.error(f"Kaynak hatası ({source_name}): {e}")
+            finally:
+                put(finished)
+
+        logger.info(f"{len(source_names)} kaynaktan eşzamanlı veri çekiliyor: {source_names}")
+        executor = ThreadPoolExecutor(max_workers=max_parallel or len(source_names))
+        try:
+            for source_name in source_names:
+                executor.submit(run, source_name)
+
+            running = len(source_names)
+            while running:
+                item = records.get()
+                if item is finished:
+                    running -= 1
+                    continue
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+    def create_scraper(
+        self, source_name: str, overrides: Optional[Dict] = None
+    ) -> Optional[BaseScraper]:
+        """
+        Kaynak için scraper instance'ı oluştur
+
+        Args:
+            source_name: Kaynak adı
+            overrides: Kaynak konfigürasyonuna uygulanacak ek ayarlar; sözlük değerleri
+                ilgili bölümle birleştirilir (örn. {"rate_limit": {"burst": 2}})
+
+        Returns:
+            Scraper instance veya None
+        """
         # Konfigürasyondan kaynak bilgisini al
         source_config = self.config.get_source_config(source_name)
 
@@ -75,17 +213,22 @@ class Scraper:
                 source_config = self.sources["sources"][source_name]
             else:
                 logger.error(f"Kaynak bulunamadı: {source_name}")
-                return []
+                return None
+
+        if overrides:
+            source_config = dict(source_config)
+            for key, value in overrides.items():
+                if isinstance(value, dict) and isinstance(source_config.get(key), dict):
+                    value = {**source_config[key], **value}
+                source_config[key] = value
 
         # Scraper instance oluştur (Factory pattern)
         scraper_instance = ScraperRegistry.create(source_name, source_config)
 
         if scraper_instance is None:
             logger.error(f"Scraper oluşturulamadı: {source_name}")
-            return []
 
-        # Veriyi çek
-        return scraper_instance.scrape(limit)
+        return scraper_instance
 
     def list_sources(self) -> List[str]:
         """
@@ -126,6 +269,7 @@ class Scraper:
 
 def main():
     """Test ve örnek kullanım"""
+    logging.basicConfig(level=logging.INFO)
     scraper = Scraper()
 
     # Kaynakları listele
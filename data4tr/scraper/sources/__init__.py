@@ -1,8 +1,20 @@
 """
 data4tr - Scraper Sources
 Kaynak-specific scraper implementations
+Modüller ilk erişimde import edilir (bkz. ScraperRegistry.BUILTIN_SOURCES).
 """
 
-from .wikipedia import WikipediaScraper
+import importlib
 
-__all__ = ["WikipediaScraper"]
+_SOURCES = {
+    "WikiDumpScraper": ".wikidump",
+    "WikipediaScraper": ".wikipedia",
+}
+
+__all__ = ["WikiDumpScraper", "WikipediaScraper"]
+
+
+def __getattr__(name):
+    if name in _SOURCES:
+        return getattr(importlib.import_module(_SOURCES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
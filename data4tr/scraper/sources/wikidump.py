@@ -0,0 +1,243 @@
+"""
+data4tr - Wikipedia Dump Scraper
+Yerel trwiki-*-pages-articles-multistream.xml.bz2 dump dosyasından makale okuyan scraper
+"""
+
+import bz2
+import hashlib
+import html
+import logging
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+from urllib.parse import quote
+
+from ..base import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# Wiki markup temizliği için derlenmiş desenler
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_REF = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")
+_TABLE = re.compile(r"\{\|[^{}]*?\|\}", re.DOTALL)
+_FILE_LINK = re.compile(
+    r"\[\[(?:Dosya|File|Resim|Image|Kategori|Category):[^\[\]]*(?:\[\[[^\]]*\]\][^\[\]]*)*\]\]",
+    re.IGNORECASE,
+)
+_INTERNAL_LINK = re.compile(r"\[\[(?:[^|\]]*\|)?([^\]]*)\]\]")
+_EXTERNAL_LINK = re.compile(r"\[https?://[^\s\]]+\s*([^\]]*)\]")
+_EMPHASIS = re.compile(r"'{2,}")
+_HEADING = re.compile(r"^=+\s*(.*?)\s*=+\s*$", re.MULTILINE)
+_TAG = re.compile(r"<[^>]+>")
+_LIST_MARKER = re.compile(r"^[*#:;]+\s*", re.MULTILINE)
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+_SECTION = re.compile(r"^==", re.MULTILINE)
+
+
+def strip_wikitext(text: str, intro_only: bool = False) -> str:
+    """
+    Wiki markup'ını düz metne çevir
+
+    Args:
+        text: Ham wikitext
+        intro_only: True ise yalnızca ilk başlıktan önceki giriş bölümü döndürülür
+
+    Returns:
+        Düz metin (paragraflar boş satırla ayrılmış)
+    """
+    if not text:
+        return ""
+
+    if intro_only:
+        match = _SECTION.search(text)
+        if match:
+            text = text[: match.start()]
+
+    text = _COMMENT.sub("", text)
+    text = _REF.sub("", text)
+
+    # İç içe şablon ve tabloları içten dışa doğru kaldır
+    for _ in range(10):
+        stripped = _TABLE.sub("", _TEMPLATE.sub("", text))
+        if stripped == text:
+            break
+        text = stripped
+
+    text = _FILE_LINK.sub("", text)
+    text = _INTERNAL_LINK.sub(r"\1", text)
+    text = _EXTERNAL_LINK.sub(r"\1", text)
+    text = _EMPHASIS.sub("", text)
+    text = _HEADING.sub(r"\1", text)
+    text = _TAG.sub("", text)
+    text = html.unescape(text)
+    text = _LIST_MARKER.sub("", text)
+    text = _BLANK_LINES.sub("\n\n", text)
+
+    return text.strip()
+
+
+def _page_id(title: str) -> str:
+    """WikipediaScraper ile aynı kayıt ID'si"""
+    return hashlib.md5(title.encode()).hexdigest()[:8]
+
+
+def _parse_block(path: str, start: int, end: int, intro_only: bool, page_url: str) -> List[Dict]:
+    """
+    Tek bir bz2 bloğunu aç ve içindeki makaleleri kayda dönüştür
+    Worker process'lerde çalışır, bu yüzden modül seviyesinde tanımlıdır.
+
+    Args:
+        path: Dump dosyası
+        start: Bloğun başlangıç offset'i
+        end: Bloğun bitiş offset'i (-1: dosya sonu)
+        intro_only: Yalnızca giriş bölümünü al
+        page_url: Sayfa URL öneki
+
+    Returns:
+        Makale kayıtları
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start) if end >= 0 else f.read()
+
+    # Her blok bağımsız bir bz2 stream'idir; decompressor stream sonunda durur
+    xml_text = bz2.BZ2Decompressor().decompress(raw).decode("utf-8")
+    root = ET.fromstring(f"<pages>{xml_text}</pages>")
+
+    records = []
+    now = time.time()
+    for page in root.iter("page"):
+        if page.findtext("ns") != "0" or page.find("redirect") is not None:
+            continue
+
+        title = page.findtext("title", "")
+        text = strip_wikitext(page.findtext("revision/text", ""), intro_only=intro_only)
+        if not text:
+            continue
+
+        records.append(
+            {
+                "id": _page_id(title),
+                "source": "wikipedia",
+                "url": page_url + quote(title.replace(" ", "_")),
+                "title": title,
+                "text": text,
+                "timestamp": now,
+            }
+        )
+
+    return records
+
+
+class WikiDumpScraper(BaseScraper):
+    """
+    Wikipedia multistream XML dump scraper'ı
+    Multistream index dosyasındaki offset'ler sayesinde bağımsız bz2 blokları
+    worker process'lerde paralel olarak açılır ve ayrıştırılır. Ağ erişimi ve
+    rate limit gerektirmez; kayıtlar WikipediaScraper ile aynı şemadadır.
+    """
+
+    def __init__(self, config: Dict):
+        """Dump scraper'ı başlat"""
+        super().__init__(config)
+        self.dump_config = config.get("dump", {})
+
+    def validate_config(self) -> bool:
+        """Konfigürasyonun geçerli olup olmadığını kontrol et"""
+        for key in ("path", "index_path"):
+            path = self.dump_config.get(key)
+            if not path:
+                logger.error(f"Gerekli konfigürasyon anahtarı eksik: dump.{key}")
+                return False
+            if not Path(path).exists():
+                logger.error(f"Dump dosyası bulunamadı: {path}")
+                return False
+
+        return True
+
+    def read_block_offsets(self) -> List[Tuple[int, int]]:
+        """
+        Multistream index dosyasından blok aralıklarını oku
+
+        Index satırları "offset:page_id:başlık" biçimindedir; aynı offset'i paylaşan
+        sayfalar aynı bz2 bloğundadır.
+
+        Returns:
+            (başlangıç, bitiş) offset çiftleri (son blok için bitiş -1)
+        """
+        offsets = []
+        with bz2.open(self.dump_config["index_path"], "rt", encoding="utf-8") as f:
+            for line in f:
+                offset = int(line.split(":", 1)[0])
+                if not offsets or offsets[-1] != offset:
+                    offsets.append(offset)
+
+        return [
+            (start, offsets[i + 1] if i + 1 < len(offsets) else -1)
+            for i, start in enumerate(offsets)
+        ]
+
+    def iter_scrape(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        Dump dosyasından makaleleri okur (streaming)
+
+        Bloklar dump.workers kadar process'te paralel ayrıştırılır; bellekte en fazla
+        workers * 2 blok sonucu tutulur ve kayıtlar dump sırasıyla üretilir.
+
+        Args:
+            limit: Okunacak makale sayısı (0 veya negatif: tamamı)
+
+        Yields:
+            Makale kayıtları
+        """
+        if not self.enabled:
+            logger.warning(f"Kaynak devre dışı: {self.name}")
+            return
+
+        path = self.dump_config["path"]
+        intro_only = self.dump_config.get("intro_only", True)
+        page_url = self.dump_config.get("page_url", "https://tr.wikipedia.org/wiki/")
+        workers = int(self.dump_config.get("workers", 0)) or os.cpu_count() or 1
+
+        blocks = iter(self.read_block_offsets())
+        logger.info(f"Dump okunuyor: {path} ({workers} worker)")
+
+        count = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            try:
+                for start, end in blocks:
+                    pending.append(
+                        executor.submit(_parse_block, path, start, end, intro_only, page_url)
+                    )
+                    if len(pending) >= workers * 2:
+                        break
+
+                while pending:
+                    records = pending.popleft().result()
+
+                    # Biten bloğun yerine yenisini kuyruğa ekle
+                    for start, end in blocks:
+                        pending.append(
+                            executor.submit(_parse_block, path, start, end, intro_only, page_url)
+                        )
+                        break
+
+                    for record in records:
+                        count += 1
+                        yield record
+                        if 0 < limit <= count:
+                            return
+
+                    if count and count % 10000 < len(records):
+                        logger.info(f"{count} makale okundu")
+            finally:
+                for future in pending:
+                    future.cancel()
+                logger.info(f"Toplam {count} makale okundu")
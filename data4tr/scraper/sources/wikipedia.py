@@ -3,15 +3,58 @@ data4tr - Wikipedia Scraper
 Wikipedia API için özel scraper implementation
 """
 
-import requests
+import asyncio
+import json
+import os
 import time
 import hashlib
 import logging
-from typing import List, Dict
-from ..base import BaseScraper
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from ..base import BaseScraper, CircuitOpenError, iter_async
 
 logger = logging.getLogger(__name__)
 
+# Başlık uzayını bölmek için kullanılan baş harfler (MediaWiki sıralamasında, yani
+# UTF-8 byte sırasında: Türkçe harfler ASCII harflerden sonra gelir)
+TITLE_PREFIXES = [
+    "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N",
+    "O", "P", "R", "S", "T", "U", "V", "Y", "Z", "Ç", "Ö", "Ü", "İ", "Ş",
+]  # fmt: skip
+
+
+def title_key(title: str) -> bytes:
+    """MediaWiki başlık sıralama anahtarı (alt çizgili başlığın UTF-8 byte'ları)"""
+    return title.replace(" ", "_").encode("utf-8")
+
+
+def partition_title_space(
+    partitions: int, prefixes: Optional[List[str]] = None
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Başlık uzayını birbiriyle örtüşmeyen aralıklara böl
+
+    Aralıklar [başlangıç, bitiş) biçimindedir; ilk aralığın başlangıcı ve son
+    aralığın bitişi None'dur, böylece rakam veya Latin dışı harfle başlayan
+    başlıklar da kapsanır. Aralıklar api.title_from / api.title_to olarak
+    enumeration moduna verilir.
+
+    Args:
+        partitions: Aralık sayısı
+        prefixes: Sıralı sınır adayları (varsayılan: TITLE_PREFIXES)
+
+    Returns:
+        (title_from, title_to) çiftleri
+    """
+    prefixes = sorted(prefixes or TITLE_PREFIXES, key=title_key)
+    partitions = max(1, min(int(partitions), len(prefixes)))
+
+    boundaries = [prefixes[round(i * len(prefixes) / partitions)] for i in range(1, partitions)]
+    edges = [None] + boundaries + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
 
 class WikipediaScraper(BaseScraper):
     """
@@ -22,12 +65,19 @@ class WikipediaScraper(BaseScraper):
     def __init__(self, config: Dict):
         """Wikipedia scraper'ı başlat"""
         super().__init__(config)
-        self.session = requests.Session()
-        self.session.headers.update(self.get_headers())
+        self.session = self.create_session()
+        self.rate_limiter = self.create_rate_limiter()
+        self.controller = self.create_request_controller(self.rate_limiter)
 
     def validate_config(self) -> bool:
         """Konfigürasyonun geçerli olup olmadığını kontrol et"""
         # Nested key'leri kontrol et
+        if self.get_fetch_mode() in ("batch", "enumerate", "refresh"):
+            if not self.api_config.get("action_api"):
+                logger.error("Gerekli konfigürasyon anahtarı eksik: api.action_api")
+                return False
+            return True
+
         api_url = self.api_config.get("base_url")
         random_page = self.api_config.get("random_page")
 
@@ -37,57 +87,679 @@ class WikipediaScraper(BaseScraper):
 
         return True
 
-    def scrape(self, limit: int = 100) -> List[Dict]:
+    def get_fetch_mode(self) -> str:
+        """
+        Veri çekme modu
+
+        Returns:
+            "summary" (REST özet endpoint'i, sayfa başına bir istek),
+            "batch" (action API ile istek başına çok rastgele sayfa),
+            "enumerate" (action API ile başlık sırasıyla tüm sayfalar) veya
+            "refresh" (son değişikliklerdeki sayfalar, bkz. iter_refresh)
+        """
+        return self.api_config.get("fetch_mode", "summary")
+
+    def iter_scrape(self, limit: int = 100) -> Iterator[Dict]:
         """
-        Wikipedia'dan Türkçe metinleri çeker
+        Wikipedia'dan Türkçe metinleri çeker (streaming)
+
+        Kayıtlar çekildikçe üretilir; bellek kullanımı limit'ten bağımsızdır.
+        api.fetch_mode "batch" ise action API ile toplu çekilir (bkz. iter_batch),
+        rate_limit.max_concurrency 1'den büyükse istekler asyncio ile
+        eşzamanlı olarak gönderilir (bkz. aiter_scrape). state.enabled açıksa
+        daha önce görülmüş başlıklar elenir ve yarıda kalan tarama devam ettirilir.
+        api.fetch_mode "enumerate" ise api.title_from / api.title_to aralığındaki
+        tüm sayfalar başlık sırasıyla çekilir (bkz. iter_enumerate), "refresh" ise
+        yalnızca son değişikliklerdeki sayfalar çekilir (bkz. iter_refresh).
 
         Args:
-            limit: Çekilecek sayfa sayısı
+            limit: Çekilecek sayfa sayısı (enumerate modunda 0: aralığın tamamı)
 
-        Returns:
-            Metinlerin listesi
+        Yields:
+            Makale kayıtları
         """
         if not self.enabled:
             logger.warning(f"Kaynak devre dışı: {self.name}")
-            return []
+            return
+
+        if self.get_fetch_mode() == "refresh":
+            # Yalnızca son değişikliklerdeki sayfalar yeniden çekilir
+            yield from self.iter_refresh(limit)
+            return
+
+        if self.get_fetch_mode() == "enumerate":
+            # Her sayfa bir kez listelenir; ilerleme aralık başına ayrı kaydedilir
+            yield from self.iter_enumerate(
+                limit, self.api_config.get("title_from"), self.api_config.get("title_to")
+            )
+            return
+
+        # state.enabled açıksa görülmüş başlıklar elenir ve ilerleme kaydedilir
+        yield from self.iter_tracked(self._iter_pages, limit)
+
+    def _iter_pages(self, limit: int) -> Iterator[Dict]:
+        """Yapılandırılmış moda göre sayfaları çek"""
+        if self.get_fetch_mode() == "batch":
+            yield from self.iter_batch(limit)
+            return
+
+        if self.get_concurrency() > 1:
+            yield from iter_async(self.aiter_scrape(limit))
+            return
 
         logger.info(f"Wikipedia'dan {limit} sayfa çekiliyor...")
-        articles = []
+        count = 0
 
         # API URL'i konfigürasyondan al
-        random_page_path = self.api_config.get("random_page", "/page/random/summary")
-        api_url = self.get_api_url(random_page_path)
+        api_url = self._random_page_url()
 
         for i in range(limit):
             try:
-                response = self.session.get(api_url, timeout=self.get_timeout())
-                response.raise_for_status()
-                data = response.json()
-
-                article = {
-                    "id": self._generate_id(data.get("title", "")),
-                    "source": "wikipedia",
-                    "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
-                    "title": data.get("title", ""),
-                    "text": data.get("extract", ""),
-                    "timestamp": time.time(),
-                }
+                article = self._fetch_article(api_url)
 
                 if article["text"]:
-                    articles.append(article)
-
-                # Rate limiting - konfigürasyondan al
-                time.sleep(self.get_rate_limit_delay())
+                    count += 1
+                    yield article
 
                 if (i + 1) % 10 == 0:
                     logger.info(f"{i + 1}/{limit} sayfa çekildi")
 
+            except CircuitOpenError as e:
+                logger.error(f"{e}, tarama durduruluyor")
+                break
+            except Exception as e:
+                logger.error(f"Hata: {e}")
+                continue
+
+        logger.info(f"Toplam {count} sayfa başarıyla çekildi")
+
+    async def aiter_scrape(
+        self, limit: int = 100, concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Wikipedia'dan eşzamanlı olarak veri çeker (async generator)
+
+        `concurrency` kadar istek bağlantı havuzu üzerinden aynı anda uçuşta tutulur.
+        İstek hızı ve yeniden denemeler istek kontrol katmanı (self.controller) ile yönetilir.
+        Kayıtlar sınırlı bir kuyruk üzerinden tamamlanma sırasıyla üretilir; tüketici
+        yavaşsa worker'lar bekler.
+
+        Args:
+            limit: Çekilecek sayfa sayısı
+            concurrency: Eşzamanlı istek sayısı (varsayılan: rate_limit.max_concurrency)
+
+        Yields:
+            Makale kayıtları (scrape ile aynı şemada)
+        """
+        if not self.enabled:
+            logger.warning(f"Kaynak devre dışı: {self.name}")
+            return
+
+        concurrency = concurrency or self.get_concurrency()
+        logger.info(f"Wikipedia'dan {limit} sayfa çekiliyor ({concurrency} eşzamanlı istek)...")
+
+        api_url = self._random_page_url()
+        loop = asyncio.get_running_loop()
+        pending = iter(range(limit))
+        queue = asyncio.Queue(maxsize=concurrency * 2)
+        finished = object()
+        count = 0
+        done = 0
+
+        async def worker(executor: ThreadPoolExecutor) -> None:
+            nonlocal done
+            # Tüm worker'lar aynı iterator'dan iş alır (asyncio tek thread'de çalışır)
+            for _ in pending:
+                try:
+                    article = await loop.run_in_executor(executor, self._fetch_article, api_url)
+                    if article["text"]:
+                        await queue.put(article)
+                except CircuitOpenError as e:
+                    logger.error(f"{e}, tarama durduruluyor")
+                    break
+                except Exception as e:
+                    logger.error(f"Hata: {e}")
+
+                done += 1
+                if done % 10 == 0:
+                    logger.info(f"{done}/{limit} sayfa çekildi")
+
+            await queue.put(finished)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            tasks = [asyncio.ensure_future(worker(executor)) for _ in range(concurrency)]
+            try:
+                running = len(tasks)
+                while running:
+                    item = await queue.get()
+                    if item is finished:
+                        running -= 1
+                        continue
+                    count += 1
+                    yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(f"Toplam {count} sayfa başarıyla çekildi")
+
+    async def scrape_async(self, limit: int = 100, concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        Wikipedia'dan eşzamanlı olarak veri çeker (aiter_scrape sarmalayıcısı)
+
+        Args:
+            limit: Çekilecek sayfa sayısı
+            concurrency: Eşzamanlı istek sayısı (varsayılan: rate_limit.max_concurrency)
+
+        Returns:
+            Metinlerin listesi (scrape ile aynı şemada, tamamlanma sırasıyla)
+        """
+        return [article async for article in self.aiter_scrape(limit, concurrency)]
+
+    def iter_batch(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        MediaWiki action API ile toplu veri çeker (streaming)
+
+        Her istek generator=random ve prop=extracts ile api.batch_size kadar rastgele
+        sayfayı özetleriyle birlikte döndürür. API'nin `continue` nesnesi bir sonraki
+        isteğin parametrelerine eklenerek devam edilir.
+
+        Args:
+            limit: Çekilecek sayfa sayısı
+
+        Yields:
+            Makale kayıtları (scrape ile aynı şemada)
+        """
+        if not self.enabled:
+            logger.warning(f"Kaynak devre dışı: {self.name}")
+            return
+
+        batch_size = int(self.api_config.get("batch_size", 20))
+        logger.info(f"Wikipedia'dan {limit} sayfa toplu olarak çekiliyor ({batch_size}/istek)...")
+
+        api_url = self.api_config["action_api"]
+        base_params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "generator": "random",
+            "grnnamespace": "0",
+            "grnlimit": str(batch_size),
+            "prop": "extracts|info",
+            "exintro": "1",
+            "explaintext": "1",
+            "exlimit": "max",
+            "inprop": "url",
+        }
+        params = dict(base_params)
+        seen_pages = set()
+        count = 0
+        requests_made = 0
+
+        # Eksik özetler yüzünden sonsuz döngüye girmemek için istek bütçesi
+        while count < limit and requests_made < limit:
+            requests_made += 1
+
+            try:
+                response = self.controller.request(
+                    self.session, "GET", api_url, params=params, timeout=self.get_timeout()
+                )
+                response.raise_for_status()
+                data = response.json()
+            except CircuitOpenError as e:
+                logger.error(f"{e}, tarama durduruluyor")
+                break
             except Exception as e:
                 logger.error(f"Hata: {e}")
+                params = dict(base_params)
                 continue
 
-        logger.info(f"Toplam {len(articles)} sayfa başarıyla çekildi")
-        return articles
+            for page in data.get("query", {}).get("pages", []):
+                page_id = page.get("pageid")
+                if page_id in seen_pages or not page.get("extract"):
+                    # Özeti olmayan sayfalar devam isteğinde (excontinue) gelir
+                    continue
+
+                seen_pages.add(page_id)
+                count += 1
+                yield self._page_to_article(page)
+                if count >= limit:
+                    break
+
+            # Devam parametreleri orijinal isteğe eklenir
+            params = dict(base_params)
+            params.update(data.get("continue", {}))
+
+            logger.info(f"{count}/{limit} sayfa çekildi ({requests_made} istek)")
+
+        logger.info(f"Toplam {count} sayfa {requests_made} istekte başarıyla çekildi")
+
+    def scrape_batch(self, limit: int = 100) -> List[Dict]:
+        """
+        MediaWiki action API ile toplu veri çeker (iter_batch sarmalayıcısı)
+
+        Args:
+            limit: Çekilecek sayfa sayısı
+
+        Returns:
+            Metinlerin listesi (scrape ile aynı şemada)
+        """
+        return list(self.iter_batch(limit))
+
+    def iter_enumerate(
+        self,
+        limit: int = 0,
+        title_from: Optional[str] = None,
+        title_to: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Başlık aralığındaki tüm sayfaları sırayla çeker (streaming)
+
+        generator=allpages ile [title_from, title_to) aralığı başlık sırasıyla
+        dolaşılır; rastgele örneklemenin aksine her istek yalnızca yeni sayfalar
+        getirir. Aralıklar partition_title_space ile örtüşmeyecek şekilde bölünüp
+        ayrı worker'larda çalıştırılabilir. enumeration.checkpoint_dir ayarlıysa
+        her aralığın devam noktası ayrı bir dosyaya yazılır ve aynı aralık tekrar
+        çalıştırıldığında kaldığı yerden devam eder; tamamlanan aralık atlanır.
+        ScrapeCoordinator birimlerinde bu checkpoint kapatılır (devam noktası kuyruktur).
+
+        Args:
+            limit: Çekilecek sayfa sayısı (0 veya negatif: aralığın tamamı)
+            title_from: Aralık başlangıcı (dahil, None: baştan)
+            title_to: Aralık sonu (hariç, None: sona kadar)
+
+        Yields:
+            Makale kayıtları (scrape ile aynı şemada)
+        """
+        checkpoint_path = self._range_checkpoint_path(title_from, title_to)
+        progress = {"continue": {}, "window": [], "emitted": 0, "done": False}
+        if checkpoint_path is not None and checkpoint_path.exists():
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                progress.update(json.load(f))
+
+        label = f"[{title_from or ''}, {title_to or ''})"
+        if progress["done"]:
+            logger.info(f"Aralık daha önce tamamlanmış: {label}")
+            return
+
+        batch_size = int(self.api_config.get("batch_size", 20))
+        logger.info(f"Aralık taranıyor: {label} ({batch_size}/istek)")
+
+        base_params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "generator": "allpages",
+            "gapnamespace": "0",
+            "gapfilterredir": "nonredirects",
+            "gaplimit": str(batch_size),
+            "prop": "extracts|info",
+            "exintro": "1",
+            "explaintext": "1",
+            "exlimit": "max",
+            "inprop": "url",
+        }
+        if title_from:
+            base_params["gapfrom"] = title_from
+        if title_to:
+            # gapto dahildir; aralık sonundaki başlık aşağıda elenir
+            base_params["gapto"] = title_to
+
+        end_key = title_key(title_to) if title_to else None
+        # Aynı sayfa grubunun excontinue istekleri boyunca üretilen sayfalar
+        window = set(progress["window"])
+        count = 0
+        failures = 0
+
+        def save() -> None:
+            if checkpoint_path is None:
+                return
+            progress["window"] = sorted(window)
+            tmp_path = Path(f"{checkpoint_path}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(progress, f, ensure_ascii=False)
+            os.replace(tmp_path, checkpoint_path)
+
+        try:
+            while limit <= 0 or count < limit:
+                params = {**base_params, **progress["continue"]}
+                try:
+                    response = self.controller.request(
+                        self.session,
+                        "GET",
+                        self.api_config["action_api"],
+                        params=params,
+                        timeout=self.get_timeout(),
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+                    failures = 0
+                except CircuitOpenError as e:
+                    logger.error(f"{e}, tarama durduruluyor")
+                    break
+                except Exception as e:
+                    failures += 1
+                    logger.error(f"Hata: {e}")
+                    if failures > self.controller.max_retries:
+                        break
+                    continue
+
+                for page in data.get("query", {}).get("pages", []):
+                    page_id = page.get("pageid")
+                    # Özeti olmayan sayfalar devam isteğinde (excontinue) gelir
+                    if page_id in window or not page.get("extract"):
+                        continue
+                    if end_key is not None and title_key(page.get("title", "")) >= end_key:
+                        continue
+
+                    window.add(page_id)
+                    count += 1
+                    progress["emitted"] += 1
+                    yield self._page_to_article(page)
+                    if 0 < limit <= count:
+                        break
+                else:
+                    cont = data.get("continue")
+                    if not cont:
+                        progress["done"] = True
+                        break
+
+                    # Yeni sayfa grubuna geçildiyse pencere sıfırlanır
+                    if "excontinue" not in cont:
+                        window.clear()
+                    progress["continue"] = cont
+                    save()
+        finally:
+            save()
+            logger.info(f"Aralık {label}: {count} sayfa çekildi (toplam {progress['emitted']})")
+
+    def iter_refresh(self, limit: int = 0) -> Iterator[Dict]:
+        """
+        Son değişiklikler akışından artımlı güncelleme (streaming)
+
+        Kaydedilen su seviyesinden (watermark) bu yana list=recentchanges ile
+        oluşturulan veya düzenlenen sayfalar yeniden çekilir; silinen sayfalar ve
+        taşınan sayfaların eski başlıkları için "deleted": True içeren silme
+        kayıtları (tombstone) üretilir. Kayıtlar mevcut veri setine id ile
+        uygulanmalıdır (bkz. JSONLExporter.upsert). Su seviyesi refresh.state_file'a
+        yalnızca tüm değişiklikler üretildikten sonra yazılır; yarıda kalan
+        güncelleme bir sonraki çalıştırmada tekrarlanır.
+
+        Args:
+            limit: Üretilecek kayıt sayısı (0 veya negatif: tüm değişiklikler)
+
+        Yields:
+            Güncel makale kayıtları ve silme kayıtları
+        """
+        refresh_config = self.config.get("refresh", {})
+        state_path = Path(refresh_config.get("state_file", f"data/state/{self.name}/refresh.json"))
+
+        if state_path.exists():
+            with open(state_path, "r", encoding="utf-8") as f:
+                watermark = json.load(f)
+        else:
+            hours = float(refresh_config.get("lookback_hours", 24))
+            start = datetime.now(timezone.utc) - timedelta(hours=hours)
+            watermark = {"timestamp": start.strftime("%Y-%m-%dT%H:%M:%SZ"), "rcids": []}
+
+        changes = self._read_recent_changes(watermark)
+        if changes is None:
+            return
+
+        titles, latest = changes
+        logger.info(f"{watermark['timestamp']} sonrası {len(titles)} sayfa değişmiş")
+
+        count = 0
+        changed = []
+        batch_size = int(self.api_config.get("batch_size", 20))
+
+        for title, action in list(titles.items()) + [(None, None)]:
+            if action == "deleted":
+                count += 1
+                yield self._tombstone(title)
+            elif action == "changed":
+                changed.append(title)
+
+            # Değişen başlıklar gruplar halinde tek istekte çekilir
+            if changed and (len(changed) >= batch_size or title is None):
+                try:
+                    for record in self._fetch_titles(changed):
+                        count += 1
+                        yield record
+                        if 0 < limit <= count:
+                            return
+                except Exception as e:
+                    # Su seviyesi ilerletilmez; değişiklikler sonraki çalıştırmada yeniden çekilir
+                    logger.error(f"Değişen sayfalar çekilemedi, su seviyesi kaydedilmedi: {e}")
+                    return
+                changed = []
+
+            if 0 < limit <= count:
+                return
+
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(f"{state_path}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(latest, f)
+        os.replace(tmp_path, state_path)
+        logger.info(
+            f"Artımlı güncelleme tamamlandı: {count} kayıt, su seviyesi {latest['timestamp']}"
+        )
+
+    def _read_recent_changes(self, watermark: Dict) -> Optional[Tuple[Dict[str, str], Dict]]:
+        """
+        Su seviyesinden bu yana değişen başlıkları oku
+
+        Args:
+            watermark: {"timestamp": ISO zaman, "rcids": o andaki işlenmiş değişiklikler}
+
+        Returns:
+            (başlık -> "changed"/"deleted" sözlüğü (son olay geçerli), yeni su seviyesi)
+            veya istek başarısız olursa None
+        """
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "list": "recentchanges",
+            "rcdir": "newer",
+            "rcstart": watermark["timestamp"],
+            "rcnamespace": "0",
+            "rctype": "edit|new|log",
+            "rcprop": "title|ids|timestamp|loginfo",
+            "rclimit": "500",
+        }
+        seen_ids = set(watermark.get("rcids", []))
+        latest = {"timestamp": watermark["timestamp"], "rcids": sorted(seen_ids)}
+        titles = {}
+        cont = {}
+
+        while True:
+            try:
+                response = self.controller.request(
+                    self.session,
+                    "GET",
+                    self.api_config["action_api"],
+                    params={**params, **cont},
+                    timeout=self.get_timeout(),
+                )
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                logger.error(f"Son değişiklikler okunamadı: {e}")
+                return None
+
+            for change in data.get("query", {}).get("recentchanges", []):
+                timestamp, rcid = change.get("timestamp", ""), change.get("rcid")
+                # Su seviyesindeki saniyede daha önce işlenmiş değişiklikler atlanır
+                if timestamp == watermark["timestamp"] and rcid in seen_ids:
+                    continue
+
+                for title, action in self._change_actions(change):
+                    titles.pop(title, None)
+                    titles[title] = action
+
+                if timestamp > latest["timestamp"]:
+                    latest = {"timestamp": timestamp, "rcids": []}
+                if timestamp == latest["timestamp"] and rcid is not None:
+                    latest["rcids"].append(rcid)
+
+            cont = data.get("continue")
+            if not cont:
+                return titles, latest
+
+    @staticmethod
+    def _change_actions(change: Dict) -> List[Tuple[str, str]]:
+        """Tek bir son değişiklik olayının başlıklara etkisi"""
+        title = change.get("title", "")
+        if change.get("type") != "log":
+            return [(title, "changed")]
+
+        logtype, logaction = change.get("logtype"), change.get("logaction")
+        if logtype == "delete" and logaction == "delete":
+            return [(title, "deleted")]
+        if logtype == "delete" and logaction == "restore":
+            return [(title, "changed")]
+        if logtype == "move":
+            target = change.get("logparams", {}).get("target_title")
+            return [(title, "deleted")] + ([(target, "changed")] if target else [])
+        return []
+
+    def _fetch_titles(self, titles: List[str]) -> Iterator[Dict]:
+        """
+        Başlık listesini tek grup halinde çek (excontinue takip edilir)
+        Bulunamayan sayfalar ve tüm devam istekleri bittiği halde özeti gelmeyen
+        sayfalar (ör. yönlendirmeye dönüşen sayfalar) için silme kaydı üretilir.
+
+        Raises:
+            Exception: İstek başarısız oldu veya istenen bir başlık yanıtta yok
+                (çağıran su seviyesini ilerletmemelidir)
+        """
+        base_params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "titles": "|".join(titles),
+            "prop": "extracts|info",
+            "exintro": "1",
+            "explaintext": "1",
+            "exlimit": "max",
+            "inprop": "url",
+        }
+        cont = {}
+        emitted = set()
+        returned = set()
+        normalized = {}
+
+        while True:
+            response = self.controller.request(
+                self.session,
+                "GET",
+                self.api_config["action_api"],
+                params={**base_params, **cont},
+                timeout=self.get_timeout(),
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            query = data.get("query", {})
+            for item in query.get("normalized", []):
+                normalized[item.get("from")] = item.get("to")
+            for page in query.get("pages", []):
+                title = page.get("title", "")
+                returned.add(title)
+                if title in emitted:
+                    continue
+                if page.get("missing"):
+                    emitted.add(title)
+                    yield self._tombstone(title)
+                elif page.get("extract"):
+                    emitted.add(title)
+                    yield self._page_to_article(page)
+
+            cont = data.get("continue")
+            if not cont:
+                break
+
+        # Metni kalmayan sayfaların eski kayıtları veri setinden kaldırılır
+        for title in sorted(returned - emitted):
+            yield self._tombstone(title)
+
+        unreturned = [t for t in titles if normalized.get(t, t) not in returned]
+        if unreturned:
+            raise ValueError(f"Yanıtta olmayan başlıklar: {unreturned[:5]}")
+
+    def _tombstone(self, title: str) -> Dict:
+        """Silinen sayfa için silme kaydı"""
+        return {
+            "id": self._generate_id(title),
+            "source": "wikipedia",
+            "url": "",
+            "title": title,
+            "text": "",
+            "deleted": True,
+            "timestamp": time.time(),
+        }
+
+    def _range_checkpoint_path(
+        self, title_from: Optional[str], title_to: Optional[str]
+    ) -> Optional[Path]:
+        """Aralığın devam noktası dosyası (enumeration.checkpoint_dir yoksa None)"""
+        directory = self.config.get("enumeration", {}).get("checkpoint_dir")
+        if not directory:
+            return None
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        digest = hashlib.md5(f"{title_from or ''}|{title_to or ''}".encode()).hexdigest()[:12]
+        return Path(directory) / f"range-{digest}.json"
+
+    def _page_to_article(self, page: Dict) -> Dict:
+        """
+        Action API sayfa nesnesini kayda dönüştür
+
+        Args:
+            page: query.pages içindeki sayfa (formatversion=2)
+
+        Returns:
+            Makale kaydı
+        """
+        return {
+            "id": self._generate_id(page.get("title", "")),
+            "source": "wikipedia",
+            "url": page.get("fullurl", ""),
+            "title": page.get("title", ""),
+            "text": page.get("extract", ""),
+            "timestamp": time.time(),
+        }
+
+    def _random_page_url(self) -> str:
+        """Rastgele sayfa endpoint'inin tam URL'ini oluştur"""
+        random_page_path = self.api_config.get("random_page", "/page/random/summary")
+        return self.get_api_url(random_page_path)
+
+    def _fetch_article(self, api_url: str) -> Dict:
+        """
+        Tek bir sayfa özetini çek ve kayda dönüştür
+
+        Args:
+            api_url: Sayfa özeti endpoint'i
+
+        Returns:
+            Makale kaydı
+        """
+        response = self.controller.request(self.session, "GET", api_url, timeout=self.get_timeout())
+        response.raise_for_status()
+        data = response.json()
+
+        return {
+            "id": self._generate_id(data.get("title", "")),
+            "source": "wikipedia",
+            "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
+            "title": data.get("title", ""),
+            "text": data.get("extract", ""),
+            "timestamp": time.time(),
+        }
 
     def _generate_id(self, text: str) -> str:
         """Metinden benzersiz ID oluştur"""
@@ -0,0 +1,229 @@
+"""
+data4tr - Crawl State
+Scraper'lar için kalıcı tarama durumu: görülen başlık indeksi ve kaldığı yerden devam
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Kompakt üyelik yapısı (Bloom filter)
+    Yanlış negatif yoktur; yanlış pozitif oranı false_positive_rate ile sınırlıdır.
+    1 milyon başlık %0.1 hata oranıyla yaklaşık 1.8 MB yer kaplar.
+    """
+
+    _HEADER = struct.Struct("<QQQ")
+
+    def __init__(self, capacity: int = 1_000_000, false_positive_rate: float = 0.001):
+        """
+        Args:
+            capacity: Beklenen eleman sayısı
+            false_positive_rate: Hedeflenen yanlış pozitif oranı
+        """
+        capacity = max(1, int(capacity))
+        self.size = max(
+            8, int(math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        )
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> List[int]:
+        """Anahtar için bit pozisyonları (double hashing)"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> bool:
+        """
+        Anahtarı ekle
+
+        Returns:
+            Anahtar daha önce (muhtemelen) yoksa True
+        """
+        added = False
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def save(self, path: Path) -> None:
+        """Filtreyi dosyaya atomik olarak yaz"""
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self._HEADER.pack(self.size, self.hash_count, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        """Filtreyi dosyadan yükle"""
+        with open(path, "rb") as f:
+            size, hash_count, count = cls._HEADER.unpack(f.read(cls._HEADER.size))
+            bits = bytearray(f.read())
+
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hash_count, bloom.count, bloom.bits = size, hash_count, count, bits
+        return bloom
+
+
+class CrawlState:
+    """
+    Kalıcı tarama durumu
+    Dizinde üç dosya tutulur:
+        seen.bloom     - Çalıştırmalar arasında korunan görülen başlık indeksi
+        progress.json  - Yarım kalan çalıştırmanın ilerlemesi
+        records.jsonl  - Yarım kalan çalıştırmada üretilen kayıtlar (devamda tekrar üretilir)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+        on_collision: str = "refetch",
+        checkpoint_every: int = 50,
+    ):
+        """
+        Args:
+            directory: Durum dizini
+            expected_items: Görülen indeksin boyutlandırıldığı başlık sayısı
+            false_positive_rate: İndeksin yanlış pozitif oranı
+            on_collision: Görülmüş başlıkta davranış ("skip": atla, "refetch": yenisini çek)
+            checkpoint_every: Kaç kayıtta bir diske yazılacağı
+        """
+        if on_collision not in ("skip", "refetch"):
+            raise ValueError(f"Geçersiz on_collision değeri: {on_collision}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.on_collision = on_collision
+        self.checkpoint_every = max(1, int(checkpoint_every))
+
+        self.seen_path = self.directory / "seen.bloom"
+        self.progress_path = self.directory / "progress.json"
+        self.spool_path = self.directory / "records.jsonl"
+
+        if self.seen_path.exists():
+            self.seen = BloomFilter.load(self.seen_path)
+        else:
+            self.seen = BloomFilter(expected_items, false_positive_rate)
+
+        self.progress = {"target": 0, "emitted": 0, "collisions": 0}
+        self._spool = None
+        self._since_checkpoint = 0
+
+    def begin(self, limit: int) -> List[Dict]:
+        """
+        Çalıştırmayı başlat veya yarım kalanı devam ettir
+
+        Args:
+            limit: Hedeflenen kayıt sayısı
+
+        Returns:
+            Önceki çalıştırmada üretilmiş kayıtlar (yeni çalıştırmada boş liste)
+        """
+        resumed = []
+        if self.progress_path.exists():
+            with open(self.progress_path, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+
+            # Son checkpoint'ten sonra yazılmış kayıtlar dikkate alınmaz
+            if self.spool_path.exists():
+                with open(self.spool_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if len(resumed) >= min(progress["emitted"], limit):
+                            break
+                        resumed.append(json.loads(line))
+
+            self.progress = progress
+            self.progress["emitted"] = len(resumed)
+            logger.info(f"Yarım kalan tarama devam ediyor: {len(resumed)} kayıt mevcut")
+
+        self.progress["target"] = limit
+        self._spool = open(self.spool_path, "w", encoding="utf-8")
+        for record in resumed:
+            self._spool.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.checkpoint()
+        return resumed
+
+    def is_seen(self, key: str) -> bool:
+        """Anahtar daha önce görüldü mü"""
+        return key in self.seen
+
+    def collide(self) -> None:
+        """Görülmüş bir başlıkla karşılaşıldığını kaydet"""
+        self.progress["collisions"] += 1
+
+    def record(self, record: Dict, key: str) -> None:
+        """
+        Üretilen kaydı işaretle ve biriktir
+
+        Args:
+            record: Üretilen kayıt
+            key: Görülen indeksine eklenecek anahtar (başlık)
+        """
+        self.seen.add(key)
+        self._spool.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.progress["emitted"] += 1
+        self._since_checkpoint += 1
+
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """İndeksi, ilerlemeyi ve biriken kayıtları diske yaz"""
+        if self._spool is not None:
+            self._spool.flush()
+            os.fsync(self._spool.fileno())
+
+        self.seen.save(self.seen_path)
+
+        self.progress["updated_at"] = time.time()
+        tmp_path = Path(f"{self.progress_path}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.progress, f)
+        os.replace(tmp_path, self.progress_path)
+        self._since_checkpoint = 0
+
+    def close(self, completed: bool = False) -> None:
+        """
+        Çalıştırmayı kapat
+
+        Args:
+            completed: True ise ilerleme silinir (görülen indeksi korunur),
+                False ise bir sonraki çalıştırma kaldığı yerden devam eder
+        """
+        self.checkpoint()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+        if completed:
+            self.progress_path.unlink()
+            self.spool_path.unlink()
+            logger.info(
+                f"Tarama tamamlandı: {self.progress['emitted']} kayıt, "
+                f"{self.progress['collisions']} tekrar eden başlık"
+            )
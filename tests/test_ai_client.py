@@ -0,0 +1,199 @@
+"""
+data4tr - AI Client Test
+Toplu ve eşzamanlı AI sınıflandırma istemcisi ile stand-in model sunucusu için testler
+"""
+
+import random
+import socket
+import time
+
+import pytest
+from data4tr.processor.ai_client import (
+    AIBackendError,
+    AsyncBatchClassifier,
+    CallableBackend,
+    HTTPBackend,
+    OpenAIChatBackend,
+    create_backend,
+)
+from data4tr.processor.classify import TextClassifier
+from data4tr.processor.standin_server import StandInModelServer
+
+_WORDS = "tarih savaş futbol maç roman şiir okul doktor piyasa bilgisayar deniz müze".split()
+
+
+def _texts(unique: int, total: int, seed: int = 0):
+    """Tekrarlar içeren yapay metinler"""
+    rng = random.Random(seed)
+    pool = [" ".join(rng.choices(_WORDS, k=8)) + f" {i}" for i in range(unique)]
+    return pool + rng.choices(pool, k=total - unique)
+
+
+def _client(server: StandInModelServer, **options) -> AsyncBatchClassifier:
+    options.setdefault("backoff_base", 0.01)
+    return AsyncBatchClassifier(HTTPBackend(server.url), **options)
+
+
+class TestAsyncBatchClassifier:
+    """AsyncBatchClassifier sınıfı için testler"""
+
+    def test_batches_deduplicates_and_caps_concurrency(self):
+        """Tekrarlar bir kez gönderilmeli, uçuştaki istek sayısı sınırı aşmamalı"""
+        texts = _texts(60, 200)
+        with StandInModelServer(latency=0.02) as server:
+            client = _client(server, batch_size=8, max_batch_size=8, max_concurrency=3)
+            results = client.classify(texts)
+            again = client.classify(texts[:10])
+
+            assert [r["category"] for r in results] == [
+                r["category"] for r in server.classify(texts)
+            ]
+            assert again == results[:10]
+            assert server.stats["texts"] == 60
+            assert server.stats["requests"] == 8
+            assert server.stats["max_in_flight"] <= 3
+            assert client.stats["cached"] == 140 + 10
+
+    def test_batch_size_adapts_to_latency(self):
+        """Grup boyutu hedef gecikmeye doğru büyümeli veya küçülmeli"""
+        texts = _texts(400, 400)
+        with StandInModelServer(latency=0.01, per_text_latency=0.002) as server:
+            growing = _client(server, batch_size=1, max_concurrency=2, target_latency=0.1)
+            growing.classify(texts)
+            shrinking = _client(server, batch_size=200, max_concurrency=2, target_latency=0.1)
+            shrinking.classify(texts)
+
+        # Hedef gecikmeye karşılık gelen boyut ~45 metin
+        assert 8 <= growing.batch_size <= 160
+        assert growing.batch_sizes[-1] > 1
+        assert 8 <= shrinking.batch_size < 200
+        assert growing.stats["requests"] < len(texts) / 4
+
+    def test_retries_and_splits_oversized_batches(self):
+        """429 yanıtları yeniden denenmeli, 413 yanıtında grup bölünmeli"""
+        texts = _texts(100, 100)
+        with StandInModelServer(throttle_every=3, throttle_burst=1, max_batch_size=10) as server:
+            # Tek istek uçuşta: 429'lar istek sırasına göre belirlenir, hiçbir grup art
+            # arda iki kez reddedilmez
+            client = _client(server, batch_size=32, max_concurrency=1, max_retries=5)
+            results = client.classify(texts)
+
+        assert len(results) == 100
+        assert client.stats["retries"] > 0
+        assert client.stats["fallback"] == 0
+        assert client.max_batch_size <= 10
+        assert server.stats["rejected"] >= 1
+        assert server.stats["texts"] == 100
+
+    def test_fallback_after_retries(self):
+        """Denemeler tükenince fallback kullanılmalı, fallback yoksa hata yükselmeli"""
+        texts = _texts(5, 5)
+        with StandInModelServer(error_rate=1.0) as server:
+            client = _client(server, max_retries=1, fallback=lambda text: {"category": "genel"})
+            assert [r["category"] for r in client.classify(texts)] == ["genel"] * 5
+            assert client.stats["fallback"] == 5
+            assert client.stats["retries"] == 1
+
+            with pytest.raises(AIBackendError):
+                _client(server, max_retries=0).classify(texts)
+
+    def test_circuit_breaker_short_circuits_to_fallback(self):
+        """Kapalı porta karşı devre açılmalı, kalan gruplar beklemeden fallback'e gitmeli"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            url = f"http://127.0.0.1:{sock.getsockname()[1]}/v1"
+        texts = _texts(640, 640)
+        client = AsyncBatchClassifier(
+            HTTPBackend(url, timeout=2),
+            batch_size=16,
+            max_batch_size=16,
+            fallback=lambda text: {"category": "genel"},
+        )
+
+        start = time.monotonic()
+        results = client.classify(texts)
+        elapsed = time.monotonic() - start
+
+        assert [r["category"] for r in results] == ["genel"] * 640
+        assert client.breaker.state == "open"
+        assert client.stats["fallback"] == 640
+        assert client.stats["short_circuited"] > 0
+        assert client.stats["requests"] < 20
+        assert elapsed < 10
+
+    def test_callable_backend(self):
+        """Herhangi bir fonksiyon backend olarak kullanılabilmeli"""
+        calls = []
+
+        def backend(texts, categories):
+            calls.append(len(texts))
+            return [{"category": "spor", "confidence": 0.9} for _ in texts]
+
+        client = AsyncBatchClassifier(CallableBackend(backend), batch_size=4, max_concurrency=2)
+        results = client.classify(["a", "b", "c", "a", "d", "e"])
+        assert [r["category"] for r in results] == ["spor"] * 6
+        assert sum(calls) == 5
+
+
+class TestBackends:
+    """HTTP backend'leri ve TextClassifier entegrasyonu için testler"""
+
+    def test_openai_chat_backend(self):
+        """OpenAI uyumlu sohbet API'si ile sınıflandırma"""
+        texts = ["Futbol maçında takım oyuncu değiştirdi.", "Roman ve şiir kitabı"]
+        with StandInModelServer() as server:
+            backend = OpenAIChatBackend(server.url, model="gpt-4")
+            results = AsyncBatchClassifier(backend).classify(texts)
+
+        assert [r["category"] for r in results] == ["spor", "edebiyat"]
+
+    def test_malformed_results_raise_backend_error(self):
+        """Sözlük olmayan sonuç veya sayısal olmayan güven AIBackendError olmalı"""
+        backend = HTTPBackend("http://127.0.0.1:1/v1")
+        categories = ["spor", "genel"]
+        for data in (
+            ["spor"],
+            {"results": ["spor"]},
+            {"results": [None]},
+            {"results": [{"category": "spor", "confidence": "yüksek"}]},
+            {"results": [{"category": "spor", "confidence": None}]},
+            {"results": [{"category": "spor", "all_scores": [0.9]}]},
+        ):
+            with pytest.raises(AIBackendError):
+                backend.parse(data, ["metin"], categories)
+
+        result = backend.parse(
+            {"results": [{"category": "x", "confidence": "0.5"}]}, ["m"], categories
+        )
+        assert result == [{"category": "genel", "confidence": 0.5, "all_scores": {"genel": 0.5}}]
+
+    def test_create_backend(self):
+        """Endpoint, protokol ve sağlayıcı ayarlarına göre backend seçilmeli"""
+        assert type(create_backend("gpt-4", {"endpoint": "http://x/v1"})) is HTTPBackend
+        backend = create_backend("gpt-4", {"endpoint": "http://x/v1", "protocol": "openai"})
+        assert isinstance(backend, OpenAIChatBackend)
+        assert create_backend("gpt-4", {}, {"openai": {"enabled": False}}) is None
+        providers = {"openai": {"enabled": True, "base_url": "http://y/v1", "model": "gpt-4o"}}
+        assert create_backend("gpt-4", {}, providers).model == "gpt-4o"
+
+    def test_text_classifier_uses_client(self):
+        """TextClassifier AI modellerinde toplu istemciyi kullanmalı"""
+        texts = ["Futbol maçında takım oyuncu değiştirdi.", "Hastanede doktor ilaç verdi."] * 3
+        with StandInModelServer() as server:
+            classifier = TextClassifier(model="local-llm", ai_config={"endpoint": server.url})
+            results = classifier.classify_many(texts)
+            assert classifier.classify(texts[0]) == "spor"
+
+        assert [r["category"] for r in results] == ["spor", "sağlık"] * 3
+        assert server.stats["texts"] == 2
+        assert classifier.ai_client.stats["texts"] == 7
+
+    def test_text_classifier_without_backend(self):
+        """Backend yapılandırılmamışsa anahtar kelime sınıflandırması kullanılmalı"""
+        classifier = TextClassifier(model="local-llm", ai_config={})
+        assert classifier.classify("Futbol maçında takım oyuncu") == "spor"
+        assert classifier.ai_client is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,8 +3,21 @@ data4tr - Algorithms Test
 Metin metrikleri algoritmaları için birim testleri
 """
 
+import random
+import re
+import time
+import unicodedata
+
 import pytest
-from data4tr.algorithms import TextMetrics
+from data4tr.algorithms import (
+    KeywordIndex,
+    TextMetrics,
+    fold_records,
+    turkish_fold,
+    turkish_upper,
+)
+from data4tr.processor.classify import KEYWORDS, TextClassifier
+from data4tr.processor.deduplicate import Deduplicator
 
 
 class TestTextMetrics:
@@ -81,5 +94,112 @@ class TestTextMetrics:
         assert tfidf_scores["dil"] >= 0  # TF-IDF skoru >= 0 olmalı
 
 
+class TestTurkishFold:
+    """Türkçe büyük/küçük harf katlama testleri"""
+
+    def test_turkish_case_rules(self):
+        """I -> ı, İ -> i (birleşik nokta olmadan)"""
+        assert turkish_fold("IŞIK İstanbul") == "ışık istanbul"
+        assert turkish_fold("ILIK su") == "ılık su"
+        assert turkish_fold("İZMİR") == "izmir"
+        assert turkish_fold("") == ""
+        assert turkish_upper("ışık istanbul") == "IŞIK İSTANBUL"
+
+    def test_nfc_variants_are_equal(self):
+        """NFC ve NFD biçimleri aynı katlanmış metni vermeli"""
+        text = "Şişli'de Çağlayan ÖĞRENCİ yurdu"
+        decomposed = unicodedata.normalize("NFD", text)
+
+        assert decomposed != text
+        assert turkish_fold(decomposed) == turkish_fold(text) == "şişli'de çağlayan öğrenci yurdu"
+
+    def test_stages_share_folded_form(self):
+        """Tekrar tespiti, metrikler ve sınıflandırıcı katlanmış biçimi kullanmalı"""
+        records = [
+            {"id": "1", "text": "IRMAK KIYISINDA BİLİM"},
+            {"id": "2", "text": unicodedata.normalize("NFD", "ırmak kıyısında bilim")},
+            {"id": "3", "text": "Başka bir metin"},
+        ]
+        folded = fold_records(records)
+
+        assert folded[0] == folded[1] == "ırmak kıyısında bilim"
+        unique = Deduplicator().remove_duplicates(records, folded)
+        assert [r["id"] for r in unique] == ["1", "3"]
+        assert Deduplicator().generate_hash(records[0]["text"]) == Deduplicator().generate_hash(
+            records[1]["text"]
+        )
+
+        assert TextMetrics.jaccard_similarity(records[0]["text"], records[1]["text"]) == 1.0
+        assert "ırmak" in TextMetrics.calculate_tf(records[0]["text"])
+        assert TextClassifier().classify("İNTERNET ve DİJİTAL YAZILIM") == "teknoloji"
+
+
+def _random_words(rng, count):
+    """Rastgele Türkçe harflerden kelimeler"""
+    letters = "abcçdefgğhıijklmnoöprsştuüvyz"
+    return ["".join(rng.choices(letters, k=rng.randint(4, 12))) for _ in range(count)]
+
+
+class TestKeywordIndex:
+    """KeywordIndex sınıfı için testler"""
+
+    def test_matches_substring_scoring(self):
+        """Skorlar kelime başına 'in' kontrolüyle aynı olmalı (iç içe kelimeler dahil)"""
+        index = KeywordIndex(KEYWORDS)
+        words = [w for ws in KEYWORDS.values() for w in ws] + ["ve", "tarihte", "paradigma"]
+        rng = random.Random(23)
+        for _ in range(2000):
+            separator = rng.choice([" ", ""])
+            text = separator.join(rng.choices(words, k=rng.randint(0, 25)))
+            expected = {c: sum(1 for w in ws if w in text) for c, ws in KEYWORDS.items()}
+            assert index.score(text) == expected, text
+
+    def test_word_boundary(self):
+        """Tam kelime modunda kelime içi eşleşmeler sayılmamalı"""
+        keywords = {"tarih": ["tarih", "tarihi", "osmanlı tarihi"], "ekonomi": ["para"]}
+        index = KeywordIndex(keywords, word_boundary=True)
+
+        assert index.find("Osmanlı tarihi ve paradigma") == {"tarihi", "osmanlı tarihi"}
+        assert index.score("tarihte para") == {"tarih": 0, "ekonomi": 1}
+        assert KeywordIndex(keywords).score("tarihte paradigma") == {"tarih": 1, "ekonomi": 1}
+
+    def test_word_boundary_matches_regex(self):
+        """Kelime karakteri olmayan uçlu anahtar kelimeler de tam kelime olarak eşleşmeli"""
+        words = ["c", "c+", "c++", ".net", "net", "e-posta", "e-", "e", "posta", "a.b", "a", "%50"]
+        keywords = {f"k{i}": [word] for i, word in enumerate(words)}
+        index = KeywordIndex(keywords, word_boundary=True)
+        fragments = words + [" ", "", "x", "+", ".", "-", "%", "5"]
+        rng = random.Random(231)
+        for _ in range(3000):
+            text = "".join(rng.choices(fragments, k=rng.randint(0, 12)))
+            expected = {
+                word for word in words if re.search(rf"(?<!\w){re.escape(word)}(?!\w)", text)
+            }
+            assert index.find(text) == expected, text
+
+    def test_scan_cost_stays_flat(self):
+        """Anahtar kelime sayısı 100 kat artınca tarama süresi orantılı artmamalı"""
+        rng = random.Random(23)
+        text = turkish_fold("Cumhuriyet tarihi boyunca bilim ve teknoloji araştırmaları. " * 30)
+        timings = []
+        for count in (10, 1000):
+            index = KeywordIndex({f"k{i}": _random_words(rng, count) for i in range(10)})
+            start = time.perf_counter()
+            for _ in range(50):
+                index.score(text, folded=True)
+            timings.append(time.perf_counter() - start)
+        assert timings[1] < timings[0] * 20
+
+    def test_classifier_uses_index(self):
+        """Sınıflandırıcı indeksi bir kez derlemeli"""
+        classifier = TextClassifier()
+        result = classifier.classify_with_keywords("Futbol maçında takım oyuncu değiştirdi.")
+
+        assert len(classifier.keyword_index) == sum(map(len, KEYWORDS.values()))
+        assert result["category"] == "spor"
+        assert result["all_scores"]["spor"] == 4
+        assert TextClassifier(keywords={}).classify("Herhangi bir metin") == "genel"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
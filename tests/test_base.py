@@ -0,0 +1,158 @@
+"""
+data4tr - Request Control Test
+Yeniden deneme, hız adaptasyonu ve devre kesici için testler
+"""
+
+import threading
+
+import pytest
+import requests
+from data4tr.scraper.base import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestController,
+    TokenBucket,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+class _StubSession:
+    """Sırayla önceden belirlenmiş durum kodlarını döndüren session"""
+
+    def __init__(self, statuses, headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status == "error":
+            raise requests.ConnectionError("bağlantı koptu")
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(self.headers)
+        return response
+
+
+def _controller(**kwargs):
+    kwargs.setdefault("backoff_base", 0.001)
+    rate_limiter = kwargs.pop("rate_limiter", TokenBucket(rate=0))
+    return RequestController(rate_limiter, **kwargs)
+
+
+class TestRequestController:
+    """RequestController sınıfı için testler"""
+
+    def test_retries_on_throttle(self):
+        """429 ve 503 yanıtlarından sonra yeniden denenmeli"""
+        session = _StubSession([429, 503, 200], headers={"Retry-After": "0"})
+        controller = _controller()
+        response = controller.request(session, "GET", "http://test")
+
+        assert response.status_code == 200
+        assert session.calls == 3
+        assert controller.stats["retries"] == 2
+        assert controller.stats["throttled"] == 2
+
+    def test_retries_connection_errors(self):
+        """Bağlantı hataları yeniden denenmeli, deneme hakkı bitince hata fırlatılmalı"""
+        controller = _controller(max_retries=2)
+        assert controller.request(_StubSession(["error", 200]), "GET", "http://test").ok
+
+        with pytest.raises(requests.ConnectionError):
+            controller.request(_StubSession(["error"] * 5), "GET", "http://test")
+
+    def test_slot_released_during_backoff(self):
+        """Geri çekilme beklenirken slot boşta olmalı, bekleme gecikmeye sayılmamalı"""
+        slots = threading.Semaphore(1)
+        controller = _controller(slots=slots)
+        free_during_sleep = []
+
+        def sleep(attempt, retry_after):
+            free = slots.acquire(blocking=False)
+            if free:
+                slots.release()
+            free_during_sleep.append(free)
+
+        controller._sleep = sleep
+        session = _StubSession(["error", "error", 200])
+        assert controller.request(session, "GET", "http://test").ok
+        assert free_during_sleep == [True, True]
+        assert controller.stats["requests"] == len(controller.latencies) == 3
+
+    def test_non_retryable_status(self):
+        """404 gibi yanıtlar yeniden denenmemeli"""
+        session = _StubSession([404])
+        response = _controller().request(session, "GET", "http://test")
+
+        assert response.status_code == 404
+        assert session.calls == 1
+
+    def test_retry_budget(self):
+        """Yeniden deneme bütçesi bitince yanıt olduğu gibi döndürülmeli"""
+        controller = _controller(min_retry_tokens=2, max_retries=10)
+        session = _StubSession([500] * 10)
+        response = controller.request(session, "GET", "http://test")
+
+        assert response.status_code == 500
+        assert session.calls == 3
+
+    def test_aimd_rate_adaptation(self):
+        """Hız başarıda toplamsal artmalı, kısıtlamada çarpımsal düşmeli"""
+        bucket = TokenBucket(rate=1000)
+        controller = _controller(
+            rate_limiter=bucket, max_rate=2000, increase_step=10, max_retries=0
+        )
+
+        controller.request(_StubSession([200]), "GET", "http://test")
+        assert bucket.rate == pytest.approx(1010)
+
+        controller.request(_StubSession([429]), "GET", "http://test")
+        assert bucket.rate == pytest.approx(505)
+
+        controller.request(_StubSession([200]), "GET", "http://test")
+        assert bucket.rate == pytest.approx(515)
+
+    def test_circuit_breaker_opens(self):
+        """Art arda hatalarda devre açılmalı ve istekler reddedilmeli"""
+        controller = _controller(max_retries=0, breaker=CircuitBreaker(failure_threshold=3))
+        session = _StubSession([500] * 3)
+        for _ in range(3):
+            controller.request(session, "GET", "http://test")
+
+        with pytest.raises(CircuitOpenError):
+            controller.request(session, "GET", "http://test")
+        assert session.calls == 3
+
+    def test_circuit_breaker_half_open(self):
+        """Süre dolunca deneme isteğine izin verilmeli, başarı devreyi kapatmalı"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+
+class TestHelpers:
+    """Yardımcı fonksiyonlar için testler"""
+
+    def test_backoff_delay_bounds(self):
+        """Geri çekilme süresi üstel sınırı ve maksimumu aşmamalı"""
+        for attempt in range(10):
+            delay = backoff_delay(attempt, base=0.5, maximum=4.0)
+            assert 0 <= delay <= min(4.0, 0.5 * 2**attempt)
+
+    def test_parse_retry_after(self):
+        """Retry-After saniye ve HTTP tarihi olarak okunabilmeli"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("geçersiz") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+data4tr - Mock Server ve Benchmark Test
+Yerel Wikipedia benzeri sunucu ve verim ölçüm aracı için testler
+"""
+
+import pytest
+import requests
+from data4tr.scraper.base import ScraperRegistry
+from data4tr.scraper.benchmark import BENCHMARK_SOURCE, format_report, percentile, run_benchmark
+from data4tr.scraper.mockserver import MockWikipediaServer
+
+
+@pytest.fixture
+def server():
+    """Arka planda çalışan mock sunucu"""
+    with MockWikipediaServer(pages=500, seed=1) as mock:
+        yield mock
+
+
+class TestMockWikipediaServer:
+    """MockWikipediaServer sınıfı için testler"""
+
+    def test_summary_shape(self, server):
+        """Özet endpoint'i REST API şeklinde yanıt vermeli"""
+        data = requests.get(f"{server.url}/page/random/summary", timeout=5).json()
+
+        assert data["title"] == server.title(data["pageid"] - 1)
+        assert data["extract"].startswith(data["title"])
+        assert data["content_urls"]["desktop"]["page"].startswith("https://tr.wikipedia.org/wiki/")
+
+    def test_pages_are_deterministic(self):
+        """Aynı seed aynı içeriği üretmeli"""
+        assert MockWikipediaServer(seed=3).page(42) == MockWikipediaServer(seed=3).page(42)
+        assert MockWikipediaServer(seed=3).page(42) != MockWikipediaServer(seed=4).page(42)
+
+    def test_batch_continuation(self, server):
+        """excontinue ile gelen devam isteği aynı grubun kalan özetlerini döndürmeli"""
+        params = {"action": "query", "generator": "random", "grnlimit": 30, "prop": "extracts"}
+        first = requests.get(f"{server.url}/w/api.php", params=params, timeout=5).json()
+        cont = first["continue"]
+        second = requests.get(
+            f"{server.url}/w/api.php", params={**params, **cont}, timeout=5
+        ).json()
+
+        titles = [p["title"] for p in first["query"]["pages"]]
+        assert [p["title"] for p in second["query"]["pages"]] == titles
+        assert sum("extract" in p for p in first["query"]["pages"]) == 20
+        assert sum("extract" in p for p in second["query"]["pages"]) == 10
+        assert "excontinue" not in second["continue"]
+
+    def test_throttle_burst(self):
+        """Her throttle_every istekte throttle_burst kadar 429 dönmeli"""
+        with MockWikipediaServer(throttle_every=5, throttle_burst=2, retry_after=1) as mock:
+            responses = [
+                requests.get(f"{mock.url}/page/random/summary", timeout=5) for _ in range(10)
+            ]
+
+        statuses = [r.status_code for r in responses]
+        assert statuses == [429, 429, 200, 200, 200] * 2
+        assert responses[0].headers["Retry-After"] == "1"
+        assert mock.stats["throttled"] == 4
+
+
+class TestBenchmark:
+    """Benchmark aracı için testler"""
+
+    def test_percentile(self):
+        """Nearest-rank yüzdelik"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    @pytest.mark.parametrize("via", ["scraper", "scrape_source"])
+    def test_report(self, server, via):
+        """Rapor verim, gecikme ve yeniden deneme alanlarını içermeli"""
+        result = run_benchmark(pages=20, concurrency=4, via=via, server=server)
+
+        assert result["pages"] == 20
+        assert result["requests"] == 20
+        assert result["pages_per_second"] > 0
+        assert 0 < result["p50_ms"] <= result["p99_ms"]
+        assert "mode" in format_report([result])
+
+    def test_retries_are_counted(self):
+        """429 patlamaları yeniden deneme olarak raporlanmalı"""
+        result = run_benchmark(pages=10, concurrency=1, throttle_every=5, throttle_burst=1)
+
+        assert result["pages"] == 10
+        assert result["throttled"] == result["server"]["throttled"] > 0
+        assert result["retries"] == result["throttled"]
+
+    def test_registration_is_removed(self, server):
+        """Benchmark kaynağı çalıştırma sonrası kayıt defterinde kalmamalı"""
+        run_benchmark(pages=5, concurrency=1, server=server)
+
+        assert BENCHMARK_SOURCE not in ScraperRegistry.list_registered()
+        assert ScraperRegistry.get(BENCHMARK_SOURCE) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,181 @@
+"""
+data4tr - Response Cache Test
+Disk önbelleği ve koşullu doğrulama için testler
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from data4tr.scraper.cache import CachedSession, ResponseCache
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """
+    ETag döndüren ve If-None-Match için 304 veren handler
+    (?cc= 200 yanıtının, ?cc304= 304 yanıtının Cache-Control değeri olur)
+    """
+
+    requests_seen = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(self.headers.get("If-None-Match"))
+        etag = f'"{self.path}"'
+        query = parse_qs(urlparse(self.path).query)
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            if query.get("cc304"):
+                self.send_header("Cache-Control", query["cc304"][0])
+            self.end_headers()
+            return
+
+        body = ("içerik " + self.path).encode("utf-8") * 100
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        cache_control = query.get("cc")
+        if cache_control:
+            self.send_header("Cache-Control", cache_control[0])
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Arka planda çalışan yerel sunucu"""
+    _ETagHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestCachedSession:
+    """CachedSession ve ResponseCache için testler"""
+
+    def test_fresh_entry_served_from_disk(self, server, tmp_path):
+        """TTL içindeki tekrar istekler ağa gitmemeli"""
+        session = CachedSession(ResponseCache(tmp_path, ttl=60))
+        first = session.get(f"{server}/a")
+        second = session.get(f"{server}/a")
+
+        assert first.text == second.text
+        assert getattr(second, "from_cache", False)
+        assert len(_ETagHandler.requests_seen) == 1
+
+    def test_stale_entry_is_revalidated(self, server, tmp_path):
+        """Süresi dolmuş kayıt If-None-Match ile doğrulanmalı"""
+        cache = ResponseCache(tmp_path, ttl=0)
+        session = CachedSession(cache)
+        first = session.get(f"{server}/b")
+        second = session.get(f"{server}/b")
+
+        assert second.status_code == 200
+        assert second.text == first.text
+        assert _ETagHandler.requests_seen == [None, '"/b"']
+        assert cache.stats["revalidated"] == 1
+
+    def test_cache_control_is_honored(self, server, tmp_path):
+        """no-cache/max-age=0 her kullanımda doğrulanmalı, private/no-store saklanmamalı"""
+        cache = ResponseCache(tmp_path, ttl=60)
+        session = CachedSession(cache)
+        for value in ("no-cache", "max-age=0", "private", "no-store"):
+            session.get(f"{server}/c?cc={value}")
+            session.get(f"{server}/c?cc={value}")
+
+        etag = '"/c?cc={}"'.format
+        assert _ETagHandler.requests_seen == [
+            None,
+            etag("no-cache"),
+            None,
+            etag("max-age=0"),
+            None,
+            None,
+            None,
+            None,
+        ]
+        assert cache.stats["revalidated"] == 2 and cache.stats["hits"] == 0
+
+        session.get(f"{server}/d?cc=max-age=600")
+        assert getattr(session.get(f"{server}/d?cc=max-age=600"), "from_cache", False)
+
+    def test_304_headers_update_entry(self, server, tmp_path):
+        """304 yanıtındaki yeni Cache-Control saklanan kayda yazılmalı"""
+        cache = ResponseCache(tmp_path, ttl=60)
+        session = CachedSession(cache)
+        url = f"{server}/d?cc=no-cache&cc304=max-age%3D60"
+        for _ in range(3):
+            assert session.get(url).status_code == 200
+
+        # İkinci istek doğrulanır, 304 ile gelen max-age=60 üçüncüyü diskten karşılar
+        assert _ETagHandler.requests_seen == [None, '"/d?cc=no-cache&cc304=max-age%3D60"']
+        assert cache.stats["revalidated"] == 1 and cache.stats["hits"] == 1
+        entry = cache.get(cache.make_key("GET", url, dict(session.headers)))
+        assert entry["headers"]["Cache-Control"] == "max-age=60"
+
+    def test_stats_are_thread_safe(self, server, tmp_path):
+        """Paylaşılan session'da sayaçlar kaybolmamalı"""
+        cache = ResponseCache(tmp_path, ttl=60)
+        session = CachedSession(cache)
+        session.get(f"{server}/e")
+
+        def worker():
+            for _ in range(50):
+                session.get(f"{server}/e")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.stats["hits"] == 400
+        assert cache.stats["misses"] == 1
+
+    def test_random_endpoints_bypass_cache(self, server, tmp_path):
+        """Rastgele örnekleme uçları hiç önbelleğe alınmamalı"""
+        cache = ResponseCache(tmp_path, ttl=60)
+        session = CachedSession(cache)
+        for url in (f"{server}/page/random/summary", f"{server}/w/api.php?generator=random"):
+            session.get(url)
+            assert not getattr(session.get(url), "from_cache", False)
+
+        assert len(_ETagHandler.requests_seen) == 4
+        assert cache.stats["stored"] == 0
+
+    def test_headers_are_part_of_key(self, server, tmp_path):
+        """Farklı header'larla yapılan istekler ayrı saklanmalı"""
+        session = CachedSession(ResponseCache(tmp_path, ttl=60))
+        session.get(f"{server}/c", headers={"Accept": "text/plain"})
+        session.get(f"{server}/c", headers={"Accept": "application/json"})
+
+        assert len(_ETagHandler.requests_seen) == 2
+
+    def test_lru_eviction(self, server, tmp_path):
+        """Boyut sınırı aşılınca en eski erişilen kayıt silinmeli"""
+        cache = ResponseCache(tmp_path, ttl=60, max_size_mb=0.002)  # ~2 KB
+        session = CachedSession(cache)
+        session.get(f"{server}/d1")
+        time.sleep(0.01)
+        session.get(f"{server}/d2")
+
+        assert cache.size() <= cache.max_size
+        assert cache.stats["evicted"] >= 1
+
+        # En son erişilen kayıt hâlâ önbellekte olmalı
+        session.get(f"{server}/d2")
+        assert len(_ETagHandler.requests_seen) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
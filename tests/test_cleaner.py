@@ -3,8 +3,20 @@ data4tr - Cleaner Test
 Metin temizleme fonksiyonları için testler
 """
 
+import random
+
 import pytest
-from data4tr.scraper.cleaner import TextCleaner
+from data4tr.scraper.cleaner import CleaningEngine, StreamingCleaner, TextCleaner
+
+# Diferansiyel test için metin parçaları (HTML, entity, URL, Türkçe, özel boşluklar)
+_FRAGMENTS = [
+    "<p>", "</p>", "<b class='x'>", "<", ">", "&amp;", "&lt;i&gt;", "&nbsp;", "&#305;", "&amp",
+    "http://example.com/a?b=1&c=2", "https://tr.wikipedia.org/wiki/Ş", "http:/", "http",
+    "Çalışkan", "öğrenci", "İstanbul", "ışık", "Ü", "kitap", "ve", "1923", "x",
+    " ", "  ", "\n", "\n\n", "\t", "\r\n", "\xa0", "\u2028", "\x1c", "\u3000",
+    ".", ",", "!!!!", "?", "-", "'", '"', "(", ")", "[", "]", "{", "}", "@", "#", "%", "€",
+    "😀", "→", "aaaa", "!!!!!!", "ğğğğğ", "     ", "é", "ß", "\x00",
+]  # fmt: skip
 
 
 class TestTextCleaner:
@@ -48,5 +60,93 @@ class TestTextCleaner:
         assert "https://" not in cleaned
 
 
+class TestCleaningEngine:
+    """CleaningEngine sınıfı için testler"""
+
+    def test_matches_stepwise_clean(self):
+        """Derlenmiş motor adım adım temizlikle birebir aynı çıktıyı vermeli"""
+        engine = CleaningEngine()
+        rng = random.Random(15)
+        texts = ["", " ", "kısa", "<p>Test   metin   https://example.com</p>" * 3]
+        for _ in range(3000):
+            texts.append("".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 40))))
+
+        for text in texts:
+            assert engine.clean(text) == TextCleaner.stepwise_clean(text), repr(text)
+
+    def test_destructive_clean_uses_engine(self):
+        """destructive_clean motorun sonucunu döndürmeli"""
+        text = "<p>Çoklu     boşluk &amp; http://a.com   gereksiz!!!!!! karakterler</p>"
+        assert TextCleaner.destructive_clean(text) == CleaningEngine().clean(text)
+        assert TextCleaner.destructive_clean(text) == "Çoklu boşluk gereksiz!! karakterler"
+
+    def test_batch_reports_throughput(self):
+        """clean_batch karakter/saniye raporlamalı"""
+        engine = CleaningEngine()
+        texts = ["<b>Türkçe</b> örnek metin, yeterince uzun."] * 100
+
+        cleaned = engine.clean_batch(texts)
+        report = engine.report()
+
+        assert cleaned == [TextCleaner.stepwise_clean(t) for t in texts]
+        assert report["texts"] == 100
+        assert report["chars"] == sum(map(len, texts))
+        assert report["chars_per_second"] > 0
+
+
+def _random_chunks(rng, text):
+    """Metni rastgele noktalardan parçalara böl"""
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 12))))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+class TestStreamingCleaner:
+    """StreamingCleaner sınıfı için testler"""
+
+    @pytest.mark.parametrize(
+        "stream, whole",
+        [
+            (TextCleaner.iter_destructive_clean, TextCleaner.stepwise_clean),
+            (TextCleaner.iter_preprocess_for_ai, TextCleaner.preprocess_for_ai),
+        ],
+    )
+    def test_matches_whole_string(self, stream, whole):
+        """Rastgele bölünmüş parçaların çıktısı tüm metin üzerindeki sonuçla aynı olmalı"""
+        rng = random.Random(17)
+        for _ in range(3000):
+            text = "".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 40)))
+            chunks = _random_chunks(rng, text)
+            assert "".join(stream(chunks)) == whole(text), repr(chunks)
+
+        text = "<a href='x'>Bağlantı</a> https://ornek.com/yol &amp; ooooooo &#305;şık metni"
+        assert "".join(stream(list(text))) == whole(text)
+
+    def test_boundary_patterns(self):
+        """Parça sınırını aşan URL, etiket, entity ve tekrar doğru işlenmeli"""
+        chunks = ["Metin htt", "ps://ornek.com/a", "b <spa", "n>ve &am", "p; yaaa", "aaaz son"]
+        text = "".join(chunks)
+
+        assert "".join(TextCleaner.iter_destructive_clean(chunks)) == "Metin ve yaaz son"
+        assert TextCleaner.destructive_clean(text) == "Metin ve yaaz son"
+
+    def test_short_output_is_dropped(self):
+        """Toplam çıktı 10 karakteri aşmazsa hiçbir şey üretilmemeli"""
+        assert list(TextCleaner.iter_destructive_clean(["kısa", " metin"])) == []
+        assert list(TextCleaner.iter_destructive_clean([])) == []
+
+    def test_bounded_buffers(self):
+        """Büyük belgede bekletilen kuyruklar parça boyutunu aşmamalı"""
+        paragraph = "<p>Örnek paragraf &amp; https://ornek.com/yol?x=1 bağlantı!!!!!!</p>\n"
+        cleaner = StreamingCleaner.destructive()
+
+        total = 0
+        for _ in range(2000):
+            total += len(cleaner.feed(paragraph))
+            assert sum(map(len, cleaner._tails.values())) < len(paragraph)
+        total += len(cleaner.flush())
+
+        assert total == len(TextCleaner.destructive_clean(paragraph * 2000))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,223 @@
+"""
+data4tr - Scrape Coordinator Test
+Dağıtık iş kuyruğu, kiralama ve paylaşılan rate limit testleri
+"""
+
+import json
+import time
+
+import pytest
+import requests
+from data4tr.config import get_config
+from data4tr.scraper.base import BaseScraper, ScraperRegistry
+from data4tr.scraper.coordinator import ScrapeCoordinator, SharedRateLimiter, WorkQueue
+from data4tr.scraper.mockserver import MockWikipediaServer
+from data4tr.scraper.sources.wikipedia import WikipediaScraper
+
+
+class _InstantSession:
+    """Her isteği hemen 200 ile yanıtlayan session"""
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+class _CountingScraper(BaseScraper):
+    """Her kayıt için kontrollü bir istek yapan test scraper'ı"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.session = _InstantSession()
+        self.controller = self.create_request_controller()
+
+    def validate_config(self):
+        return True
+
+    def iter_scrape(self, limit=100):
+        for i in range(limit):
+            self.controller.request(self.session, "GET", "http://test")
+            yield {"id": str(i), "source": "sahte", "text": f"metin {i}"}
+
+
+@pytest.fixture
+def source():
+    """Konfigürasyona ve registry'ye geçici test kaynağı ekle"""
+    config = get_config()
+    ScraperRegistry.register("test_queue", _CountingScraper)
+    config.set(
+        "sources.test_queue",
+        {
+            "enabled": True,
+            "name": "test_queue",
+            "rate_limit": {"requests_per_second": 20, "burst": 1},
+        },
+    )
+    yield "test_queue"
+    config.get("sources").pop("test_queue", None)
+    ScraperRegistry._registry.pop("test_queue", None)
+
+
+class TestWorkQueue:
+    """WorkQueue sınıfı için testler"""
+
+    def test_expired_lease_is_reclaimed(self, tmp_path):
+        """Heartbeat gelmeyen birim başka worker'a verilmeli, eski worker tamamlayamamalı"""
+        queue = WorkQueue(tmp_path / "queue.sqlite")
+        unit_id = queue.add("kaynak", 10)
+
+        first = queue.lease("a", lease_seconds=0.05)
+        assert first["id"] == unit_id
+        assert queue.lease("b", lease_seconds=0.05) is None
+
+        time.sleep(0.1)
+        second = queue.lease("b", lease_seconds=60)
+        assert second["id"] == unit_id
+        assert second["attempt"] == 2
+
+        assert not queue.heartbeat(unit_id, "a")
+        assert not queue.complete(unit_id, "a", "a.jsonl", 10)
+        assert queue.complete(unit_id, "b", "b.jsonl", 10)
+        assert queue.status()["done"] == 1
+
+    def test_release_until_failed(self, tmp_path):
+        """Deneme hakkı biten birim başarısız sayılmalı"""
+        queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+        unit_id = queue.add("kaynak", 10)
+
+        for _ in range(2):
+            assert queue.lease("a")["id"] == unit_id
+            queue.release(unit_id, "a", "hata")
+
+        assert queue.lease("a") is None
+        assert queue.status()["failed"] == 1
+
+
+class TestSharedRateLimiter:
+    """SharedRateLimiter sınıfı için testler"""
+
+    def test_rate_shared_between_instances(self, tmp_path):
+        """Aynı anahtarı kullanan limiter'lar tek bir bütçeyi paylaşmalı"""
+        path = tmp_path / "queue.sqlite"
+        first = SharedRateLimiter(path, "kaynak", rate=20, capacity=1)
+        second = SharedRateLimiter(path, "kaynak", rate=1000)
+
+        assert second.rate == 20
+        start = time.monotonic()
+        for _ in range(3):
+            first.acquire()
+            second.acquire()
+        assert time.monotonic() - start >= 0.2
+
+    def test_tokens_reserved_in_batches(self, tmp_path):
+        """Tokenlar gruplar halinde ayrılmalı, toplam hız yine de aşılmamalı"""
+        path = tmp_path / "queue.sqlite"
+        limiter = SharedRateLimiter(path, "kaynak", rate=100, capacity=1)
+        transactions = []
+        limiter._conn.set_trace_callback(
+            lambda sql: transactions.append(sql) if sql.startswith("BEGIN") else None
+        )
+
+        start = time.monotonic()
+        for _ in range(30):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.25
+        assert len(transactions) == 3
+        assert limiter._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    def test_set_rate_is_visible(self, tmp_path):
+        """Hız değişikliği diğer instance'lara yansımalı"""
+        path = tmp_path / "queue.sqlite"
+        first = SharedRateLimiter(path, "kaynak", rate=5)
+        second = SharedRateLimiter(path, "kaynak", rate=5)
+
+        first.set_rate(0)
+        start = time.monotonic()
+        for _ in range(20):
+            second.acquire()
+        assert second.rate == 0
+        assert time.monotonic() - start < 0.5
+
+
+class TestScrapeCoordinator:
+    """ScrapeCoordinator sınıfı için testler"""
+
+    def test_workers_share_rate_limit(self, tmp_path, source):
+        """İki worker process birlikte kaynağın hız sınırını aşmamalı"""
+        coordinator = ScrapeCoordinator(tmp_path, source)
+        assert coordinator.plan(total=24, unit_size=6) == 4
+
+        start = time.monotonic()
+        produced = coordinator.run_local(processes=2, lease_seconds=5)
+        elapsed = time.monotonic() - start
+
+        assert produced == 24
+        assert coordinator.status()["done"] == 4
+        # 20 istek/sn ve burst 1 ile 24 istek en az ~1.15 saniye sürer
+        assert elapsed >= 1.1
+
+    def test_plan_ranges(self, tmp_path, source):
+        """Her başlık aralığı enumerate modunda ayrı bir birim olmalı"""
+        coordinator = ScrapeCoordinator(tmp_path, source)
+        assert coordinator.plan_ranges([(None, "M"), ("M", None)]) == 2
+
+        unit = coordinator.queue.lease("a")
+        assert unit["size"] == 0
+        assert unit["params"]["api"] == {
+            "fetch_mode": "enumerate",
+            "title_from": None,
+            "title_to": "M",
+        }
+
+    def test_range_units_ignore_local_checkpoint(self, tmp_path):
+        """Yarım kalmış veya "bitti" işaretli yerel aralık checkpoint'i birimi kısaltmamalı"""
+        config = get_config()
+        with MockWikipediaServer(pages=120, seed=3) as mock:
+            source_config = {
+                "enabled": True,
+                "name": "test_enum",
+                "api": {
+                    "base_url": mock.url,
+                    "action_api": f"{mock.url}/w/api.php",
+                    "fetch_mode": "enumerate",
+                    "batch_size": 20,
+                    "timeout": 5,
+                },
+                "rate_limit": {"requests_per_second": 0},
+                "enumeration": {"checkpoint_dir": str(tmp_path / "ranges")},
+            }
+            ScraperRegistry.register("test_enum", WikipediaScraper)
+            config.set("sources.test_enum", source_config)
+            try:
+                # Önceki bir denemenin (çıktısı kaydedilmemiş) yerel ilerlemesi
+                assert len(WikipediaScraper(source_config).scrape(limit=45)) == 45
+
+                coordinator = ScrapeCoordinator(tmp_path / "kuyruk", "test_enum")
+                coordinator.plan_ranges([(None, None)])
+                assert coordinator.run_worker(worker_id="a") == 120
+
+                # Aynı aralık yeniden planlanınca tekrar çekilmeli
+                WikipediaScraper(source_config).scrape(limit=0)
+                coordinator.plan_ranges([(None, None)])
+                assert coordinator.run_worker(worker_id="b") == 120
+            finally:
+                config.get("sources").pop("test_enum", None)
+                ScraperRegistry._registry.pop("test_enum", None)
+
+    def test_merge_deduplicates(self, tmp_path, source):
+        """Birleştirme aynı ID'li kayıtları bir kez yazmalı"""
+        get_config().set("sources.test_queue.rate_limit.requests_per_second", 0)
+        coordinator = ScrapeCoordinator(tmp_path, source)
+        coordinator.plan(total=15, unit_size=5)
+
+        assert coordinator.run_worker(worker_id="tek") == 15
+        output = tmp_path / "merged.jsonl"
+        assert coordinator.merge(output) == 5
+
+        with open(output, "r", encoding="utf-8") as f:
+            assert [json.loads(line)["id"] for line in f] == ["0", "1", "2", "3", "4"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
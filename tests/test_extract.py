@@ -0,0 +1,83 @@
+"""
+data4tr - HTML Extractor Test
+lxml tabanlı HTML -> metin çıkarıcı için testler
+"""
+
+import io
+
+import pytest
+from data4tr.scraper.cleaner import TextCleaner
+from data4tr.scraper.extract import HTMLExtractor
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>Ankara</title>
+<style>p { color: red; }</style>
+<script>var html = "<p>Betik içindeki bu metin asla çıktıya girmemelidir.</p>";</script>
+</head><body>
+<nav><ul><li><a href="/">Ana sayfa</a></li><li><a href="/hakkinda">Hakkında</a></li></ul></nav>
+<div id="content" class="has-sidebar"><article>
+<h1>Ankara</h1>
+<p>Ankara, Türkiye'nin başkenti ve İç Anadolu Bölgesi'nin en kalabalık şehridir.</p>
+<p>Şehir, <a href="/cumhuriyet">Cumhuriyet</a> döneminde hızla büyümüş ve <b>planlı</b> bir kent olmuştur.
+<p>Önceki paragraf kapatılmadığı halde bu paragraf ayrı olarak çıkarılmalıdır.
+<h2>Dış bağlantılar</h2>
+<ul><li><a href="/a">Belediye resmi sitesi</a></li><li><a href="/b">Valilik</a></li></ul>
+</article>
+<div class="sidebar-left"><p>Yan menüdeki bu cümle yeterince uzun olsa da atlanmalıdır.</p></div>
+</div>
+<footer><p>Telif hakkı 2024, tüm hakları saklıdır ve bu satır da atlanmalıdır.</p></footer>
+</body></html>"""
+
+EXPECTED = [
+    "Ankara",
+    "Ankara, Türkiye'nin başkenti ve İç Anadolu Bölgesi'nin en kalabalık şehridir.",
+    "Şehir, Cumhuriyet döneminde hızla büyümüş ve planlı bir kent olmuştur.",
+    "Önceki paragraf kapatılmadığı halde bu paragraf ayrı olarak çıkarılmalıdır.",
+]
+
+
+class TestHTMLExtractor:
+    """HTMLExtractor sınıfı için testler"""
+
+    def test_extracts_content_paragraphs(self):
+        """script/style/nav/footer ve bağlantı listeleri atlanmalı, paragraflar korunmalı"""
+        assert list(HTMLExtractor().iter_paragraphs(PAGE)) == EXPECTED
+
+    def test_incremental_input(self):
+        """Küçük parçalarla, dosyadan ve byte olarak beslenen sayfa aynı sonucu vermeli"""
+        chunks = [PAGE[i : i + 7] for i in range(0, len(PAGE), 7)]
+
+        assert list(HTMLExtractor().iter_paragraphs(chunks)) == EXPECTED
+        assert list(HTMLExtractor(chunk_size=1024).iter_paragraphs(PAGE.encode())) == EXPECTED
+        assert list(HTMLExtractor().iter_paragraphs(io.BytesIO(PAGE.encode()))) == EXPECTED
+
+    def test_paragraphs_stream_before_end(self):
+        """Paragraflar sayfanın tamamı okunmadan üretilmeye başlamalı"""
+        paragraph = "<p>Bu paragraf akış halinde, sayfa bitmeden önce üretilmelidir.</p>"
+
+        def chunks():
+            yield "<html><body>"
+            for _ in range(100):
+                yield paragraph
+            raise AssertionError("Sayfanın sonu okunmamalıydı")
+
+        stream = HTMLExtractor().iter_paragraphs(chunks())
+        assert next(stream).startswith("Bu paragraf")
+        stream.close()
+
+    def test_link_density(self):
+        """Bağlantı yoğunluğu yüksek bloklar atlanmalı"""
+        extractor = HTMLExtractor()
+        text = "Kategoriler listesi burada yer alan çok uzun bağlantı metni"
+
+        assert extractor.score(text, link_chars=len(text)) == 0.0
+        assert extractor.score(text + ".", link_chars=0) >= extractor.min_score
+
+    def test_cleaner_extract_html(self):
+        """TextCleaner.extract_html paragrafları boş satırla birleştirmeli"""
+        assert TextCleaner.extract_html(PAGE) == "\n\n".join(EXPECTED)
+        assert TextCleaner.extract_html("") == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
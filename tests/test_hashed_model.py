@@ -0,0 +1,135 @@
+"""
+data4tr - Hashed Naive Bayes Test
+Hash'lenmiş özellikli Naive Bayes sınıflandırıcı için testler
+"""
+
+import json
+import random
+import time
+
+import numpy as np
+import pytest
+from data4tr.processor.classify import KEYWORDS, TextClassifier, classify_batch
+from data4tr.processor.hashed_model import HashedNBModel
+
+_FILLER = "ve bir bu da ile için olarak çok daha sonra önce büyük küçük yeni eski".split()
+
+
+def _document(rng: random.Random, category: str) -> str:
+    """Kategorinin anahtar kelimelerini içeren yapay metin"""
+    words = rng.choices(KEYWORDS[category], k=4) + rng.choices(_FILLER, k=rng.randint(15, 40))
+    rng.shuffle(words)
+    return " ".join(words).capitalize() + "."
+
+
+def _labeled(count: int, seed: int):
+    """(metinler, etiketler) yapay etiketli veri"""
+    rng = random.Random(seed)
+    categories = rng.choices(sorted(KEYWORDS), k=count)
+    return [_document(rng, category) for category in categories], categories
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    """Etiketli JSONL dosyasından eğitilip kaydedilmiş model"""
+    directory = tmp_path_factory.mktemp("model")
+    texts, labels = _labeled(3000, seed=24)
+    data = directory / "etiketli.jsonl"
+    with open(data, "w", encoding="utf-8") as f:
+        for text, label in zip(texts, labels):
+            f.write(json.dumps({"text": text, "category": label}, ensure_ascii=False) + "\n")
+        f.write(json.dumps({"text": "etiketsiz kayıt"}) + "\n")
+
+    model = HashedNBModel.train_jsonl(data, n_features=2**16)
+    return model.save(directory / "hashed_nb.npz")
+
+
+class TestHashedNBModel:
+    """HashedNBModel sınıfı için testler"""
+
+    def test_train_and_predict(self, model_path):
+        """Eğitilen model ayrı test verisini doğru sınıflandırmalı"""
+        model = HashedNBModel.load(model_path)
+        texts, labels = _labeled(500, seed=7)
+        results = model.predict(texts)
+
+        assert model.labels == sorted(KEYWORDS)
+        accuracy = np.mean([result["category"] == label for result, label in zip(results, labels)])
+        assert accuracy > 0.95
+        for result in results[:10]:
+            assert set(result) == {"category", "confidence", "all_scores"}
+            assert result["confidence"] == max(result["all_scores"].values())
+            assert sum(result["all_scores"].values()) == pytest.approx(1.0)
+
+    def test_save_load_roundtrip(self, model_path, tmp_path):
+        """Kaydedilip yüklenen model aynı tahminleri vermeli, dosya küçük olmalı"""
+        model = HashedNBModel.load(model_path)
+        copy = HashedNBModel.load(model.save(tmp_path / "kopya.npz"))
+        texts, _ = _labeled(100, seed=3)
+
+        assert [r["category"] for r in copy.predict(texts)] == [
+            r["category"] for r in model.predict(texts)
+        ]
+        assert model_path.stat().st_size < 1_000_000
+
+    def test_batching_and_folding(self, model_path):
+        """Grup boyutu, katlanmış girdi ve özel karakterler sonucu değiştirmemeli"""
+        model = HashedNBModel.load(model_path)
+        texts = ["FUTBOL MAÇI", "", "İSTANBUL\x00ŞEHİR", "Roman ve şiir"] * 5
+        expected = model.decision_function(texts)
+
+        small = [r["all_scores"] for r in model.predict(texts, batch_size=3)]
+        folded = model.decision_function(
+            ["futbol maçı", "", "istanbul\x00şehir", "roman ve şiir"] * 5, folded=True
+        )
+        assert np.allclose(folded, expected)
+        assert [max(s, key=s.get) for s in small] == [model.labels[i] for i in expected.argmax(1)]
+        assert model.predict(["Futbol maçında takım oyuncu"])[0]["category"] == "spor"
+
+    def test_batch_stats(self, model_path):
+        """Toplu çıkarım tüm belgeleri sınıflandırmalı ve sayaçları güncellemeli"""
+        model = HashedNBModel.load(model_path)
+        texts, _ = _labeled(5000, seed=11)
+        model.predict(texts[:100])
+        results = model.predict(texts)
+
+        assert len(results) == len(texts)
+        assert model.stats["documents"] == 5100
+
+    @pytest.mark.slow
+    def test_batch_throughput(self, model_path):
+        """Toplu çıkarım saniyede binlerce belgeyi sınıflandırmalı (makineye bağlı ölçüm)"""
+        model = HashedNBModel.load(model_path)
+        texts, _ = _labeled(5000, seed=11)
+        model.predict(texts[:100])
+
+        start = time.perf_counter()
+        model.predict(texts)
+        elapsed = time.perf_counter() - start
+
+        assert len(texts) / elapsed > 2000
+
+
+class TestClassifierIntegration:
+    """TextClassifier hashed-nb model türü için testler"""
+
+    def test_classifier_uses_model(self, model_path):
+        """hashed-nb modeli classify, classify_many ve classify_batch ile kullanılmalı"""
+        classifier = TextClassifier(model="hashed-nb", model_path=str(model_path))
+        texts = ["Futbol maçında takım oyuncu değiştirdi.", "Hastanede doktor ilaç verdi."]
+
+        assert classifier.hashed_model is not None
+        assert classifier.classify(texts[0]) == "spor"
+        results = classifier.classify_many(texts)
+        assert [r["category"] for r in results] == ["spor", "sağlık"]
+        assert classify_batch(texts, model="hashed-nb", model_path=str(model_path)) == results
+
+    def test_missing_model_falls_back(self, tmp_path):
+        """Model dosyası yoksa anahtar kelime sınıflandırmasına düşülmeli"""
+        classifier = TextClassifier(model="hashed-nb", model_path=str(tmp_path / "yok.npz"))
+        assert classifier.hashed_model is None
+        assert classifier.classify("Futbol maçında takım oyuncu") == "spor"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+"""
+data4tr - Correction Lexicon Test
+Bellek eşlemeli düzeltme sözlüğü için testler
+"""
+
+import multiprocessing
+import pickle
+import random
+import string
+
+import pytest
+from data4tr.processor.lexicon import Lexicon, LexiconCorrector, read_tsv
+
+ENTRIES = [
+    ("Istanbul", "İstanbul"),
+    ("cok", "çok"),
+    ("guzel", "güzel"),
+    ("ogrenci", "öğrenci"),
+    ("ıntemet", "internet"),
+]
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    """Küçük sözlük"""
+    with Lexicon.build(ENTRIES, tmp_path / "lexicon.bin") as lexicon:
+        yield lexicon
+
+
+def _lookup_in_worker(args):
+    """Worker process içinde sözlük araması"""
+    lexicon, word = args
+    return lexicon.get(word)
+
+
+class TestLexicon:
+    """Lexicon sınıfı için testler"""
+
+    def test_lookup(self, lexicon):
+        """Birebir arama, eksik kelime ve uzunluk"""
+        assert lexicon.get("cok") == "çok"
+        assert lexicon.get("ıntemet") == "internet"
+        assert lexicon.get("çok") is None
+        assert lexicon.get("yok", "yok") == "yok"
+        assert "guzel" in lexicon
+        assert len(lexicon) == len(ENTRIES)
+
+    def test_large_lexicon(self, tmp_path):
+        """Yüz binlerce kayıtlı sözlükte her kayıt bulunmalı"""
+        rng = random.Random(21)
+        table = {}
+        while len(table) < 200_000:
+            word = "".join(rng.choices(string.ascii_lowercase + "çğıöşü", k=rng.randint(2, 14)))
+            table[word] = word.upper()
+        lexicon = Lexicon.build(table.items(), tmp_path / "large.bin")
+
+        assert len(lexicon) == len(table)
+        for word in rng.sample(sorted(table), 5000):
+            assert lexicon.get(word) == table[word]
+        assert lexicon.get("bulunmayan-kelime") is None
+        lexicon.close()
+
+    def test_read_tsv_and_invalid_file(self, tmp_path):
+        """TSV okuma ve geçersiz dosya hatası"""
+        tsv = tmp_path / "duzeltmeler.tsv"
+        tsv.write_text("# yorum\ncok\tçok\n\nhatalı satır\nguzel\tgüzel\n", encoding="utf-8")
+        assert list(read_tsv(tsv)) == [("cok", "çok"), ("guzel", "güzel")]
+
+        invalid = tmp_path / "bozuk.bin"
+        invalid.write_bytes(b"\x00" * 64)
+        with pytest.raises(ValueError):
+            Lexicon(invalid)
+
+    def test_shared_with_worker_processes(self, lexicon):
+        """Pickle yalnızca yolu taşımalı, worker'lar dosyayı kendisi eşlemeli"""
+        assert len(pickle.dumps(lexicon)) < 200
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            results = pool.map(_lookup_in_worker, [(lexicon, "cok"), (lexicon, "guzel")])
+        assert results == ["çok", "güzel"]
+
+
+class TestLexiconCorrector:
+    """LexiconCorrector sınıfı için testler"""
+
+    def test_correct_preserves_case(self, lexicon):
+        """Düzeltmeler kelimenin büyük/küçük harf biçimine uyarlanmalı"""
+        corrector = LexiconCorrector(lexicon)
+        text = "Istanbul cok guzel, COK GUZEL! Cok ogrenci var. çok"
+
+        assert corrector.correct(text) == "İstanbul çok güzel, ÇOK GÜZEL! Çok öğrenci var. çok"
+        assert corrector.stats["tokens"] == 9
+        assert corrector.stats["corrections"] == 7
+
+    def test_uppercase_and_ascii_keys(self, tmp_path):
+        """Tamamı büyük harfli kelime başlık ve ASCII küçük harfli anahtarlarla eşleşmeli"""
+        entries = [("Istanbul", "İstanbul"), ("izmir", "İzmir"), ("ıgdır", "Iğdır")]
+        with Lexicon.build(entries, tmp_path / "lexicon.bin") as lexicon:
+            corrector = LexiconCorrector(lexicon)
+            text = "ISTANBUL Izmir IZMIR IGDIR Istanbul"
+
+            assert corrector.correct(text) == "İSTANBUL İzmir İZMİR IĞDIR İstanbul"
+            assert corrector.lookup("istanbul") == "istanbul"
+
+    def test_batch_and_cache(self, lexicon):
+        """Önbellekli ve önbelleksiz düzeltme aynı sonucu vermeli"""
+        texts = ["Istanbul cok guzel"] * 20 + ["", "ıntemet bağlantısı"]
+        cached = LexiconCorrector(lexicon, cache_size=2)
+        uncached = LexiconCorrector(lexicon, cache_size=0)
+
+        assert cached.correct_batch(texts) == uncached.correct_batch(texts)
+        assert cached.correct_batch(texts)[-1] == "internet bağlantısı"
+        assert len(cached._cache) <= 2
+        assert cached.stats["texts"] == 2 * len(texts)
+
+    def test_from_config(self, lexicon, tmp_path):
+        """Yol verilmezse veya dosya yoksa düzeltici oluşturulmamalı"""
+        assert LexiconCorrector.from_config({"path": None}) is None
+        assert LexiconCorrector.from_config({"path": str(tmp_path / "yok.bin")}) is None
+        corrector = LexiconCorrector.from_config({"path": str(lexicon.path)})
+        assert corrector.correct("cok") == "çok"
+        corrector.lexicon.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
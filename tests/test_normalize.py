@@ -0,0 +1,58 @@
+"""
+data4tr - Text Normalization Test
+Derlenmiş normalizasyon motoru için testler
+"""
+
+import random
+
+import pytest
+from data4tr.processor.normalize import CompiledNormalizer, TextNormalizer, normalize_batch
+
+_FRAGMENTS = [
+    "Çalışkan", "öğrenci", "ımza", "IMZA", "İmza", "ıntemet", "Itırbul", "Î", "î", "I",
+    "kitap", "1923", " ", "  ", "   ", "\n", "\n\n\n", "\n ", " \n", "\t", "\xa0", ".",
+    ",", ";", ":", "!", "?", " ,", " .", "(a", "b) ", '"', "'", "😀",
+]  # fmt: skip
+
+_BENCHMARK = [
+    "Bu   metinde , çok  boşluk var ... \"Ingiliz\" ve 'tek' tırnaklar, ımza ıntemet Itırbul !"
+    * 20,
+    "Türkçe paragraf, noktalama işaretleri ile. Bir cümle daha; bir tane daha: son!\n\n\n\n" * 10,
+] * 500
+
+
+class TestCompiledNormalizer:
+    """CompiledNormalizer sınıfı için testler"""
+
+    def test_matches_stepwise_normalize(self):
+        """Derlenmiş motor adım adım normalizasyonla birebir aynı çıktıyı vermeli"""
+        normalizer = CompiledNormalizer()
+        rng = random.Random(20)
+        texts = ["", " ", "a .  b", "a.  ,b", "son.  ", "ıMZA İMZA"]
+        for _ in range(3000):
+            texts.append("".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 40))))
+
+        for text in texts:
+            assert normalizer.normalize(text) == TextNormalizer.stepwise_normalize(text), repr(text)
+
+    def test_normalize_uses_engine(self):
+        """TextNormalizer.normalize motorun sonucunu döndürmeli"""
+        text = 'Bu   "ımza" ,Itırbul\'da  alındı !'
+        assert TextNormalizer.normalize(text) == CompiledNormalizer().normalize(text)
+        assert TextNormalizer.normalize(text) == "Bu ”imza”, İstanbul’da alındı!"
+
+    def test_batch_matches_stepwise(self):
+        """Toplu mod aynı çıktıyı üretmeli ve verim istatistiklerini raporlamalı"""
+        normalizer = CompiledNormalizer()
+        expected = [TextNormalizer.stepwise_normalize(text) for text in _BENCHMARK]
+
+        assert normalizer.normalize_batch(_BENCHMARK) == expected
+        assert normalize_batch(_BENCHMARK) == expected
+
+        report = normalizer.report()
+        assert report["texts"] == len(_BENCHMARK)
+        assert report["chars_per_second"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
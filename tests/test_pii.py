@@ -0,0 +1,156 @@
+"""
+data4tr - PII Scrubber Test
+Tek geçişli kişisel veri temizleyici için testler
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from data4tr.scraper.cleaner import TextCleaner
+from data4tr.scraper.pii import PIIScrubber, is_valid_iban, is_valid_tckn
+
+VALID_TCKN = "10000000146"
+VALID_IBAN = "TR33 0006 1005 1978 6457 8413 26"
+
+RAW_TEXT = "Bilgi için ali@ornek.com adresine yazın veya 0532.123.45.67 numarasını arayın."
+
+
+@pytest.fixture
+def cli(monkeypatch):
+    """cli.py modülü (data4tr dizini sys.path üzerinde olacak şekilde)"""
+    root = Path(__file__).resolve().parent.parent
+    monkeypatch.syspath_prepend(str(root / "data4tr"))
+    monkeypatch.syspath_prepend(str(root))
+    import cli
+
+    return cli
+
+
+class TestValidators:
+    """Sağlama toplamı testleri"""
+
+    def test_tckn(self):
+        """TC kimlik no sağlaması"""
+        assert is_valid_tckn(VALID_TCKN)
+        assert not is_valid_tckn("12345678901")
+        assert not is_valid_tckn("01234567890")
+
+    def test_iban(self):
+        """IBAN mod-97 sağlaması"""
+        assert is_valid_iban(VALID_IBAN)
+        assert is_valid_iban(VALID_IBAN.replace(" ", ""))
+        assert not is_valid_iban("TR330006100519786457841327")
+
+
+class TestPIIScrubber:
+    """PIIScrubber testleri"""
+
+    def test_replace_all_entities(self):
+        """Tüm varlık türleri tek geçişte yer tutucuyla değiştirilmeli"""
+        text = (
+            f"Ali'ye ali.veli@ornek.com.tr adresinden, 0532 123 45 67 veya "
+            f"+90 (212) 555-12-34 numarasından ulaşılabilir. TCKN {VALID_TCKN}, "
+            f"IBAN {VALID_IBAN}."
+        )
+        scrubbed, counts = PIIScrubber().scrub(text)
+
+        assert scrubbed == (
+            "Ali'ye [EPOSTA] adresinden, [TELEFON] veya [TELEFON] numarasından "
+            "ulaşılabilir. TCKN [TCKN], IBAN [IBAN]."
+        )
+        assert counts == {"email": 1, "phone": 2, "tckn": 1, "iban": 1}
+
+    def test_invalid_candidates_kept(self):
+        """Sağlaması tutmayan adaylar ve sıradan sayılar değişmemeli"""
+        text = "Numara 12345678901, hesap TR330006100519786457841327, nüfus 85372377, yıl 1453"
+        scrubbed, counts = PIIScrubber().scrub(text)
+
+        assert scrubbed == text
+        assert counts == {}
+
+    def test_mask_policy(self):
+        """mask politikası biçimi korumalı"""
+        scrubber = PIIScrubber(policy="mask")
+        scrubbed, _ = scrubber.scrub("ali@ornek.com ve 0532 123 45 67")
+        assert scrubbed == "***@*****.*** ve **** *** ** **"
+
+    def test_policy_per_entity_and_selection(self):
+        """Varlık bazında politika ve varlık seçimi"""
+        scrubber = PIIScrubber(
+            policy={"email": "remove", "phone": "mask"}, entities=["email", "phone"]
+        )
+        scrubbed, counts = scrubber.scrub(f"a@b.com 05321234567 {VALID_TCKN}")
+
+        assert scrubbed == f" *********** {VALID_TCKN}"
+        assert counts == {"email": 1, "phone": 1}
+
+        with pytest.raises(ValueError):
+            PIIScrubber(policy="hash")
+        with pytest.raises(ValueError):
+            PIIScrubber(entities=["adres"])
+
+    def test_scrub_record_counts(self):
+        """Kayıt başına sayılar kayda, toplamlar stats'a yazılmalı"""
+        scrubber = PIIScrubber()
+        first = scrubber.scrub_record({"title": "a@b.com", "text": "x@y.org 0212 555 12 34"})
+        second = scrubber.scrub_record({"text": "Kişisel veri yok.", "url": "https://ornek.com"})
+
+        assert first["title"] == "[EPOSTA]"
+        assert first["pii"] == {"email": 2, "phone": 1}
+        assert second["pii"] == {}
+        assert second["url"] == "https://ornek.com"
+        assert scrubber.stats == {"records": 2, "email": 2, "iban": 0, "tckn": 0, "phone": 1}
+
+    def test_text_cleaner_entry_point(self):
+        """TextCleaner.scrub_pii kısayolu"""
+        assert TextCleaner.scrub_pii("Mail: a@b.com") == "Mail: [EPOSTA]"
+
+
+class TestCommandFlow:
+    """CLI akışlarında kişisel verilerin metin değiştirilmeden önce temizlenmesi"""
+
+    def test_finalize_records_scrubs_before_normalization(self, cli):
+        """Noktalama düzeltmesi e-posta ve noktalı telefonu bozmadan önce temizlenmeli"""
+        records = [{"text": RAW_TEXT}, {"id": "silinen", "deleted": True, "text": ""}]
+        cli.finalize_records(records, cli.get_config())
+
+        text = records[0]["text"]
+        assert "[EPOSTA]" in text and "[TELEFON]" in text
+        assert "ornek" not in text and "0532" not in text
+        assert records[0]["pii"] == {"email": 1, "phone": 1}
+
+    def test_scrape_and_process_commands(self, cli, tmp_path, monkeypatch):
+        """scrape ham metni destructive_clean'den önce, process normalizasyondan önce temizlemeli"""
+
+        class _Scraper:
+            def stream_source(self, source, limit):
+                yield {"id": "1", "title": "Başlık", "text": "Tel: +90 532 123 45 67. " + RAW_TEXT}
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli, "Scraper", _Scraper)
+        cli.scrape_command(argparse.Namespace(source="sahte", limit=1))
+        with open(tmp_path / "data" / "raw" / "sahte_1.json", encoding="utf-8") as f:
+            raw = json.load(f)
+        assert raw[0]["text"].count("[TELEFON]") == 2
+        assert raw[0]["pii"] == {"email": 1, "phone": 2}
+
+        # process, scrape'ten geçmemiş ham kayıtları da temizlemeli
+        raw.append({"id": "2", "title": "Diğer", "text": RAW_TEXT.replace("ali", "veli")})
+        with open(tmp_path / "data" / "raw" / "sahte_1.json", "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False)
+        cli.process_command(argparse.Namespace(model="rule-based", endpoint=None))
+
+        with open(tmp_path / "data" / "cleaned" / "processed_data.json", encoding="utf-8") as f:
+            processed = {record["id"]: record for record in json.load(f)}
+        for record in processed.values():
+            assert "@" not in record["text"] and "0532" not in record["text"]
+            assert "[EPOSTA]" in record["text"]
+        assert processed["1"]["pii"] == {"email": 1, "phone": 2}
+        assert processed["2"]["pii"] == {"email": 1, "phone": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+"""
+data4tr - Processing Pipeline Test
+Konfigürasyondan derlenen işleme hattı için testler
+"""
+
+import random
+
+import pytest
+from data4tr.processor.normalize import TextNormalizer
+from data4tr.processor.pipeline import STEPS, Pipeline, build_pipeline
+from data4tr.scraper.cleaner import TextCleaner
+
+# Adım adı -> aynı sonucu vermesi gereken mevcut metod
+REFERENCE = {
+    "remove_urls": TextCleaner.remove_urls,
+    "clean_html": TextCleaner.clean_html,
+    "remove_special_chars": TextCleaner.remove_special_chars,
+    "clean_whitespace": TextCleaner.clean_whitespace,
+    "destructive_clean": TextCleaner.stepwise_clean,
+    "normalize_turkish_chars": TextNormalizer.normalize_turkish_chars,
+    "fix_common_mistakes": TextNormalizer.fix_common_mistakes,
+    "fix_quotes": TextNormalizer.fix_turkish_quotes,
+    "fix_punctuation": TextNormalizer.fix_punctuation_spacing,
+    "fix_whitespace": TextNormalizer.normalize_whitespace,
+    "normalize": TextNormalizer.stepwise_normalize,
+}
+
+_FRAGMENTS = [
+    "<p>", "</b>", "&amp;", "&lt;", "http://ornek.com/a?b=1", "https://x.org", "Çalışkan",
+    "öğrenci", "ımza", "IMZA", "ıntemet", "Itırbul", "Î", "î", "I", "kitap", "1923",
+    " ", "  ", "\n", "\n\n\n", "\t", "\xa0", ".", ",", "!", "?", " ,", " .", "(a", "b) ",
+    '"', "'", "@", "😀", "aaaa",
+]  # fmt: skip
+
+
+class TestPipeline:
+    """Pipeline sınıfı için testler"""
+
+    def test_steps_match_reference_methods(self):
+        """Rastgele adım dizileri mevcut metodların sıralı uygulanmasıyla aynı sonucu vermeli"""
+        assert set(REFERENCE) == set(STEPS)
+        rng = random.Random(18)
+        for _ in range(1000):
+            steps = rng.choices(list(REFERENCE), k=rng.randint(1, 5))
+            pipeline = Pipeline(steps)
+            for _ in range(5):
+                text = "".join(rng.choices(_FRAGMENTS, k=rng.randint(0, 30)))
+                expected = text
+                for step in steps:
+                    expected = REFERENCE[step](expected)
+                assert pipeline(text) == expected, (steps, text)
+
+    def test_adjacent_ops_are_fused(self):
+        """Ardışık işlemler birleştirilmeli"""
+        pipeline = Pipeline(["remove_special_chars", "clean_whitespace"])
+        assert [op.kind for op in pipeline.ops] == ["delete", "collapse"]
+
+        pipeline = Pipeline(["normalize_turkish_chars", "fix_quotes"])
+        assert [op.kind for op in pipeline.ops] == ["chars"]
+        assert pipeline.ops[0].label == "normalize_turkish_chars+fix_quotes"
+
+    def test_batch_timings(self):
+        """run_batch profile ile adım başına süreleri raporlamalı"""
+        pipeline = build_pipeline(["remove_urls", "fix_whitespace"])
+        texts = ["Bir  metin https://ornek.com burada.  "] * 50
+
+        results = pipeline.run_batch(texts, profile=True)
+        report = pipeline.report()
+
+        assert results == [pipeline(text) for text in texts]
+        assert [op["label"] for op in report["ops"]] == ["remove_urls", "fix_whitespace"]
+        assert all(op["seconds"] > 0 for op in report["ops"])
+        assert report["texts"] == 50
+        assert "fix_whitespace" in pipeline.format_report()
+
+    def test_config_steps(self):
+        """Varsayılan adımlar config.yaml'dan okunmalı, bilinmeyen adım hata vermeli"""
+        assert build_pipeline().steps[:2] == ["remove_urls", "clean_html"]
+        with pytest.raises(ValueError):
+            Pipeline(["olmayan_adim"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
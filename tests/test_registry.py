@@ -0,0 +1,83 @@
+"""
+data4tr - Scraper Registry Test
+Kaynak modüllerinin tembel yüklenmesi ve entry point keşfi için testler
+"""
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+from data4tr.scraper import base
+from data4tr.scraper.base import BaseScraper, ScraperRegistry
+
+
+class PluginScraper(BaseScraper):
+    """Entry point ile yüklenen test scraper'ı"""
+
+    def validate_config(self):
+        return True
+
+    def iter_scrape(self, limit=100):
+        yield from ({"id": str(i), "text": "eklenti"} for i in range(limit))
+
+
+@pytest.fixture
+def registry():
+    """Testin registry'de yaptığı değişiklikleri geri al"""
+    registry, lazy = dict(ScraperRegistry._registry), dict(ScraperRegistry._lazy)
+    yield ScraperRegistry
+    ScraperRegistry._registry, ScraperRegistry._lazy = registry, lazy
+    ScraperRegistry._entry_points = None
+
+
+class TestScraperRegistry:
+    """ScraperRegistry sınıfı için testler"""
+
+    def test_import_does_not_load_sources(self):
+        """data4tr import edildiğinde kaynak modülleri yüklenmemeli"""
+        code = (
+            "import sys, data4tr\n"
+            "from data4tr.scraper.base import ScraperRegistry\n"
+            "assert 'wikipedia' in ScraperRegistry.list_registered()\n"
+            "print(sorted(m for m in sys.modules if m.startswith('data4tr.scraper.sources.')))\n"
+            "ScraperRegistry.get('wikipedia')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('data4tr.scraper.sources.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        before, after = result.stdout.splitlines()
+
+        assert before == "[]"
+        assert after == "['data4tr.scraper.sources.wikipedia']"
+
+    def test_lazy_register_by_path(self, registry):
+        """'modül:Sınıf' ile kaydedilen kaynak ilk create çağrısında yüklenmeli"""
+        registry.register("eklenti", f"{__name__}:PluginScraper")
+        assert "eklenti" not in registry._registry
+
+        instance = registry.create("eklenti", {"name": "eklenti"})
+        assert isinstance(instance, PluginScraper)
+        assert registry._registry["eklenti"] is PluginScraper
+
+    def test_unknown_module(self, registry):
+        """Yüklenemeyen kaynak None döndürmeli"""
+        registry.register("bozuk", "olmayan_paket.modul:Sinif")
+        assert registry.get("bozuk") is None
+        assert registry.create("bozuk", {}) is None
+
+    def test_entry_point_discovery(self, registry, monkeypatch):
+        """data4tr.scrapers grubundaki entry point'ler kaynak olarak görünmeli"""
+        entry_point = EntryPoint(
+            name="eklenti_ep", value=f"{__name__}:PluginScraper", group="data4tr.scrapers"
+        )
+        monkeypatch.setattr(base, "entry_points", lambda group=None: [entry_point])
+        registry._entry_points = None
+
+        assert "eklenti_ep" in registry.list_registered()
+        assert registry.get("eklenti_ep") is PluginScraper
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
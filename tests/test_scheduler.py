@@ -0,0 +1,124 @@
+"""
+data4tr - Source Scheduler Test
+Kaynaklar arası verime göre bütçe dağıtımı için testler
+"""
+
+import itertools
+
+import pytest
+from data4tr.scraper.base import BaseScraper
+from data4tr.scraper.scheduler import SourceScheduler
+
+_SENTENCE = "Türkiye'nin başkenti Ankara, İç Anadolu Bölgesi'nde yer alan büyük bir şehirdir."
+
+
+class _FakeScraper(BaseScraper):
+    """Yeni veya tekrar eden metin üreten test scraper'ı"""
+
+    counter = itertools.count()
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = []
+
+    def validate_config(self):
+        return True
+
+    def iter_scrape(self, limit=100):
+        self.calls.append(limit)
+        if self.config.get("exhausted_after") is not None:
+            limit = max(0, min(limit, self.config["exhausted_after"] - sum(self.calls[:-1])))
+        for _ in range(limit):
+            if self.config.get("duplicates"):
+                yield {"id": "x", "text": _SENTENCE}
+            else:
+                yield {"id": str(next(self.counter)), "text": f"{_SENTENCE} {next(self.counter)}"}
+
+
+class _FakeSources:
+    """create_scraper / list_sources sağlayan Scraper yerine geçen nesne"""
+
+    def __init__(self, **configs):
+        self.configs = configs
+        self.instances = {}
+
+    def list_sources(self):
+        return list(self.configs)
+
+    def create_scraper(self, name, overrides=None):
+        self.instances[name] = _FakeScraper({"enabled": True, **self.configs[name]})
+        return self.instances[name]
+
+
+class TestSourceScheduler:
+    """SourceScheduler sınıfı için testler"""
+
+    def test_budget_shifts_to_high_yield_source(self):
+        """Tekrar eden metin üreten kaynağın payı düşmeli"""
+        sources = _FakeSources(yeni={}, tekrar={"duplicates": True})
+        # Tekrar kaynağı tükenmeden önceki pay dağılımı ölçülür
+        scheduler = SourceScheduler(sources, round_size=40, min_share=0.1, patience=10)
+
+        records = scheduler.run(100)
+        decisions = scheduler.report()["decisions"]
+        last = {d["source"]: d for d in decisions if d["round"] == decisions[-1]["round"]}
+
+        assert len(records) == 100
+        assert len({r["text"] for r in records}) == 100
+        assert decisions[0]["share"] == decisions[1]["share"] == 0.5
+        assert last["yeni"]["share"] > 0.8
+        assert last["tekrar"]["share"] == pytest.approx(0.1, abs=0.01)
+        assert scheduler.report()["sources"]["tekrar"]["unique"] == 1
+
+    def test_concurrency_capped_by_source_limit(self):
+        """Eşzamanlılık kaynağın max_concurrency değerini aşmamalı"""
+        sources = _FakeSources(a={"rate_limit": {"max_concurrency": 2}}, b={})
+        scheduler = SourceScheduler(sources, concurrency=16)
+
+        plan = scheduler.allocate(["a", "b"], 50)
+
+        assert plan["a"]["concurrency"] == 2
+        assert plan["b"]["concurrency"] == 1
+        assert plan["a"]["limit"] == plan["b"]["limit"] == 25
+
+    def test_exhausted_source_is_dropped(self):
+        """Kayıt döndürmeyen kaynak sonraki turlara alınmamalı"""
+        sources = _FakeSources(az={"exhausted_after": 5}, cok={})
+        scheduler = SourceScheduler(sources, round_size=20)
+
+        records = scheduler.run(60)
+        report = scheduler.report()
+
+        assert len(records) == 60
+        assert report["sources"]["az"]["unique"] == 5
+        assert report["sources"]["az"]["exhausted"]
+        assert "round" in scheduler.format_report()
+
+    def test_duplicate_only_source_terminates(self):
+        """Yalnızca tekrar döndüren kaynakla toplama sonsuza kadar sürmemeli"""
+        sources = _FakeSources(tekrar={"duplicates": True})
+        scheduler = SourceScheduler(sources, round_size=10, patience=3)
+
+        records = scheduler.run(5)
+
+        assert len(records) == 1
+        assert scheduler.report()["rounds"] == 4
+        assert scheduler.report()["sources"]["tekrar"]["exhausted"]
+
+    def test_single_empty_round_does_not_exhaust(self):
+        """Tek bir boş tur (geçici hata) kaynağı tüketmemeli"""
+        sources = _FakeSources(kesintili={})
+        scheduler = SourceScheduler(sources, round_size=10)
+        instance = scheduler._instance("kesintili")
+        original = instance.iter_scrape
+        calls = itertools.count()
+        instance.iter_scrape = lambda limit: iter([]) if next(calls) == 0 else original(limit)
+
+        records = scheduler.run(20)
+
+        assert len(records) == 20
+        assert not scheduler.report()["sources"]["kesintili"]["exhausted"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+data4tr - Scraper Test
+Çok kaynaklı eşzamanlı veri çekme için testler
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+from data4tr.config import get_config
+from data4tr.scraper.base import BaseScraper, ScraperRegistry
+from data4tr.scraper.scraper import Scraper
+
+
+class _SleepSession:
+    """Her isteği bekleterek yanıtlayan ve eşzamanlılığı ölçen session"""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def request(self, method, url, **kwargs):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+class _SlowScraper(BaseScraper):
+    """Her kayıt için bir istek yapan test scraper'ı"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.session = _SleepSession()
+        self.controller = self.create_request_controller()
+
+    def validate_config(self):
+        return True
+
+    def iter_scrape(self, limit=100):
+        for i in range(limit):
+            self.controller.request(self.session, "GET", "http://test")
+            yield {"id": f"{self.name}-{i}", "source": "sahte", "text": f"metin {i}"}
+
+
+@pytest.fixture
+def sources():
+    """Konfigürasyona ve registry'ye geçici test kaynakları ekle"""
+    config = get_config()
+    names = ["test_a", "test_b", "test_c"]
+    for name in names:
+        ScraperRegistry.register(name, _SlowScraper)
+        config.set(
+            f"sources.{name}",
+            {"enabled": True, "name": name, "rate_limit": {"requests_per_second": 0}},
+        )
+    _SleepSession.active = _SleepSession.peak = 0
+    yield names
+    for name in names:
+        config.get("sources").pop(name, None)
+        ScraperRegistry._registry.pop(name, None)
+
+
+class TestStreamSources:
+    """Scraper.stream_sources için testler"""
+
+    def test_sources_run_in_parallel(self, sources):
+        """Kaynaklar paralel çalışmalı ve kayıtlar kaynak adıyla etiketlenmeli"""
+        start = time.monotonic()
+        records = Scraper().scrape_sources(sources, limit=6)
+        elapsed = time.monotonic() - start
+
+        assert len(records) == 18
+        assert {r["source"] for r in records} == set(sources)
+        # Sıralı olarak 18 * 0.05 = 0.9 saniye sürerdi
+        assert elapsed < 0.7
+
+    def test_per_source_limits(self, sources):
+        """Kaynak başına limit sözlüğü uygulanmalı"""
+        records = Scraper().scrape_sources(sources, limit={"test_a": 2, "test_b": 1})
+        counts = {name: sum(r["source"] == name for r in records) for name in sources}
+
+        assert counts == {"test_a": 2, "test_b": 1, "test_c": 0}
+
+    def test_global_concurrency_cap(self, sources):
+        """Ortak sınır tüm kaynaklardaki eşzamanlı istekleri kısıtlamalı"""
+        Scraper().scrape_sources(sources, limit=4, global_concurrency=2)
+        assert _SleepSession.peak <= 2
+
+    def test_early_stop(self, sources):
+        """Tüketici erken durduğunda tüm thread'ler sonlanmalı"""
+        stream = Scraper().stream_sources(sources, limit=1000)
+        first = [next(stream) for _ in range(3)]
+        stream.close()
+
+        assert len(first) == 3
+        assert _SleepSession.active == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
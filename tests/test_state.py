@@ -0,0 +1,104 @@
+"""
+data4tr - Crawl State Test
+Görülen başlık indeksi ve kaldığı yerden devam için testler
+"""
+
+import itertools
+
+import pytest
+from data4tr.scraper.base import BaseScraper
+from data4tr.scraper.state import BloomFilter
+
+
+class _ListScraper(BaseScraper):
+    """Sabit bir başlık listesini sırayla 'çeken' test scraper'ı"""
+
+    def __init__(self, config, titles):
+        super().__init__(config)
+        self.titles = iter(titles)
+        self.fetched = 0
+
+    def validate_config(self):
+        return True
+
+    def _fetch(self, limit):
+        for title in itertools.islice(self.titles, limit):
+            self.fetched += 1
+            yield {"id": title, "title": title, "text": f"{title} metni"}
+
+    def iter_scrape(self, limit=100):
+        yield from self.iter_tracked(self._fetch, limit)
+
+
+def _state_config(directory, **overrides):
+    state = {"enabled": True, "directory": str(directory), "expected_items": 1000}
+    state.update(overrides)
+    return {"name": "liste", "state": state}
+
+
+class TestBloomFilter:
+    """BloomFilter sınıfı için testler"""
+
+    def test_membership_and_persistence(self, tmp_path):
+        """Eklenen anahtarlar kaydedilip yüklendikten sonra da bulunmalı"""
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        keys = [f"Başlık {i}" for i in range(500)]
+        for key in keys:
+            bloom.add(key)
+
+        bloom.save(tmp_path / "seen.bloom")
+        loaded = BloomFilter.load(tmp_path / "seen.bloom")
+
+        assert all(key in loaded for key in keys)
+        false_positives = sum(f"Yok {i}" in loaded for i in range(1000))
+        assert false_positives < 50
+
+
+class TestCrawlState:
+    """BaseScraper.iter_tracked için testler"""
+
+    def test_skip_policy(self, tmp_path):
+        """skip politikası görülmüş başlıkları atlamalı"""
+        config = _state_config(tmp_path, on_collision="skip")
+        scraper = _ListScraper(config, ["a", "b", "a", "c", "b"])
+        records = scraper.scrape(5)
+
+        assert [r["title"] for r in records] == ["a", "b", "c"]
+        assert scraper.fetched == 5
+
+    def test_refetch_policy(self, tmp_path):
+        """refetch politikası tekrar eden başlıkların yerine yenilerini çekmeli"""
+        config = _state_config(tmp_path, on_collision="refetch")
+        scraper = _ListScraper(config, ["a", "b", "a", "c", "b", "d", "e"])
+        records = scraper.scrape(4)
+
+        assert [r["title"] for r in records] == ["a", "b", "c", "d"]
+
+    def test_seen_index_persists_across_runs(self, tmp_path):
+        """Önceki çalıştırmalarda görülen başlıklar tekrar üretilmemeli"""
+        config = _state_config(tmp_path)
+        _ListScraper(config, ["a", "b"]).scrape(2)
+        records = _ListScraper(config, ["a", "b", "c"]).scrape(1)
+
+        assert [r["title"] for r in records] == ["c"]
+
+    def test_resume_after_interruption(self, tmp_path):
+        """Yarıda kesilen tarama kaldığı yerden devam etmeli"""
+        config = _state_config(tmp_path, checkpoint_every=2)
+        titles = [f"sayfa-{i}" for i in range(10)]
+
+        stream = _ListScraper(config, titles).iter_scrape(10)
+        first = list(itertools.islice(stream, 6))
+        stream.close()
+
+        scraper = _ListScraper(config, titles[6:])
+        records = scraper.scrape(10)
+
+        assert [r["title"] for r in records] == titles
+        assert scraper.fetched == 4
+        assert not (tmp_path / "progress.json").exists()
+        assert first == records[:6]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+data4tr - Wikipedia Dump Scraper Test
+Küçük bir multistream dump dosyası üzerinde dump scraper testleri
+"""
+
+import bz2
+from xml.sax.saxutils import escape
+
+import pytest
+from data4tr.scraper.sources.wikidump import WikiDumpScraper, strip_wikitext
+
+_HEADER = '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">\n<siteinfo/>\n'
+_FOOTER = "</mediawiki>\n"
+
+
+def _page(page_id, title, text, ns=0, redirect=False):
+    redirect_tag = f'<redirect title="{escape(text)}" />' if redirect else ""
+    return (
+        f"<page><title>{escape(title)}</title><ns>{ns}</ns><id>{page_id}</id>{redirect_tag}"
+        f"<revision><text>{escape(text)}</text></revision></page>\n"
+    )
+
+
+def _write_dump(directory, blocks):
+    """Her blok ayrı bir bz2 stream'i olacak şekilde dump ve index yaz"""
+    dump_path = directory / "trwiki-test-pages-articles-multistream.xml.bz2"
+    index_path = directory / "trwiki-test-pages-articles-multistream-index.txt.bz2"
+
+    data = bz2.compress(_HEADER.encode("utf-8"))
+    index_lines = []
+    for pages in blocks:
+        offset = len(data)
+        data += bz2.compress("".join(p for _, _, p in pages).encode("utf-8"))
+        index_lines += [f"{offset}:{page_id}:{title}" for page_id, title, _ in pages]
+    data += bz2.compress(_FOOTER.encode("utf-8"))
+
+    dump_path.write_bytes(data)
+    index_path.write_bytes(bz2.compress("\n".join(index_lines).encode("utf-8")))
+    return dump_path, index_path
+
+
+@pytest.fixture
+def dump(tmp_path):
+    """Üç bloklu örnek dump"""
+    blocks = []
+    page_id = 0
+    for b in range(3):
+        pages = []
+        for i in range(4):
+            page_id += 1
+            title = f"Makale {b}-{i}: Deneme"
+            text = (
+                f"'''{title}''' [[Türkiye|Türkiye'de]] bir {{{{Bilgi kutusu|ad=x}}}}örnektir."
+                f"<ref>kaynak</ref>\n\n== Tarihçe ==\nAyrıntılar."
+            )
+            pages.append((page_id, title, _page(page_id, title, text)))
+        page_id += 1
+        pages.append(
+            (page_id, f"Yönlendirme {b}", _page(page_id, f"Yönlendirme {b}", "X", 0, True))
+        )
+        page_id += 1
+        pages.append(
+            (page_id, f"Vikipedi:Proje {b}", _page(page_id, f"Vikipedi:Proje {b}", "Y", 4))
+        )
+        blocks.append(pages)
+
+    return _write_dump(tmp_path, blocks)
+
+
+def _make_config(dump_path, index_path, **dump):
+    config = {
+        "name": "Wikipedia Dump Test",
+        "enabled": True,
+        "dump": {"path": str(dump_path), "index_path": str(index_path), "workers": 2},
+    }
+    config["dump"].update(dump)
+    return config
+
+
+class TestStripWikitext:
+    """strip_wikitext fonksiyonu için testler"""
+
+    def test_markup_removed(self):
+        """Şablon, link, referans ve vurgu işaretleri kaldırılmalı"""
+        text = (
+            "{{Bilgi kutusu|ad={{lang|tr|x}}}}'''Ankara''', [[Türkiye]]'nin "
+            "[[başkent|başkentidir]].<ref name=a>kaynak</ref> [https://example.com site]"
+            "<!-- yorum -->[[Dosya:Ankara.jpg|küçük|[[Kale]]]]"
+        )
+        assert strip_wikitext(text) == "Ankara, Türkiye'nin başkentidir. site"
+
+    def test_intro_only(self):
+        """intro_only ilk başlıktan sonrasını atmalı"""
+        text = "Giriş.\n\n== Tarihçe ==\nAyrıntı.\n* madde"
+        assert strip_wikitext(text, intro_only=True) == "Giriş."
+        assert strip_wikitext(text) == "Giriş.\n\nTarihçe\nAyrıntı.\nmadde"
+
+
+class TestWikiDumpScraper:
+    """WikiDumpScraper sınıfı için testler"""
+
+    def test_block_offsets(self, dump):
+        """Index'teki her farklı offset bir blok olmalı"""
+        scraper = WikiDumpScraper(_make_config(*dump))
+        blocks = scraper.read_block_offsets()
+
+        assert len(blocks) == 3
+        assert blocks[0][1] == blocks[1][0]
+        assert blocks[-1][1] == -1
+
+    def test_scrape_all(self, dump):
+        """Tüm makaleler dump sırasıyla ve WikipediaScraper şemasıyla üretilmeli"""
+        scraper = WikiDumpScraper(_make_config(*dump))
+        articles = scraper.scrape(limit=0)
+
+        assert [a["title"] for a in articles] == [
+            f"Makale {b}-{i}: Deneme" for b in range(3) for i in range(4)
+        ]
+        article = articles[0]
+        assert set(article) == {"id", "source", "url", "title", "text", "timestamp"}
+        assert article["source"] == "wikipedia"
+        assert article["url"] == "https://tr.wikipedia.org/wiki/Makale_0-0%3A_Deneme"
+        assert article["text"] == "Makale 0-0: Deneme Türkiye'de bir örnektir."
+
+    def test_limit(self, dump):
+        """limit kadar kayıt üretilmeli"""
+        scraper = WikiDumpScraper(_make_config(*dump, workers=1))
+        assert len(scraper.scrape(limit=5)) == 5
+
+    def test_missing_dump(self, tmp_path):
+        """Dump dosyası yoksa konfigürasyon geçersiz olmalı"""
+        scraper = WikiDumpScraper(_make_config(tmp_path / "yok.xml.bz2", tmp_path / "yok.txt.bz2"))
+        assert not scraper.validate_config()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
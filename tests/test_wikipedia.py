@@ -0,0 +1,352 @@
+"""
+data4tr - Wikipedia Scraper Test
+Yerel bir HTTP sunucusuna karşı Wikipedia scraper testleri
+"""
+
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from data4tr.exporter.export_jsonl import JSONLExporter
+from data4tr.scraper.base import BaseScraper, TokenBucket
+from data4tr.scraper.mockserver import MockWikipediaServer
+from data4tr.scraper.sources.wikipedia import (
+    WikipediaScraper,
+    partition_title_space,
+    title_key,
+)
+
+
+class _SummaryHandler(BaseHTTPRequestHandler):
+    """/page/random/summary ve /w/api.php şeklini taklit eden handler"""
+
+    latency = 0.05
+    counter = 0
+    batches = 0
+    action_requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        if self.path.startswith("/w/api.php"):
+            return self._action_api()
+
+        with self.lock:
+            type(self).counter += 1
+            n = type(self).counter
+        time.sleep(self.latency)
+
+        title = f"Sayfa {n}"
+        body = json.dumps(
+            {
+                "title": title,
+                "extract": f"{title} hakkında örnek bir özet metnidir.",
+                "content_urls": {"desktop": {"page": f"https://tr.wikipedia.org/wiki/{n}"}},
+            }
+        ).encode("utf-8")
+
+        self._send_json(body)
+
+    def _action_api(self):
+        """generator=random + prop=extracts; özetlerin yarısı excontinue ile gelir"""
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        limit = int(params["grnlimit"])
+        half = limit // 2
+
+        with self.lock:
+            type(self).action_requests += 1
+            if "excontinue" in params:
+                batch = int(params["grncontinue"])
+            else:
+                type(self).batches += 1
+                batch = type(self).batches
+
+        offset = int(params.get("excontinue", 0))
+        pages = []
+        for i in range(limit):
+            page = {
+                "pageid": batch * 1000 + i,
+                "ns": 0,
+                "title": f"Toplu {batch}-{i}",
+                "fullurl": f"https://tr.wikipedia.org/wiki/Toplu_{batch}_{i}",
+            }
+            if (offset == 0 and i < half) or (offset and i >= offset):
+                page["extract"] = f"Toplu {batch}-{i} sayfasının özeti."
+            pages.append(page)
+
+        if offset == 0:
+            cont = {"excontinue": half, "grncontinue": str(batch), "continue": "grncontinue||"}
+        else:
+            cont = {"grncontinue": str(batch + 1), "continue": "grncontinue||"}
+
+        self._send_json(json.dumps({"continue": cont, "query": {"pages": pages}}).encode("utf-8"))
+
+    def _send_json(self, body):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Arka planda çalışan yerel sunucu"""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SummaryHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _make_config(base_url, api=None, **rate_limit):
+    config = {
+        "name": "Wikipedia Test",
+        "enabled": True,
+        "api": {
+            "base_url": base_url,
+            "random_page": "/page/random/summary",
+            "action_api": f"{base_url}/w/api.php",
+            "timeout": 5,
+        },
+        "rate_limit": rate_limit,
+    }
+    config["api"].update(api or {})
+    return config
+
+
+class TestTokenBucket:
+    """TokenBucket sınıfı için testler"""
+
+    def test_rate_is_enforced(self):
+        """Token bucket istek hızını sınırlamalı"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.15
+
+    def test_unlimited_rate(self):
+        """rate <= 0 ise beklememeli"""
+        bucket = TokenBucket(rate=0)
+        start = time.monotonic()
+        for _ in range(100):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.1
+
+
+class TestWikipediaScraper:
+    """WikipediaScraper sınıfı için testler"""
+
+    def test_sequential_scrape(self, server):
+        """Sıralı mod kayıt şemasını korumalı"""
+        scraper = WikipediaScraper(_make_config(server, delay_between_requests=0))
+        articles = scraper.scrape(limit=3)
+
+        assert len(articles) == 3
+        for article in articles:
+            assert set(article) == {"id", "source", "url", "title", "text", "timestamp"}
+            assert article["source"] == "wikipedia"
+
+    def test_concurrent_scrape(self, server):
+        """Eşzamanlı mod istekleri paralel göndermeli"""
+        scraper = WikipediaScraper(_make_config(server, requests_per_second=0, max_concurrency=10))
+        start = time.monotonic()
+        articles = scraper.scrape(limit=20)
+        elapsed = time.monotonic() - start
+
+        assert len(articles) == 20
+        assert len({a["title"] for a in articles}) == 20
+        # Sıralı olarak 20 * 0.05 = 1 saniye sürerdi
+        assert elapsed < 0.8
+
+    def test_batch_scrape(self, server):
+        """Toplu mod continue nesnesini takip etmeli ve aynı şemayı üretmeli"""
+        _SummaryHandler.action_requests = 0
+        scraper = WikipediaScraper(
+            _make_config(
+                server, api={"fetch_mode": "batch", "batch_size": 20}, requests_per_second=0
+            )
+        )
+        articles = scraper.scrape(limit=50)
+
+        assert len(articles) == 50
+        assert len({a["title"] for a in articles}) == 50
+        assert all(a["text"] and a["url"] for a in articles)
+        assert set(articles[0]) == {"id", "source", "url", "title", "text", "timestamp"}
+        # Her grup 2 istekte gelir (10 + 10 özet); 50. sayfa 3. grubun ilk isteğinde
+        assert _SummaryHandler.action_requests == 5
+
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def test_iter_scrape_is_lazy(self, server, max_concurrency):
+        """iter_scrape kayıtları geldikçe üretmeli, tüm limit'i beklememeli"""
+        scraper = WikipediaScraper(
+            _make_config(
+                server,
+                requests_per_second=0,
+                delay_between_requests=0,
+                max_concurrency=max_concurrency,
+            )
+        )
+        before = _SummaryHandler.counter
+        stream = scraper.iter_scrape(limit=1000)
+        first = list(itertools.islice(stream, 3))
+        stream.close()
+
+        assert len(first) == 3
+        # Kuyruk sınırı ve uçuştaki istekler dışında fazladan istek yapılmamalı
+        assert _SummaryHandler.counter - before <= 3 + 3 * max_concurrency
+
+
+class TestEnumeration:
+    """Başlık aralıklarıyla tam tarama (enumerate modu) için testler"""
+
+    @pytest.fixture
+    def mock(self):
+        with MockWikipediaServer(pages=300, seed=2) as server:
+            yield server
+
+    def _scraper(self, mock, checkpoint_dir=None, **api):
+        config = _make_config(
+            mock.url,
+            api={"fetch_mode": "enumerate", "batch_size": 30, **api},
+            requests_per_second=0,
+        )
+        if checkpoint_dir:
+            config["enumeration"] = {"checkpoint_dir": str(checkpoint_dir)}
+        return WikipediaScraper(config)
+
+    def test_partition_title_space(self):
+        """Aralıklar sıralı, bitişik ve uçları açık olmalı"""
+        ranges = partition_title_space(4)
+
+        assert len(ranges) == 4
+        assert ranges[0][0] is None and ranges[-1][1] is None
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+        assert [title_key(end) for _, end in ranges[:-1]] == sorted(
+            title_key(end) for _, end in ranges[:-1]
+        )
+
+    def test_partitions_cover_all_pages_once(self, mock):
+        """Aralıklar tüm sayfaları örtüşmeden kapsamalı, her istek yeni sayfa getirmeli"""
+        titles = []
+        for title_from, title_to in partition_title_space(5):
+            scraper = self._scraper(mock, title_from=title_from, title_to=title_to)
+            titles += [a["title"] for a in scraper.scrape(limit=0)]
+
+        assert len(titles) == 300
+        assert set(titles) == {mock.title(i) for i in range(300)}
+        # 30'luk gruplar, grup başına 2 istek (20 + 10 özet), aralık başına en az 1 istek
+        assert mock.stats["requests"] <= 2 * (300 // 30 + 5)
+
+    def test_range_checkpoint_resume(self, mock, tmp_path):
+        """Yarıda kesilen aralık kaldığı yerden devam etmeli, tamamlanan aralık atlanmalı"""
+        first = self._scraper(mock, tmp_path).scrape(limit=45)
+        second = self._scraper(mock, tmp_path).scrape(limit=0)
+        third = self._scraper(mock, tmp_path).scrape(limit=0)
+
+        titles = [a["title"] for a in first + second]
+        assert len(first) == 45
+        assert len(titles) == len(set(titles)) == 300
+        assert third == []
+
+
+class TestRefresh:
+    """Son değişikliklerle artımlı güncelleme (refresh modu) için testler"""
+
+    def test_refresh_applies_changes(self, tmp_path):
+        """Düzenlenen, silinen ve taşınan sayfalar veri setine yansımalı"""
+        with MockWikipediaServer(pages=60, seed=5) as mock:
+            config = _make_config(
+                mock.url, api={"fetch_mode": "enumerate", "batch_size": 20}, requests_per_second=0
+            )
+            config["enumeration"] = {"checkpoint_dir": str(tmp_path / "ranges")}
+            config["refresh"] = {"state_file": str(tmp_path / "refresh.json")}
+            exporter = JSONLExporter(str(tmp_path))
+            exporter.export(WikipediaScraper(config).scrape(limit=0))
+
+            mock.edit(3)
+            mock.edit(5)
+            mock.delete(7)
+            mock.move(9, "Yeni Başlık")
+
+            config["api"]["fetch_mode"] = "refresh"
+            records = WikipediaScraper(config).scrape(limit=0)
+            stats = exporter.upsert(records)
+            again = WikipediaScraper(config).scrape(limit=0)
+
+            with open(tmp_path / "dataset.jsonl", encoding="utf-8") as f:
+                dataset = {r["title"]: r for r in map(json.loads, f)}
+            expected = {i: mock.page(i)["extract"] for i in (3, 5, 9)}
+
+        assert stats == {"inserted": 1, "updated": 2, "deleted": 2, "unchanged": 56}
+        assert len(dataset) == 59
+        assert dataset[mock.title(3)]["text"] == expected[3]
+        assert dataset[mock.title(5)]["text"] == expected[5]
+        assert dataset["Yeni Başlık"]["text"] == expected[9]
+        assert again == []
+
+    def test_failed_fetch_keeps_watermark(self, tmp_path):
+        """Çekilemeyen değişiklikler kaybolmamalı, özeti kalmayan sayfa silinmeli"""
+        with MockWikipediaServer(pages=30, seed=6) as mock:
+            config = _make_config(
+                mock.url, api={"fetch_mode": "refresh", "batch_size": 20}, requests_per_second=0
+            )
+            config["refresh"] = {"state_file": str(tmp_path / "refresh.json")}
+            config["retry"] = {"max_retries": 0}
+            mock.edit(4)
+            mock.edit(6)
+
+            titles_query = mock.titles_query
+            mock.titles_query = lambda params: {"error": "bozuk yanıt"}["yok"]
+            failed = WikipediaScraper(config).scrape(limit=0)
+
+            mock.titles_query = titles_query
+            page = mock.page
+            mock.page = lambda index: {**page(index), "extract": ""} if index == 6 else page(index)
+            recovered = WikipediaScraper(config).scrape(limit=0)
+            again = WikipediaScraper(config).scrape(limit=0)
+
+        assert failed == []
+        assert [r["title"] for r in recovered] == [mock.title(4), mock.title(6)]
+        assert recovered[0]["text"] == mock.page(4)["extract"]
+        assert recovered[1]["deleted"] is True
+        assert again == []
+
+
+class TestBaseScraper:
+    """BaseScraper streaming sözleşmesi için testler"""
+
+    def test_scrape_wraps_iter_scrape(self):
+        """Sadece iter_scrape implement eden scraper scrape ile liste döndürmeli"""
+
+        class CountingScraper(BaseScraper):
+            def validate_config(self):
+                return True
+
+            def iter_scrape(self, limit=100):
+                for i in range(limit):
+                    yield {"id": str(i), "text": f"metin {i}"}
+
+        scraper = CountingScraper({"name": "counting"})
+        assert [r["id"] for r in scraper.scrape(3)] == ["0", "1", "2"]
+
+    def test_missing_implementation(self):
+        """iter_scrape ve scrape implement edilmemişse hata vermeli"""
+        with pytest.raises(TypeError):
+
+            class EmptyScraper(BaseScraper):
+                def validate_config(self):
+                    return True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])